@@ -0,0 +1,319 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import sys
+import time
+
+BOARD_SIZES = [20, 256, 1024, 4096]
+FLEA_COUNTS = [1, 100, 10000, 100000]
+RENDER_FREQUENCIES = [-1, 100]
+
+# Maximum number of steps between checks of the time limit
+MAX_BATCH_STEPS = 1000
+
+def peak_memory():
+    """Gets the peak resident memory of the current process.
+
+    Returns:
+        The peak resident memory in megabytes
+        (None if it cannot be determined on this platform).
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return max_rss / 2**20
+
+    return max_rss / 2**10
+
+def run_case(flea_name, size, num_fleas, render_frequency, steps, max_time, storage='auto', seed=0):
+    """Runs a single benchmark case in the current process.
+
+    Arguments:
+        flea_name(str): The name of the class of Flea to simulate.
+        size(int): The number of rows and columns of the board.
+        num_fleas(int): The number of Fleas to simulate.
+        render_frequency(int): How many steps between each draw of the board.
+            -1 to run headless.
+        steps(int): The maximum number of steps to simulate.
+        max_time(float): The maximum number of seconds to spend stepping.
+        storage(str): How to store the colors of the squares.
+        seed(int): The random seed used to place the fleas.
+
+    Returns:
+        A dictionary with the timing and memory results of the case.
+    """
+
+    start = time.perf_counter()
+
+    random.seed(seed)
+
+    # Imports are part of startup, and headless
+    # cases should never need to import pygame
+    if render_frequency != -1:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        import pygame
+        from display import Display
+
+    from board import Board
+    from constants import MARGIN_TOP, MARGIN_SIDE, set_width, set_height
+    from flea import get_flea
+
+    import_time = time.perf_counter() - start
+
+    # Keep the window at a reasonable size for large boards
+    cell_size = max(1, 800 // size)
+    set_width(cell_size)
+    set_height(cell_size)
+
+    # Spread the fleas over the board, with the first in the center
+    flea_rows = [None] + [random.randrange(size) for _ in range(num_fleas - 1)]
+    flea_cols = [None] + [random.randrange(size) for _ in range(num_fleas - 1)]
+
+    board = Board(size,
+                  size,
+                  get_flea(flea_name),
+                  num_fleas,
+                  flea_rows,
+                  flea_cols,
+                  ['up'],
+                  None,
+                  storage)
+
+    if render_frequency != -1:
+        pygame.init()
+        screen = pygame.display.set_mode((size * cell_size + MARGIN_SIDE,
+                                          size * cell_size + MARGIN_TOP + MARGIN_SIDE))
+        display = Display(screen, board, hide_grid=True)
+
+    # Compile the stepping kernel (if numba is installed) as part of startup
+    board.run(0)
+
+    startup_time = time.perf_counter() - start
+
+    # Simulate in batches between draws, checking the time after each batch
+    step = 0
+    stepping_start = time.perf_counter()
+    deadline = stepping_start + max_time
+    while step < steps and time.perf_counter() < deadline:
+        if render_frequency != -1 and step % render_frequency == 0:
+            display.draw()
+
+        batch = MAX_BATCH_STEPS if render_frequency == -1 else render_frequency - step % render_frequency
+        batch = min(batch, steps - step)
+        num_steps = board.run(batch)
+
+        step += num_steps
+        if num_steps < batch:
+            break
+    elapsed = time.perf_counter() - stepping_start
+
+    return {
+        'status': 'ok',
+        'steps': step,
+        'elapsed': elapsed,
+        'steps_per_second': step / elapsed if elapsed > 0 else None,
+        'import_time': import_time,
+        'startup_time': startup_time,
+        'peak_memory_mb': peak_memory()
+    }
+
+def case_worker(result_queue, case, steps, max_time, storage, memory_limit):
+    """Runs a benchmark case in a child process and puts the result on a queue.
+
+    Arguments:
+        result_queue(Queue): The queue on which to put the result.
+        case(dict): The parameters of the case.
+        steps(int): The maximum number of steps to simulate.
+        max_time(float): The maximum number of seconds to spend stepping.
+        storage(str): How to store the colors of the squares.
+        memory_limit(float): The maximum memory (in gigabytes) the case may use.
+            (None for no limit.)
+    """
+
+    if memory_limit is not None:
+        import resource
+        limit = int(memory_limit * 2**30)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    try:
+        result = run_case(steps=steps, max_time=max_time, storage=storage, **case)
+    except MemoryError:
+        result = {'status': 'out of memory'}
+    except Exception as e:
+        result = {'status': 'error: {}'.format(e)}
+
+    result_queue.put(result)
+
+def run_benchmark(flea_names, sizes, flea_counts, render_frequencies, steps, max_time, timeout, storage, memory_limit):
+    """Runs every combination of benchmark parameters, each in a fresh process.
+
+    Arguments:
+        flea_names(list): The names of the Flea classes to benchmark.
+        sizes(list): The board sizes (number of rows and columns) to benchmark.
+        flea_counts(list): The numbers of Fleas to benchmark.
+        render_frequencies(list): The render frequencies to benchmark (-1 for headless).
+        steps(int): The maximum number of steps to simulate per case.
+        max_time(float): The maximum number of seconds to spend stepping per case.
+        timeout(float): The number of seconds after which a case is killed.
+        storage(str): How to store the colors of the squares.
+        memory_limit(float): The maximum memory (in gigabytes) a case may use.
+
+    Returns:
+        A list of dictionaries containing the parameters and results of each case.
+    """
+
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    for flea_name in flea_names:
+        for size in sizes:
+            for num_fleas in flea_counts:
+                for render_frequency in render_frequencies:
+                    case = {
+                        'flea_name': flea_name,
+                        'size': size,
+                        'num_fleas': num_fleas,
+                        'render_frequency': render_frequency
+                    }
+
+                    result_queue = context.Queue()
+                    process = context.Process(target=case_worker,
+                                              args=(result_queue, case, steps, max_time, storage, memory_limit))
+                    process.start()
+
+                    try:
+                        result = result_queue.get(timeout=timeout)
+                    except queue.Empty:
+                        result = {'status': 'timeout'}
+                        process.kill()
+                    process.join()
+
+                    if process.exitcode not in (0, None) and result['status'] == 'ok':
+                        result['status'] = 'crashed'
+
+                    result = dict(case, **result)
+                    results.append(result)
+                    print(format_result(result))
+
+    return results
+
+def case_key(result):
+    """Gets a hashable key identifying the parameters of a case.
+
+    Arguments:
+        result(dict): A benchmark result.
+
+    Returns:
+        A tuple of the parameters of the case.
+    """
+
+    return (result['flea_name'], result['size'], result['num_fleas'], result['render_frequency'])
+
+def format_result(result, baseline_result=None):
+    """Formats a benchmark result as a line of text.
+
+    Arguments:
+        result(dict): A benchmark result.
+        baseline_result(dict): The baseline result of the same case (None if there is none).
+
+    Returns:
+        A string describing the result.
+    """
+
+    mode = 'headless' if result['render_frequency'] == -1 else 'render/{}'.format(result['render_frequency'])
+    message = '{:<16} {:>5}x{:<5} fleas={:<7} {:<12}'.format(result['flea_name'],
+                                                               result['size'],
+                                                               result['size'],
+                                                               result['num_fleas'],
+                                                               mode)
+
+    if result['status'] != 'ok':
+        return '{} {}'.format(message, result['status'])
+
+    message += ' {:>12.1f} steps/s  startup {:6.3f}s'.format(result['steps_per_second'] or 0,
+                                                             result['startup_time'])
+    if result['peak_memory_mb'] is not None:
+        message += '  peak {:8.1f} MB'.format(result['peak_memory_mb'])
+
+    if baseline_result is not None and baseline_result.get('status') == 'ok' and baseline_result['steps_per_second']:
+        message += '  ({:.2f}x baseline)'.format(result['steps_per_second'] / baseline_result['steps_per_second'])
+
+    return message
+
+def compare(results, baseline):
+    """Prints each result alongside the matching baseline result.
+
+    Arguments:
+        results(list): The benchmark results.
+        baseline(dict): The contents of a baseline JSON file.
+    """
+
+    baseline_results = {case_key(result): result for result in baseline['results']}
+
+    print('Comparison against baseline')
+    for result in results:
+        print(format_result(result, baseline_results.get(case_key(result))))
+
+if __name__ == '__main__':
+    from flea import FLEA_CLASSES
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--flea_names', type=str, nargs='+', default=list(FLEA_CLASSES.keys()), help='Names of the classes of Flea to benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=BOARD_SIZES, help='Numbers of rows and columns of the boards')
+    parser.add_argument('--flea_counts', type=str, nargs='+', default=[str(count) for count in FLEA_COUNTS], help='Numbers of fleas (may be in scientific notation)')
+    parser.add_argument('--render_frequencies', type=str, nargs='+', default=[str(frequency) for frequency in RENDER_FREQUENCIES], help='Steps between each draw of the board (-1 for headless; may be in scientific notation)')
+    parser.add_argument('--steps', type=str, default='1e4', help='Maximum number of steps per case (may be in scientific notation)')
+    parser.add_argument('--max_time', type=float, default=10, help='Maximum number of seconds spent stepping per case')
+    parser.add_argument('--timeout', type=float, default=120, help='Number of seconds after which a case is killed')
+    parser.add_argument('--storage', type=str, default='auto', help='How to store the colors of the squares ("auto", "array", "bits", or "memmap")')
+    parser.add_argument('--memory_limit', type=float, default=None, help='Maximum memory (in gigabytes) each case may use')
+    parser.add_argument('--output', type=str, default=None, help='Path to JSON file where results will be saved')
+    parser.add_argument('--baseline', type=str, default=None, help='Path to JSON file with baseline results to compare against (saved with --output by an earlier run)')
+    args = parser.parse_args()
+
+    # Convert to float then int to allow for scientific notation
+    args.flea_counts = [int(float(count)) for count in args.flea_counts]
+    args.render_frequencies = [int(float(frequency)) for frequency in args.render_frequencies]
+    args.steps = int(float(args.steps))
+
+    results = run_benchmark(args.flea_names,
+                            args.sizes,
+                            args.flea_counts,
+                            args.render_frequencies,
+                            args.steps,
+                            args.max_time,
+                            args.timeout,
+                            args.storage,
+                            args.memory_limit)
+
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            json.dump({
+                'metadata': {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'processor': platform.processor(),
+                    'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'steps': args.steps,
+                    'storage': args.storage,
+                    'max_time': args.max_time
+                },
+                'results': results
+            }, output_file, indent=4)
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+
+        compare(results, baseline)
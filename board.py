@@ -1,14 +1,34 @@
-import pygame
+import numpy as np
 import random
-from constants import COLOR_MAP
-from helpers import row_column_to_pixels
+from constants import ROW_DELTAS, COL_DELTAS, NEXT_DIRECTIONS, STOP, STRAIGHT
+from flea import FleaStore
+from history import History
 from square import Square
+from stats import BoardStats
+from storage import make_storage
+
+# Number of squares of a straight run read one at a time before
+# reading the rest in chunks (see Board.skip_straight_run)
+STRAIGHT_RUN_CHUNK = 16
 
 class Board:
-    """A Board contains, controls, and displays all Squares and Fleas in the simulation."""
+    """A Board contains and controls all Squares and Fleas in the simulation.
+
+    The color of every Square is stored in a single storage (one small
+    integer per Square, or one bit per Square for two-color Boards) and
+    the color transitions are stored once per Board in a table indexed
+    by color. Square objects are views created on demand.
+
+    Fleas which are table-driven (see Flea.is_table_driven) are
+    rotated with array lookups instead of calls to rotate, and
+    Board.run steps them with a compiled kernel when numba is
+    installed.
+
+    The Board does not depend on pygame, so it can be simulated
+    headless. It is drawn by the Display.
+    """
 
     def __init__(self,
-                 screen,
                  num_rows,
                  num_cols,
                  flea_class,
@@ -17,14 +37,11 @@ class Board:
                  flea_cols,
                  init_directions,
                  square_colors,
-                 image,
-                 visited,
-                 coordinates,
-                 hide_grid):
+                 storage='auto',
+                 storage_path=None):
         """Initializes the Board.
 
         Arguments:
-            screen(Surface): A pygame Surface representing the screen display.
             num_rows(int): The number of rows in the Board.
             num_cols(int): The number of columns in the Board.
             flea_class(class): The class of the Fleas to create.
@@ -38,57 +55,72 @@ class Board:
             init_directions(list): The initial directions of the fleas.
                 (Uspecified fleas will start facing up.)
             square_colors(list): Initial configuration of the colors of the squares.
-                (list of list of ints representing square colors.)
+                (list of list of ints or 2D array representing square colors.)
                 If None, all squares are initialized to color 0.
-            image(str): Name of image file in images directory to use as the flea image.
-            visited(bool): True to add an X to indicate which squares have been visited.
-            coordinates(bool): True to add coordinates to squares.
-            hide_grid(bool): True to hide the grid lines.
+            storage(str): How to store the colors of the squares: "array" for
+                one small integer per square, "bits" for one bit per square
+                (two-color boards only), "memmap" for a memory-mapped file
+                (for boards larger than memory), or "auto" to use bits for
+                two-color boards and arrays otherwise.
+            storage_path(str): Path to the file backing memmap storage,
+                which must not already exist.
+                (None to use a temporary file.)
         """
 
-        self.screen = screen
         self.num_rows = num_rows
         self.num_cols = num_cols
         self.flea_class = flea_class
         self.num_fleas = num_fleas
         self.flea_rows, self.flea_cols = self.initialize_flea_locs(flea_rows, flea_cols)
         self.init_directions = self.initialize_flea_directions(init_directions)
-        self.square_colors = self.initialize_square_colors(square_colors)
-        self.image = image
-        self.visited = visited
-        self.coordinates = coordinates
-        self.hide_grid = hide_grid
-
-        self.squares = pygame.sprite.Group()
-        self.board = []
-
-        # Initialize squares on board
-        for row in range(self.num_rows):
-            row_squares = []
-
-            for col in range(self.num_cols):
-                square = Square(self,
-                                row,
-                                col,
-                                self.flea_class.num_colors,
-                                self.square_colors[row][col],
-                                self.flea_class.cycle_size,
-                                self.flea_class.color_map,
-                                self.visited,
-                                self.coordinates)
-                self.squares.add(square)
-                row_squares.append(square)
-
-            self.board.append(row_squares)
+        self.num_colors = self.flea_class.num_colors
+        self.storage = make_storage(storage,
+                                    self.num_rows,
+                                    self.num_cols,
+                                    self.num_colors,
+                                    square_colors,
+                                    storage_path)
+        self.transitions = self.initialize_transitions()
+
+        # Avoid touching (or paging in) the whole board when it starts empty
+        if square_colors is None:
+            color_counts = np.zeros(self.num_colors, dtype=np.int64)
+            color_counts[0] = self.num_rows * self.num_cols
+        else:
+            color_counts = self.storage.count_colors(self.num_colors)
+
+        self.stats = BoardStats(self.num_rows,
+                                self.num_cols,
+                                self.num_colors,
+                                color_counts)
 
         # Initialize fleas (first is centered, others are random)
-        self.fleas = pygame.sprite.Group()
-        for i in range(self.num_fleas):
-            self.fleas.add(self.flea_class(self,
-                                           self.flea_rows[i],
-                                           self.flea_cols[i],
-                                           self.init_directions[i],
-                                           self.image))
+        self.flea_store = FleaStore(self.flea_rows[:self.num_fleas],
+                                    self.flea_cols[:self.num_fleas],
+                                    self.init_directions[:self.num_fleas])
+        self.fleas = [self.flea_class(self, i) for i in range(self.num_fleas)]
+
+        # Move deltas indexed by direction for moving all fleas at once
+        self.row_deltas = np.array(ROW_DELTAS, dtype=np.int32)
+        self.col_deltas = np.array(COL_DELTAS, dtype=np.int32)
+
+        # Turn tables for rotating table-driven fleas without calling rotate
+        self.table_driven = self.flea_class.is_table_driven()
+        if self.table_driven:
+            self.turns = np.array(self.flea_class.turns, dtype=np.int8)
+            self.next_directions = np.array(NEXT_DIRECTIONS, dtype=np.int8)
+
+        # Whether run may cross runs of straight colors in one operation
+        # (see skip_straight_run). Consumers which need to see every
+        # step should turn this off.
+        self.straight_runs = self.table_driven and self.num_fleas == 1
+
+        # Recent steps which can be undone (see enable_history)
+        self.history = None
+
+        # Records every change to the Board so that it can be replayed
+        # (set to a recording.Recorder to start recording)
+        self.recorder = None
 
     def initialize_flea_locs(self, flea_rows, flea_cols):
         """Determines the initial rows and columns of the fleas.
@@ -137,23 +169,36 @@ class Board:
 
         return init_directions
 
-    def initialize_square_colors(self, square_colors):
-        """Determine the initial square colors.
+    def initialize_transitions(self):
+        """Initializes the table mapping each color to the next color in the sequence.
 
-        Arguments:
-            square_colors(list): Initial configuration of the colors of the squares.
-                (list of list of ints representing square colors.)
-                If None, all squares are initialized to color 0.
+        If the flea class defines color_map, the table follows it.
+        Otherwise it maps each color i to color i+1. Additionally,
+        it maps the last color (color n) to color (n - cycle_size).
+        If the flea class's cycle_size is None, then it maps from
+        color n to color 1 (equivalent to cycle_size = n).
+
+        Ex. n = 5, cycle size = None
+
+        0 --> 1 --> 2 --> 3 --> 4 --> 0
+
+        Ex. n = 5, cycle size = 4
+
+        0 --> 1 --> 2 --> 3 --> 4 --> 1
 
         Returns:
-            A list of lists containing the initial colors of all
-            squares on the board.
+            An array indexed by color containing the next color.
         """
 
-        if square_colors is None:
-            square_colors = [[0] * self.num_cols] * self.num_rows
+        color_map = self.flea_class.color_map
+
+        if color_map is None:
+            cycle_size = self.flea_class.cycle_size if self.flea_class.cycle_size is not None else self.num_colors
+
+            color_map = {i: i+1 for i in range(self.num_colors - 1)}
+            color_map[self.num_colors - 1] = self.num_colors - cycle_size
 
-        return square_colors
+        return np.array([color_map[color] for color in range(self.num_colors)], dtype=self.storage.dtype)
 
     def get_square(self, row, col):
         """Gets the Square in a given row and column.
@@ -163,49 +208,422 @@ class Board:
             col(int): The column number.
 
         Returns:
-            The Square in the provided row and column.
+            A Square viewing the provided row and column.
+        """
+
+        return Square(self, row, col)
+
+    def get_color(self, row, col):
+        """Gets the color of the Square in a given row and column.
+
+        Arguments:
+            row(int): The row number.
+            col(int): The column number.
+
+        Returns:
+            The color of the Square.
+        """
+
+        return self.storage.get(row, col)
+
+    def set_color(self, row, col, color):
+        """Sets the color of the Square in a given row and column.
+
+        Arguments:
+            row(int): The row number.
+            col(int): The column number.
+            color(int): The new color.
+        """
+
+        if self.recorder is not None:
+            self.recorder.begin([row], [col])
+
+        self.stats.change_color(self.storage.get(row, col), color)
+        self.storage.set(row, col, color)
+
+        if self.recorder is not None:
+            self.recorder.end(0)
+
+    def get_colors(self):
+        """Gets the colors of all Squares.
+
+        Returns:
+            A 2D array of colors. It is the live array for array storage
+            and an unpacked copy for bit storage.
+        """
+
+        return self.storage.to_array()
+
+    def snapshot(self, path):
+        """Saves the colors of all Squares to a .npy file.
+
+        The file can be used as the square_colors of a config.
+
+        Arguments:
+            path(str): The path to the .npy file.
         """
 
-        return self.board[row][col]
+        self.storage.snapshot(path)
 
     def rotate_fleas(self):
-        """Rotates all Fleas."""
+        """Rotates all Fleas.
+
+        Many table-driven Fleas are rotated at once by looking up
+        the turn for the color under each Flea.
+        """
+
+        store = self.flea_store
+
+        if not self.table_driven or len(store) <= 8:
+            for flea in self.fleas:
+                flea.rotate()
 
-        for flea in self.fleas.sprites():
-            flea.rotate()
+            return
+
+        directions = self.next_directions[store.directions, self.turns[self.storage.get_many(store.rows, store.cols)]]
+        stopping = (directions == STOP) & (store.directions != STOP)
+        store.facings[stopping] = store.directions[stopping]
+        store.directions[:] = directions
 
     def change_square_colors(self):
-        """Changes the color of the Squares under the Fleas."""
+        """Changes the color of the Squares under the Fleas.
+
+        A Square under several Fleas changes color once per Flea.
+        """
+
+        store = self.flea_store
+
+        # Recolor one flea at a time when there are few fleas
+        if len(store) <= 8:
+            storage, transitions, stats = self.storage, self.transitions, self.stats
+
+            for row, col in zip(store.rows.tolist(), store.cols.tolist()):
+                old_color = storage.get(row, col)
+                new_color = transitions[old_color]
+                storage.set(row, col, new_color)
+                stats.change_color(old_color, new_color)
+                stats.visit(row, col)
+
+            return
+
+        # Otherwise recolor all squares under fleas at once. A square under
+        # k fleas takes k transitions, which are applied by binary
+        # decomposition of k using the table composed with itself.
+        locations, counts = np.unique(store.rows.astype(np.int64) * self.num_cols + store.cols, return_counts=True)
+        rows, cols = np.divmod(locations, self.num_cols)
+        old_colors = self.storage.get_many(rows, cols)
+        new_colors = old_colors.copy()
+        transitions = self.transitions
+
+        while True:
+            odd = (counts & 1).astype(bool)
+            new_colors[odd] = transitions[new_colors[odd]]
+            counts >>= 1
 
-        for flea in self.fleas.sprites():
-            flea.square.change_color()
+            if not counts.any():
+                break
+
+            transitions = transitions[transitions]
+
+        self.storage.set_many(rows, cols, new_colors)
+        self.stats.change_colors(old_colors, new_colors)
+        self.stats.visit_all(store.rows, store.cols)
 
     def move_fleas(self):
-        """Moves all Fleas."""
-
-        for flea in self.fleas.sprites():
-            flea.move()
-
-    def draw_grid(self):
-        """Draws a grid of lines to visualize separate the Squares."""
-
-        # Draw horizontal lines
-        for row in range(self.num_rows + 1):
-            left = row_column_to_pixels(row, 0)
-            right = row_column_to_pixels(row, self.num_cols)
-            pygame.draw.line(self.screen, COLOR_MAP['gray'], left, right)
-
-        # Draw vertical lines
-        for col in range(self.num_cols + 1):
-            top = row_column_to_pixels(0, col)
-            bottom = row_column_to_pixels(self.num_rows, col)
-            pygame.draw.line(self.screen, COLOR_MAP['gray'], top, bottom)
-
-    def draw(self):
-        """Draws the Board including the Squares, grid, and Fleas."""
-
-        self.squares.draw(self.screen)
-        if not self.hide_grid:
-            self.draw_grid()
-        self.fleas.draw(self.screen)
-        pygame.display.flip()
+        """Moves all Fleas at once using the arrays in the FleaStore."""
+
+        store = self.flea_store
+
+        store.rows += self.row_deltas[store.directions]
+        store.rows %= self.num_rows
+        store.cols += self.col_deltas[store.directions]
+        store.cols %= self.num_cols
+
+    def enable_history(self, capacity):
+        """Starts recording steps so that recent steps can be undone with undo.
+
+        Arguments:
+            capacity(int): The maximum number of steps to remember.
+
+        Returns:
+            The History recording the steps.
+        """
+
+        self.history = History(self, capacity)
+
+        return self.history
+
+    def undo(self):
+        """Undoes the most recent step recorded in the History.
+
+        Returns:
+            True if a step was undone, False if history is not
+            enabled or no steps are recorded.
+        """
+
+        if self.history is None or len(self.history) == 0:
+            return False
+
+        if self.recorder is not None:
+            self.recorder.begin(*self.history.get_last_squares())
+
+        self.history.undo()
+
+        if self.recorder is not None:
+            self.recorder.end(-1)
+
+        return True
+
+    def step(self):
+        """Takes one step of the simulation: rotates, changes square colors, and moves.
+
+        The step is recorded in the History if history is enabled
+        and by the Recorder if recording.
+        """
+
+        if self.history is not None:
+            self.history.record()
+
+        if self.recorder is not None:
+            self.recorder.begin(self.flea_store.rows, self.flea_store.cols)
+
+        self.rotate_fleas()
+        self.change_square_colors()
+        self.move_fleas()
+
+        if self.recorder is not None:
+            self.recorder.end(1)
+
+    def is_halted(self):
+        """Determines whether the simulation has halted.
+
+        The simulation has halted when every Flea has stopped on a
+        Square whose color does not change, since further steps
+        cannot change the Board. (Fleas are assumed to stay stopped
+        once they stop, as table-driven Fleas do.)
+
+        Returns:
+            True if the simulation has halted.
+        """
+
+        store = self.flea_store
+
+        if not (store.directions == STOP).all():
+            return False
+
+        colors = self.storage.get_many(store.rows, store.cols)
+
+        return bool((self.transitions[colors] == colors).all())
+
+    def run(self, num_steps, breakpoints=None):
+        """Takes several steps of the simulation, stopping early if it halts or hits a breakpoint.
+
+        Table-driven Fleas are stepped by the compiled kernel when
+        numba is installed. Otherwise each step is taken with step,
+        except that a single table-driven Flea crosses runs of squares
+        on which it goes straight in one operation when no breakpoints
+        are watched and history is not enabled. When the Board is being
+        recorded, the steps are taken by the Recorder (see Recorder.run).
+
+        Arguments:
+            num_steps(int): The maximum number of steps to take.
+            breakpoints(Breakpoints): Breakpoints attached to this Board
+                whose watched cells, squares, and colors are checked after
+                each step (None to not check any). Break steps are not checked.
+
+        Returns:
+            The number of steps taken, which is less than num_steps
+            only if the simulation halted (see is_halted) or hit a
+            breakpoint (described by breakpoints.hit).
+        """
+
+        # Forget the previous hit (including a break step) so that it does not end these steps
+        if breakpoints is not None:
+            breakpoints.hit = None
+
+        if self.recorder is not None:
+            return self.recorder.run(num_steps, breakpoints)
+
+        # Only import numba when steps are actually run
+        from kernel import COMPILED, run_steps
+
+        watching = breakpoints is not None and breakpoints.is_watching()
+
+        if not COMPILED or not self.table_driven:
+            step = 0
+            while step < num_steps:
+                if self.is_halted():
+                    return step
+
+                skipping = self.straight_runs and not watching and self.history is None
+                num_skipped = self.skip_straight_run(num_steps - step) if skipping else 0
+
+                if num_skipped == 0:
+                    self.step()
+                    num_skipped = 1
+
+                step += num_skipped
+
+                if watching and breakpoints.check() is not None:
+                    return step
+
+            return step
+
+        store, stats = self.flea_store, self.stats
+        layout, colors, stride = self.storage.get_layout()
+        color_counts = np.array(stats.color_counts, dtype=np.int64)
+        visited_state = np.array([stats.num_visited] + list(stats.bounding_box or (0, 0, 0, 0)), dtype=np.int64)
+        visit_counts = stats.visit_counts.reshape(-1) if stats.visit_counts is not None else np.zeros(0, dtype=np.uint32)
+
+        num_steps = run_steps(num_steps,
+                              self.num_rows,
+                              self.num_cols,
+                              layout,
+                              colors,
+                              stride,
+                              self.transitions,
+                              self.turns,
+                              self.next_directions,
+                              self.row_deltas,
+                              self.col_deltas,
+                              store.rows,
+                              store.cols,
+                              store.directions,
+                              store.facings,
+                              color_counts,
+                              stats.visited.packed.reshape(-1),
+                              stats.visited.packed.shape[1],
+                              visited_state,
+                              visit_counts,
+                              *self.get_watch_arrays(breakpoints if watching else None),
+                              *self.get_history_arrays())
+
+        stats.color_counts = color_counts.tolist()
+        stats.num_visited = int(visited_state[0])
+        if stats.num_visited > 0:
+            stats.min_row, stats.min_col, stats.max_row, stats.max_col = visited_state[1:].tolist()
+
+        if watching:
+            breakpoints.record_hit()
+
+        return num_steps
+
+    def get_watch_arrays(self, breakpoints):
+        """Gets the arrays of watched cells, squares, and colors for the stepping kernel.
+
+        Arguments:
+            breakpoints(Breakpoints): Breakpoints attached to this Board
+                (None to watch nothing).
+
+        Returns:
+            A tuple of the watched cell locations, the rows, columns, and last
+            colors of the watched squares, the mask of watched colors, and the
+            array where hits are recorded.
+        """
+
+        if breakpoints is None:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty, empty.copy(), np.zeros(self.num_colors, dtype=np.uint8), np.zeros(4, dtype=np.int64)
+
+        return (breakpoints.cell_locations,
+                breakpoints.square_rows,
+                breakpoints.square_cols,
+                breakpoints.square_colors,
+                breakpoints.color_mask,
+                breakpoints.hit_state)
+
+    def get_history_arrays(self):
+        """Gets the ring buffer of the History for the stepping kernel.
+
+        Returns:
+            A tuple of the recorded rows, columns, directions, facings,
+            and colors, and the state of the ring buffer (empty arrays
+            if history is not enabled).
+        """
+
+        history = self.history
+
+        if history is None:
+            store = self.flea_store
+            empty_shape = (0, len(store))
+            return (np.zeros(empty_shape, dtype=store.rows.dtype),
+                    np.zeros(empty_shape, dtype=store.cols.dtype),
+                    np.zeros(empty_shape, dtype=store.directions.dtype),
+                    np.zeros(empty_shape, dtype=store.facings.dtype),
+                    np.zeros(empty_shape, dtype=self.storage.dtype),
+                    np.zeros(2, dtype=np.int64))
+
+        return history.rows, history.cols, history.directions, history.facings, history.colors, history.state
+
+    def skip_straight_run(self, max_steps):
+        """Takes all the steps of a single Flea across a run of squares on which it goes straight.
+
+        Starting from the Flea's square, the squares ahead of it are
+        read for as long as their colors make the Flea go straight,
+        first one at a time (since most runs are short) and then in
+        growing chunks which change color at once. The Flea then moves
+        to the end of the run. The run is at most one row or column
+        long, so no square in it is visited twice.
+
+        Arguments:
+            max_steps(int): The maximum number of steps to take.
+
+        Returns:
+            The number of steps taken (0 if the Flea does not go straight
+            on its current square).
+        """
+
+        store, storage, stats, turns, transitions = self.flea_store, self.storage, self.stats, self.turns, self.transitions
+        row, col, direction = int(store.rows[0]), int(store.cols[0]), int(store.directions[0])
+
+        if direction == STOP:
+            return 0
+
+        row_delta, col_delta = ROW_DELTAS[direction], COL_DELTAS[direction]
+        limit = min(max_steps, self.num_cols if row_delta == 0 else self.num_rows)
+
+        num_steps = 0
+        next_row, next_col = row, col
+        while num_steps < min(limit, STRAIGHT_RUN_CHUNK):
+            old_color = storage.get(next_row, next_col)
+
+            if turns[old_color] != STRAIGHT:
+                break
+
+            new_color = transitions[old_color]
+            storage.set(next_row, next_col, new_color)
+            stats.change_color(old_color, new_color)
+            stats.visit(next_row, next_col)
+
+            num_steps += 1
+            next_row = (next_row + row_delta) % self.num_rows
+            next_col = (next_col + col_delta) % self.num_cols
+
+        chunk_size = STRAIGHT_RUN_CHUNK
+        while STRAIGHT_RUN_CHUNK <= num_steps < limit:
+            offsets = np.arange(num_steps, min(num_steps + chunk_size, limit))
+            rows = (row + row_delta * offsets) % self.num_rows
+            cols = (col + col_delta * offsets) % self.num_cols
+            old_colors = storage.get_many(rows, cols)
+
+            # Stop at the first square on which the flea turns
+            turning = np.flatnonzero(turns[old_colors] != STRAIGHT)
+            length = turning[0] if len(turning) > 0 else len(offsets)
+
+            rows, cols, old_colors = rows[:length], cols[:length], old_colors[:length]
+            new_colors = transitions[old_colors]
+            storage.set_many(rows, cols, new_colors)
+            stats.change_colors(old_colors, new_colors)
+            stats.visit_all(rows, cols)
+
+            num_steps += length
+            if length < len(offsets):
+                break
+
+            chunk_size *= 2
+
+        if num_steps > 0:
+            store.rows[0] = (row + row_delta * num_steps) % self.num_rows
+            store.cols[0] = (col + col_delta * num_steps) % self.num_cols
+
+        return num_steps
@@ -0,0 +1,198 @@
+import numpy as np
+
+# Kinds of breakpoint hits recorded in Breakpoints.hit_state
+NO_HIT, SQUARE_HIT, CELL_HIT, COLOR_HIT = range(4)
+
+class Breakpoints:
+    """Breakpoints pause the simulation when a condition is met.
+
+    The conditions are:
+        - a flea enters one of the watched cells,
+        - one of the watched squares changes color,
+        - a flea reaches a square of one of the watched colors,
+        - the simulation reaches one of the break steps.
+
+    Watched cells, squares, and colors are checked after every step,
+    either by the check function made by compile or by the compiled
+    stepping kernel, which reads the same arrays. Only the conditions
+    which are set are checked, and when none are set the stepping
+    code does not check anything. Break steps cost nothing per step
+    since steps are simply run in batches which end at them.
+    """
+
+    def __init__(self, cells=(), squares=(), colors=(), steps=()):
+        """Initializes the Breakpoints.
+
+        Arguments:
+            cells(list): (row, col) pairs of cells to break on when a flea enters them.
+            squares(list): (row, col) pairs of squares to break on when they change color.
+            colors(list): Colors to break on when a flea reaches a square of that color.
+            steps(list): Steps to break on when the simulation reaches them.
+        """
+
+        self.cells = [tuple(cell) for cell in cells]
+        self.squares = [tuple(square) for square in squares]
+        self.colors = list(colors)
+        self.steps = sorted(set(steps))
+
+        self.board = None
+        self.hit = None
+
+    def __bool__(self):
+        return bool(self.cells or self.squares or self.colors or self.steps)
+
+    def is_watching(self):
+        """Determines whether any condition must be checked after every step.
+
+        Returns:
+            True if any cells, squares, or colors are watched.
+        """
+
+        return bool(self.cells or self.squares or self.colors)
+
+    def attach(self, board):
+        """Builds the arrays of watched locations and colors for a Board.
+
+        Arguments:
+            board(Board): The Board to watch.
+        """
+
+        self.board = board
+
+        for row, col in self.cells + self.squares:
+            if not (0 <= row < board.num_rows and 0 <= col < board.num_cols):
+                raise Exception('Breakpoint ({},{}) is outside the {}x{} board'.format(row, col, board.num_rows, board.num_cols))
+
+        for color in self.colors:
+            if not 0 <= color < board.num_colors:
+                raise Exception('Break color {} is not one of the {} colors of the board'.format(color, board.num_colors))
+
+        self.cell_locations = np.array([row * board.num_cols + col for row, col in self.cells], dtype=np.int64)
+        self.square_rows = np.array([row for row, _ in self.squares], dtype=np.int64)
+        self.square_cols = np.array([col for _, col in self.squares], dtype=np.int64)
+        self.color_mask = np.zeros(board.num_colors, dtype=np.uint8)
+        self.color_mask[self.colors] = 1
+
+        # The kind of hit followed by its details (see record_hit)
+        self.hit_state = np.zeros(4, dtype=np.int64)
+
+        self.reset()
+        self.check = self.compile()
+
+    def reset(self):
+        """Records the current colors of the watched squares (ex. after they are edited by hand)."""
+
+        self.square_colors = self.board.storage.get_many(self.square_rows, self.square_cols).astype(np.int64)
+
+    def compile(self):
+        """Combines the checks for the conditions which are set into one function.
+
+        Returns:
+            A function which checks the Board after a step and returns
+            a description of the first condition met (None if none are).
+        """
+
+        checks = []
+        if self.squares:
+            checks.append(self.check_squares)
+        if self.cells:
+            checks.append(self.check_cells)
+        if self.colors:
+            checks.append(self.check_colors)
+
+        def check():
+            self.hit = None
+
+            for check_condition in checks:
+                if check_condition():
+                    return self.record_hit()
+
+            return None
+
+        return check
+
+    def check_squares(self):
+        colors = self.board.storage.get_many(self.square_rows, self.square_cols).astype(np.int64)
+        changed = np.flatnonzero(colors != self.square_colors)
+
+        if len(changed) > 0:
+            index = changed[0]
+            self.hit_state[:] = [SQUARE_HIT, index, self.square_colors[index], colors[index]]
+
+        self.square_colors = colors
+
+        return len(changed) > 0
+
+    def check_cells(self):
+        store = self.board.flea_store
+        entered = np.flatnonzero(np.isin(store.rows.astype(np.int64) * self.board.num_cols + store.cols,
+                                         self.cell_locations))
+
+        if len(entered) > 0:
+            self.hit_state[:] = [CELL_HIT, entered[0], store.rows[entered[0]], store.cols[entered[0]]]
+
+        return len(entered) > 0
+
+    def check_colors(self):
+        store = self.board.flea_store
+        colors = self.board.storage.get_many(store.rows, store.cols)
+        reached = np.flatnonzero(self.color_mask[colors])
+
+        if len(reached) > 0:
+            self.hit_state[:] = [COLOR_HIT, reached[0], colors[reached[0]], 0]
+
+        return len(reached) > 0
+
+    def record_hit(self):
+        """Describes the hit recorded in hit_state and clears it.
+
+        Returns:
+            A string describing the hit (None if there was no hit).
+        """
+
+        kind, first, second, third = self.hit_state.tolist()
+        self.hit_state[0] = NO_HIT
+
+        if kind == SQUARE_HIT:
+            row, col = self.squares[first]
+            self.hit = 'Square ({},{}) changed from color {} to color {}'.format(row, col, second, third)
+        elif kind == CELL_HIT:
+            self.hit = 'Flea {} entered cell ({},{})'.format(first, second, third)
+        elif kind == COLOR_HIT:
+            self.hit = 'Flea {} reached color {}'.format(first, second)
+        else:
+            self.hit = None
+
+        return self.hit
+
+    def next_step(self, step):
+        """Gets the next break step after a step.
+
+        Arguments:
+            step(int): The current step.
+
+        Returns:
+            The first break step greater than step (None if there is none).
+        """
+
+        for break_step in self.steps:
+            if break_step > step:
+                return break_step
+
+        return None
+
+    def check_step(self, step):
+        """Checks whether the simulation has reached a break step.
+
+        Arguments:
+            step(int): The current step.
+
+        Returns:
+            A string describing the hit (None if step is not a break step).
+        """
+
+        if step in self.steps:
+            self.hit = 'Reached step {}'.format(step)
+            return self.hit
+
+        return None
@@ -0,0 +1,173 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+import numpy as np
+
+# Increment when the simulation or the format of results changes
+# so that results from older versions are never returned
+CACHE_VERSION = 3
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'graphing_fleas')
+DEFAULT_CACHE_SIZE = 2**30
+
+def describe_flea_class(flea_class):
+    """Describes everything about a Flea class which affects a simulation.
+
+    Arguments:
+        flea_class(class): The class of Flea.
+
+    Returns:
+        A JSON-serializable dictionary describing the class.
+    """
+
+    color_map = flea_class.color_map
+    if color_map is not None:
+        color_map = sorted((int(color), int(next_color)) for color, next_color in color_map.items())
+
+    return {
+        'name': '{}.{}'.format(flea_class.__module__, flea_class.__qualname__),
+        'rule': getattr(flea_class, 'rule', None),
+        'num_colors': flea_class.num_colors,
+        'cycle_size': flea_class.cycle_size,
+        'color_map': color_map,
+        'turns': None if flea_class.turns is None else [int(turn) for turn in flea_class.turns]
+    }
+
+def hash_board(board, num_steps):
+    """Hashes the initial configuration of a Board and the number of steps to simulate.
+
+    The colors are hashed in the layout of the storage (see get_layout),
+    so the same board in different storages has different keys.
+
+    Arguments:
+        board(Board): The Board, before any steps are taken.
+        num_steps(int): The number of steps to simulate.
+
+    Returns:
+        A hexadecimal SHA-256 digest which identifies the simulation.
+    """
+
+    store = board.flea_store
+    layout, colors, stride = board.storage.get_layout()
+    digest = hashlib.sha256()
+
+    digest.update(json.dumps({
+        'version': CACHE_VERSION,
+        'flea_class': describe_flea_class(board.flea_class),
+        'num_rows': board.num_rows,
+        'num_cols': board.num_cols,
+        'num_steps': num_steps,
+        'layout': layout,
+        'stride': stride,
+        'dtype': colors.dtype.str
+    }, sort_keys=True).encode())
+
+    for array in [store.rows, store.cols, store.directions, store.facings]:
+        digest.update(np.ascontiguousarray(array, dtype=np.int64).tobytes())
+
+    # Hash the colors as they are stored, without unpacking or copying them
+    digest.update(colors)
+
+    return digest.hexdigest()
+
+class ResultCache:
+    """A ResultCache stores the results of simulations on disk, keyed by a hash of their configuration.
+
+    Each result is a .npz file named after its key. Reading a result
+    updates its modification time, and when the total size of the cache
+    exceeds its maximum size, the least recently used results are deleted.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_size=DEFAULT_CACHE_SIZE):
+        """Initializes the ResultCache.
+
+        Arguments:
+            directory(str): The directory where results are stored.
+            max_size(int): The maximum total size of the results in bytes.
+        """
+
+        self.directory = directory
+        self.max_size = max_size
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_path(self, key):
+        return os.path.join(self.directory, '{}.npz'.format(key))
+
+    def get(self, key):
+        """Gets a result from the cache.
+
+        Arguments:
+            key(str): The key of the result (see hash_board).
+
+        Returns:
+            A dictionary of arrays with the result (None if it is not in the cache).
+        """
+
+        path = self.get_path(key)
+
+        try:
+            with np.load(path) as result_file:
+                result = {name: result_file[name] for name in result_file.files}
+        except (OSError, ValueError):
+            return None
+
+        # Mark the result as recently used
+        os.utime(path)
+
+        return result
+
+    def put(self, key, result):
+        """Adds a result to the cache and evicts the least recently used results if needed.
+
+        Results larger than the maximum size of the cache are not stored.
+
+        Arguments:
+            key(str): The key of the result (see hash_board).
+            result(dict): A dictionary of arrays with the result.
+        """
+
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **result)
+
+        if buffer.tell() > self.max_size:
+            return
+
+        # Write to a temporary file first so that readers never see a partial result
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as temporary_file:
+            temporary_file.write(buffer.getvalue())
+        os.replace(temporary_path, self.get_path(key))
+
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used results until the cache fits in its maximum size."""
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self):
+        """Deletes all results from the cache."""
+
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(self.directory, name))
@@ -3,19 +3,22 @@ import json
 
 import numpy as np
 
+from cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE
 from constants import set_width, set_height
 from flea import BitFlipperFlea, AddOneFlea, TwosComplementFlea, AdderFlea, AdderFastFlea
-from main import run_simulation
 
 __all__ = ['bit_flip', 'add_one', 'twos_complement', 'add']
 
-def bit_flip(x):
+def bit_flip_setup(x):
     """Sets up a BitFlipperFlea to flip the bits of x.
 
     Square colors
     433...33
     4xx...xx
     422...22
+
+    Returns:
+        A dictionary of the arguments to run_simulation.
     """
 
     num_rows = 3
@@ -27,23 +30,33 @@ def bit_flip(x):
     square_colors[1, 1:] = [int(digit) for digit in x]
     square_colors[2, 1:] = 2
 
-    run_simulation(num_rows=num_rows,
-                   num_cols=num_cols,
-                   flea_class=BitFlipperFlea,
-                   num_fleas=1,
-                   flea_rows=[2],
-                   flea_cols=[-1],
-                   init_directions=['left'],
-                   square_colors=square_colors.tolist(),
-                   delay=100,
-                   pause=True)
+    return dict(num_rows=num_rows,
+                num_cols=num_cols,
+                flea_class=BitFlipperFlea,
+                num_fleas=1,
+                flea_rows=[2],
+                flea_cols=[-1],
+                init_directions=['left'],
+                square_colors=square_colors,
+                delay=100,
+                pause=True)
 
-def add_one(x):
+def bit_flip(x):
+    """Flips the bits of x with a BitFlipperFlea, displaying the computation (see bit_flip_setup)."""
+
+    # Only import pygame once the computation is going to be displayed
+    from main import run_simulation
+    run_simulation(**bit_flip_setup(x))
+
+def add_one_setup(x):
     """Sets up an AddOneFlea to add one to x.
 
     333...33
     0xx...xx
     222...22
+
+    Returns:
+        A dictionary of the arguments to run_simulation.
     """
 
     num_rows = 3
@@ -54,18 +67,25 @@ def add_one(x):
     square_colors[1, 1:] = [int(digit) for digit in x]
     square_colors[2] = 2
 
-    run_simulation(num_rows=num_rows,
-                   num_cols=num_cols,
-                   flea_class=AddOneFlea,
-                   num_fleas=1,
-                   flea_rows=[2],
-                   flea_cols=[-1],
-                   init_directions=['left'],
-                   square_colors=square_colors.tolist(),
-                   delay=100,
-                   pause=True)
+    return dict(num_rows=num_rows,
+                num_cols=num_cols,
+                flea_class=AddOneFlea,
+                num_fleas=1,
+                flea_rows=[2],
+                flea_cols=[-1],
+                init_directions=['left'],
+                square_colors=square_colors,
+                delay=100,
+                pause=True)
 
-def twos_complement(x):
+def add_one(x):
+    """Adds one to x with an AddOneFlea, displaying the computation (see add_one_setup)."""
+
+    # Only import pygame once the computation is going to be displayed
+    from main import run_simulation
+    run_simulation(**add_one_setup(x))
+
+def twos_complement_setup(x):
     """Sets up a TwosComplementFlea to compute the twos complement of x.
 
     Flips the bits and then adds one.
@@ -77,6 +97,9 @@ def twos_complement(x):
     80xx...xx8
     6333...336
     6777...776
+
+    Returns:
+        A dictionary of the arguments to run_simulation.
     """
 
     num_rows = 5
@@ -100,18 +123,25 @@ def twos_complement(x):
     square_colors[4, 1:-1] = 7
     square_colors[4, -1] = 6
 
-    run_simulation(num_rows=num_rows,
-                   num_cols=num_cols,
-                   flea_class=TwosComplementFlea,
-                   num_fleas=1,
-                   flea_rows=[3],
-                   flea_cols=[-2],
-                   init_directions=['left'],
-                   square_colors=square_colors.tolist(),
-                   delay=100,
-                   pause=True)
+    return dict(num_rows=num_rows,
+                num_cols=num_cols,
+                flea_class=TwosComplementFlea,
+                num_fleas=1,
+                flea_rows=[3],
+                flea_cols=[-2],
+                init_directions=['left'],
+                square_colors=square_colors,
+                delay=100,
+                pause=True)
 
-def add(x, y):
+def twos_complement(x):
+    """Computes the twos complement of x with a TwosComplementFlea, displaying the computation (see twos_complement_setup)."""
+
+    # Only import pygame once the computation is going to be displayed
+    from main import run_simulation
+    run_simulation(**twos_complement_setup(x))
+
+def add_setup(x, y):
     """Sets up an AdderFlea to add x and y in O(n^2) time.
 
     In the end, 2 is 0 and 3 is 1.
@@ -121,6 +151,9 @@ def add(x, y):
     8yy...yy7
     555...556
     222...228
+
+    Returns:
+        A dictionary of the arguments to run_simulation.
     """
 
     length = max(len(x), len(y))
@@ -143,18 +176,25 @@ def add(x, y):
     square_colors[4, :-1] = 2
     square_colors[4, -1] = 8
 
-    run_simulation(num_rows=num_rows,
-                   num_cols=num_cols,
-                   flea_class=AdderFlea,
-                   num_fleas=1,
-                   flea_rows=[3],
-                   flea_cols=[-2],
-                   init_directions=['left'],
-                   square_colors=square_colors.tolist(),
-                   delay=100,
-                   pause=True)
+    return dict(num_rows=num_rows,
+                num_cols=num_cols,
+                flea_class=AdderFlea,
+                num_fleas=1,
+                flea_rows=[3],
+                flea_cols=[-2],
+                init_directions=['left'],
+                square_colors=square_colors,
+                delay=100,
+                pause=True)
 
-def add_fast(x, y):
+def add(x, y):
+    """Adds x and y with an AdderFlea, displaying the computation (see add_setup)."""
+
+    # Only import pygame once the computation is going to be displayed
+    from main import run_simulation
+    run_simulation(**add_setup(x, y))
+
+def add_fast_setup(x, y):
     """Sets up an AdderFastFlea to add x and y in O(n) time.
 
     In the end, 2 is 0 and 3 is 1.
@@ -164,6 +204,9 @@ def add_fast(x, y):
     8y7y7...7y7y
     55555...5555
     22020...0202
+
+    Returns:
+        A dictionary of the arguments to run_simulation.
     """
 
     length = max(len(x), len(y))
@@ -183,16 +226,23 @@ def add_fast(x, y):
     square_colors[3] = 5
     square_colors[4, ::2] = 2
 
-    run_simulation(num_rows=num_rows,
-                   num_cols=num_cols,
-                   flea_class=AdderFastFlea,
-                   num_fleas=1,
-                   flea_rows=[3],
-                   flea_cols=[-1],
-                   init_directions=['left'],
-                   square_colors=square_colors.tolist(),
-                   delay=100,
-                   pause=True)
+    return dict(num_rows=num_rows,
+                num_cols=num_cols,
+                flea_class=AdderFastFlea,
+                num_fleas=1,
+                flea_rows=[3],
+                flea_cols=[-1],
+                init_directions=['left'],
+                square_colors=square_colors,
+                delay=100,
+                pause=True)
+
+def add_fast(x, y):
+    """Adds x and y with an AdderFastFlea, displaying the computation (see add_fast_setup)."""
+
+    # Only import pygame once the computation is going to be displayed
+    from main import run_simulation
+    run_simulation(**add_fast_setup(x, y))
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -201,6 +251,11 @@ if __name__ == '__main__':
     parser.add_argument('--inputs', type=str, nargs='+', required=True, help='Inputs')
     parser.add_argument('--width', type=int, default=75, help='Width of each square (in pixels)')
     parser.add_argument('--height', type=int, default=75, help='Height of each square (in pixels)')
+    parser.add_argument('--num_steps', type=str, default=None, help='Maximum number of steps to simulate headless before printing the board, instead of displaying the computation (the simulation stops early when the flea halts; may be in scientific notation)')
+    parser.add_argument('--cache_dir', type=str, default=DEFAULT_CACHE_DIR, help='Directory where the results of headless computations are cached')
+    parser.add_argument('--cache_size', type=float, default=DEFAULT_CACHE_SIZE / 2**20, help='Maximum size (in megabytes) of the cache of results')
+    parser.add_argument('--control', type=str, default=None, help='Port number, "host:port", or UNIX socket path on which to accept commands (pause, resume, step N, status, snapshot PATH, png PATH [SCALE], quit) while simulating headless or displaying the computation')
+    parser.add_argument('--no_cache', action='store_true', default=False, help='Do not use the cache of results')
 
     args = parser.parse_args()
 
@@ -213,14 +268,45 @@ if __name__ == '__main__':
 
     # Select compute type to perform
     if args.compute == 'bit_flip':
-        bit_flip(args.inputs[0])
+        setup = bit_flip_setup(args.inputs[0])
     elif args.compute == 'add_one':
-        add_one(args.inputs[0])
+        setup = add_one_setup(args.inputs[0])
     elif args.compute == 'twos_complement':
-        twos_complement(args.inputs[0])
+        setup = twos_complement_setup(args.inputs[0])
     elif args.compute == 'add':
-        add(args.inputs[0], args.inputs[1])
+        setup = add_setup(args.inputs[0], args.inputs[1])
     elif args.compute == 'add_fast':
-        add_fast(args.inputs[0], args.inputs[1])
+        setup = add_fast_setup(args.inputs[0], args.inputs[1])
     else:
+        setup = None
         print('Error: compute type must be one of {}'.format(__all__))
+
+    # Simulate headless, using cached results when available
+    if setup is not None and args.num_steps is not None:
+        from cache import ResultCache
+        from simulate import get_result_colors, simulate
+
+        # Display arguments do not apply headless
+        del setup['delay'], setup['pause']
+
+        cache = None if args.no_cache else ResultCache(args.cache_dir, int(args.cache_size * 2**20))
+
+        if args.control is not None:
+            from control import ControlServer
+            control = ControlServer(args.control)
+        else:
+            control = None
+
+        result = simulate(num_steps=int(float(args.num_steps)), cache=cache, control=control, **setup)
+
+        if control is not None:
+            control.close()
+
+        print('{} at step {}'.format('Halted' if result['halted'] else 'Stopped', result['step']))
+        for row in get_result_colors(result).tolist():
+            print(''.join(str(color) for color in row))
+
+    # Only import pygame once the computation is going to be displayed
+    elif setup is not None:
+        from main import run_simulation
+        run_simulation(control_address=args.control, **setup)
@@ -1,8 +1,147 @@
 import json
+import os
+import re
+
+import numpy as np
+
+def load_npy(path):
+    """Loads square colors from a NumPy .npy file.
+
+    The file is memory-mapped, so only the parts of the board
+    which are actually read are paged into memory.
+
+    Arguments:
+        path(str): The path to the .npy file.
+
+    Returns:
+        A read-only memory-mapped array of square colors.
+    """
+
+    return np.load(path, mmap_mode='r')
+
+def load_png(path):
+    """Loads square colors from a palette-indexed PNG image.
+
+    Each pixel's palette index is the color of the corresponding square.
+
+    Arguments:
+        path(str): The path to the PNG image.
+
+    Returns:
+        An array of square colors with one row per image row.
+    """
+
+    # Only import pygame when an image needs to be decoded
+    import pygame
+
+    image = pygame.image.load(path)
+
+    if image.get_bitsize() != 8:
+        raise Exception('Board image "{}" must be palette-indexed (8 bits per pixel), '.format(path) +
+                        'not {} bits per pixel'.format(image.get_bitsize()))
+
+    # surfarray is indexed (x, y) so transpose to (row, col)
+    return np.ascontiguousarray(pygame.surfarray.array2d(image).T, dtype=np.uint8)
+
+# Matches a run count followed by a cell state or end of row in an RLE pattern
+RLE_TOKEN = re.compile(r'(\d*)([bo.A-X$!]|[p-y][A-X])')
+
+def rle_state(tag):
+    """Converts an RLE cell state tag to a color.
+
+    Tags follow the Golly conventions: "b" and "." are 0,
+    "o" is 1, "A" through "X" are 1 through 24, and a
+    prefix "p" through "y" adds 24 for each letter after "o".
+
+    Arguments:
+        tag(str): The cell state tag.
+
+    Returns:
+        The color corresponding to the tag.
+    """
+
+    if tag in 'b.':
+        return 0
+    if tag == 'o':
+        return 1
+    if len(tag) == 2:
+        return 24 * (ord(tag[0]) - ord('o')) + ord(tag[1]) - ord('A') + 1
+
+    return ord(tag) - ord('A') + 1
+
+def load_rle(path):
+    """Loads square colors from a run-length encoded text pattern.
+
+    The pattern uses the RLE format of Golly: comment lines start with "#",
+    the header line "x = <num_cols>, y = <num_rows>" gives the size of the
+    board, and the body is a sequence of optionally counted cell states
+    (see rle_state) with "$" ending a row and "!" ending the pattern.
+
+    Arguments:
+        path(str): The path to the RLE file.
+
+    Returns:
+        An array of square colors.
+    """
+
+    with open(path, 'r') as rle_file:
+        lines = [line.strip() for line in rle_file if not line.startswith('#')]
+
+    header = dict(re.findall(r'(\w+)\s*=\s*([^,\s]+)', lines[0]))
+    square_colors = np.zeros((int(header['y']), int(header['x'])), dtype=np.uint8)
+
+    row = col = 0
+    for count, tag in RLE_TOKEN.findall(''.join(lines[1:])):
+        count = int(count) if count else 1
+
+        if tag == '!':
+            break
+        elif tag == '$':
+            row += count
+            col = 0
+        else:
+            # Colors are stored in one byte, so larger states would wrap around
+            state = rle_state(tag)
+            if state > np.iinfo(square_colors.dtype).max:
+                raise Exception('RLE state "{}" in "{}" is {}, but states must be less than 256'.format(tag, path, state))
+
+            square_colors[row, col:col + count] = state
+            col += count
+
+    return square_colors
+
+BOARD_LOADERS = {
+    '.npy': load_npy,
+    '.png': load_png,
+    '.rle': load_rle
+}
+
+def load_square_colors(path):
+    """Loads square colors from a board file.
+
+    Arguments:
+        path(str): The path to a .npy, .png, or .rle board file.
+
+    Returns:
+        An array of square colors.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension not in BOARD_LOADERS:
+        raise Exception(
+            'Board file "{}" has unsupported extension. '.format(path) +
+            'Supported extensions are {}'.format(list(BOARD_LOADERS.keys())))
+
+    return BOARD_LOADERS[extension](path)
 
 def process_config(args):
     """Loads a config file and updates the args.
 
+    Square colors may be given either as a list of lists
+    or as the path (relative to the config file) to a
+    board file which can be loaded by load_square_colors.
+
     Arguments:
         args(object): The program arguments.
     """
@@ -13,12 +152,16 @@ def process_config(args):
         return
 
     # Open config
+    config_dir = os.path.dirname(args.config)
     with open(args.config, 'r') as config_file:
         args.config = json.load(config_file)
 
     # Load square colors
     args.square_colors = args.config.get('square_colors', None)
 
+    if isinstance(args.square_colors, str):
+        args.square_colors = load_square_colors(os.path.join(config_dir, args.square_colors))
+
     # Determine number of rows and columns
     # if square colors are specified
     if args.square_colors is not None:
@@ -28,4 +171,5 @@ def process_config(args):
     # Load all other variables from config
     # using value in args as default
     for arg in vars(args):
-        setattr(args, arg, args.config.get(arg, getattr(args, arg)))
+        if arg != 'square_colors':
+            setattr(args, arg, args.config.get(arg, getattr(args, arg)))
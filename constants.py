@@ -1,3 +1,5 @@
+import sys
+
 DIRECTIONS = {
     'up': (-1, 0),
     'right': (0, 1),
@@ -6,6 +8,39 @@ DIRECTIONS = {
     'stop': (0, 0)
 }
 
+# Integer direction indices used by the simulation,
+# in clockwise order followed by stop
+DIRECTION_NAMES = ['up', 'right', 'down', 'left', 'stop']
+DIRECTION_INDICES = {name: index for index, name in enumerate(DIRECTION_NAMES)}
+STOP = DIRECTION_INDICES['stop']
+
+# Row and column deltas of a move in each direction
+ROW_DELTAS = [DIRECTIONS[name][0] for name in DIRECTION_NAMES]
+COL_DELTAS = [DIRECTIONS[name][1] for name in DIRECTION_NAMES]
+
+# The direction after turning left or right from each direction
+# (a stopped flea stays stopped)
+LEFT_TURNS = [(index - 1) % STOP for index in range(STOP)] + [STOP]
+RIGHT_TURNS = [(index + 1) % STOP for index in range(STOP)] + [STOP]
+
+# Turns a flea can take on a color, as the number of
+# right turns to take, followed by stop
+TURN_NAMES = ['straight', 'right', 'u_turn', 'left', 'stop']
+STRAIGHT, RIGHT, U_TURN, LEFT, HALT = range(len(TURN_NAMES))
+
+# The direction after taking each turn from each direction,
+# indexed [direction][turn] (a stopped flea stays stopped)
+NEXT_DIRECTIONS = [[STOP if direction == STOP or turn == HALT else (direction + turn) % STOP
+                    for turn in range(len(TURN_NAMES))]
+                   for direction in range(len(DIRECTION_NAMES))]
+
+# Colors of the heatmap of visit counts from fewest to most visits
+# (interpolated between these colors on a log scale)
+HEATMAP_COLORS = [(0, 0, 4), (87, 16, 110), (188, 55, 84), (249, 142, 9), (252, 255, 164)]
+
+# Color of fleas drawn as pixels or glyphs instead of images
+FLEA_COLOR = (255, 69, 0)
+
 MARGIN_TOP = 50
 MARGIN_SIDE = 20
 
@@ -26,1135 +61,1178 @@ def get_width():
 def get_height():
     return height
 
-COLOR_MAP = {
-    'white': (255, 255, 255),
-    'black': (0, 0, 0),
-    'red': (255, 0, 0),
-    'lime': (0, 255, 0),
-    'blue': (0, 0, 255),
-    'yellow': (255, 255, 0),
-    'cyan': (0, 255, 255),
-    'magenta': (255, 0, 255),
-    'silver': (192, 192, 192),
-    'gray': (128, 128, 128),
-    'maroon': (128, 0, 0),
-    'olive': (128, 128, 0),
-    'green': (0, 128, 0),
-    'purple': (128, 0, 128),
-    'teal': (0, 128, 128),
-    'navy': (0, 0, 128),
-    'aliceblue': (240, 248, 255),
-    'antiquewhite': (250, 235, 215),
-    'antiquewhite1': (255, 239, 219),
-    'antiquewhite2': (238, 223, 204),
-    'antiquewhite3': (205, 192, 176),
-    'antiquewhite4': (139, 131, 120),
-    'aqua': (0, 255, 255),
-    'aquamarine1': (127, 255, 212),
-    'aquamarine2': (118, 238, 198),
-    'aquamarine3': (102, 205, 170),
-    'aquamarine4': (69, 139, 116),
-    'azure1': (240, 255, 255),
-    'azure2': (224, 238, 238),
-    'azure3': (193, 205, 205),
-    'azure4': (131, 139, 139),
-    'banana': (227, 207, 87),
-    'beige': (245, 245, 220),
-    'bisque1': (255, 228, 196),
-    'bisque2': (238, 213, 183),
-    'bisque3': (205, 183, 158),
-    'bisque4': (139, 125, 107),
-    'black': (0, 0, 0),
-    'blanchedalmond': (255, 235, 205),
-    'blue': (0, 0, 255),
-    'blue2': (0, 0, 238),
-    'blue3': (0, 0, 205),
-    'blue4': (0, 0, 139),
-    'blueviolet': (138, 43, 226),
-    'brick': (156, 102, 31),
-    'brown': (165, 42, 42),
-    'brown1': (255, 64, 64),
-    'brown2': (238, 59, 59),
-    'brown3': (205, 51, 51),
-    'brown4': (139, 35, 35),
-    'burlywood': (222, 184, 135),
-    'burlywood1': (255, 211, 155),
-    'burlywood2': (238, 197, 145),
-    'burlywood3': (205, 170, 125),
-    'burlywood4': (139, 115, 85),
-    'burntsienna': (138, 54, 15),
-    'burntumber': (138, 51, 36),
-    'cadetblue': (95, 158, 160),
-    'cadetblue1': (152, 245, 255),
-    'cadetblue2': (142, 229, 238),
-    'cadetblue3': (122, 197, 205),
-    'cadetblue4': (83, 134, 139),
-    'cadmiumorange': (255, 97, 3),
-    'cadmiumyellow': (255, 153, 18),
-    'carrot': (237, 145, 33),
-    'chartreuse1': (127, 255, 0),
-    'chartreuse2': (118, 238, 0),
-    'chartreuse3': (102, 205, 0),
-    'chartreuse4': (69, 139, 0),
-    'chocolate': (210, 105, 30),
-    'chocolate1': (255, 127, 36),
-    'chocolate2': (238, 118, 33),
-    'chocolate3': (205, 102, 29),
-    'chocolate4': (139, 69, 19),
-    'cobalt': (61, 89, 171),
-    'cobaltgreen': (61, 145, 64),
-    'coldgrey': (128, 138, 135),
-    'coral': (255, 127, 80),
-    'coral1': (255, 114, 86),
-    'coral2': (238, 106, 80),
-    'coral3': (205, 91, 69),
-    'coral4': (139, 62, 47),
-    'cornflowerblue': (100, 149, 237),
-    'cornsilk1': (255, 248, 220),
-    'cornsilk2': (238, 232, 205),
-    'cornsilk3': (205, 200, 177),
-    'cornsilk4': (139, 136, 120),
-    'crimson': (220, 20, 60),
-    'cyan2': (0, 238, 238),
-    'cyan3': (0, 205, 205),
-    'cyan4': (0, 139, 139),
-    'darkgoldenrod': (184, 134, 11),
-    'darkgoldenrod1': (255, 185, 15),
-    'darkgoldenrod2': (238, 173, 14),
-    'darkgoldenrod3': (205, 149, 12),
-    'darkgoldenrod4': (139, 101, 8),
-    'darkgray': (169, 169, 169),
-    'darkgreen': (0, 100, 0),
-    'darkkhaki': (189, 183, 107),
-    'darkolivegreen': (85, 107, 47),
-    'darkolivegreen1': (202, 255, 112),
-    'darkolivegreen2': (188, 238, 104),
-    'darkolivegreen3': (162, 205, 90),
-    'darkolivegreen4': (110, 139, 61),
-    'darkorange': (255, 140, 0),
-    'darkorange1': (255, 127, 0),
-    'darkorange2': (238, 118, 0),
-    'darkorange3': (205, 102, 0),
-    'darkorange4': (139, 69, 0),
-    'darkorchid': (153, 50, 204),
-    'darkorchid1': (191, 62, 255),
-    'darkorchid2': (178, 58, 238),
-    'darkorchid3': (154, 50, 205),
-    'darkorchid4': (104, 34, 139),
-    'darksalmon': (233, 150, 122),
-    'darkseagreen': (143, 188, 143),
-    'darkseagreen1': (193, 255, 193),
-    'darkseagreen2': (180, 238, 180),
-    'darkseagreen3': (155, 205, 155),
-    'darkseagreen4': (105, 139, 105),
-    'darkslateblue': (72, 61, 139),
-    'darkslategray': (47, 79, 79),
-    'darkslategray1': (151, 255, 255),
-    'darkslategray2': (141, 238, 238),
-    'darkslategray3': (121, 205, 205),
-    'darkslategray4': (82, 139, 139),
-    'darkturquoise': (0, 206, 209),
-    'darkviolet': (148, 0, 211),
-    'deeppink1': (255, 20, 147),
-    'deeppink2': (238, 18, 137),
-    'deeppink3': (205, 16, 118),
-    'deeppink4': (139, 10, 80),
-    'deepskyblue1': (0, 191, 255),
-    'deepskyblue2': (0, 178, 238),
-    'deepskyblue3': (0, 154, 205),
-    'deepskyblue4': (0, 104, 139),
-    'dimgray': (105, 105, 105),
-    'dimgray': (105, 105, 105),
-    'dodgerblue1': (30, 144, 255),
-    'dodgerblue2': (28, 134, 238),
-    'dodgerblue3': (24, 116, 205),
-    'dodgerblue4': (16, 78, 139),
-    'eggshell': (252, 230, 201),
-    'emeraldgreen': (0, 201, 87),
-    'firebrick': (178, 34, 34),
-    'firebrick1': (255, 48, 48),
-    'firebrick2': (238, 44, 44),
-    'firebrick3': (205, 38, 38),
-    'firebrick4': (139, 26, 26),
-    'flesh': (255, 125, 64),
-    'floralwhite': (255, 250, 240),
-    'forestgreen': (34, 139, 34),
-    'gainsboro': (220, 220, 220),
-    'ghostwhite': (248, 248, 255),
-    'gold1': (255, 215, 0),
-    'gold2': (238, 201, 0),
-    'gold3': (205, 173, 0),
-    'gold4': (139, 117, 0),
-    'goldenrod': (218, 165, 32),
-    'goldenrod1': (255, 193, 37),
-    'goldenrod2': (238, 180, 34),
-    'goldenrod3': (205, 155, 29),
-    'goldenrod4': (139, 105, 20),
-    'gray': (128, 128, 128),
-    'gray1': (3, 3, 3),
-    'gray10': (26, 26, 26),
-    'gray11': (28, 28, 28),
-    'gray12': (31, 31, 31),
-    'gray13': (33, 33, 33),
-    'gray14': (36, 36, 36),
-    'gray15': (38, 38, 38),
-    'gray16': (41, 41, 41),
-    'gray17': (43, 43, 43),
-    'gray18': (46, 46, 46),
-    'gray19': (48, 48, 48),
-    'gray2': (5, 5, 5),
-    'gray20': (51, 51, 51),
-    'gray21': (54, 54, 54),
-    'gray22': (56, 56, 56),
-    'gray23': (59, 59, 59),
-    'gray24': (61, 61, 61),
-    'gray25': (64, 64, 64),
-    'gray26': (66, 66, 66),
-    'gray27': (69, 69, 69),
-    'gray28': (71, 71, 71),
-    'gray29': (74, 74, 74),
-    'gray3': (8, 8, 8),
-    'gray30': (77, 77, 77),
-    'gray31': (79, 79, 79),
-    'gray32': (82, 82, 82),
-    'gray33': (84, 84, 84),
-    'gray34': (87, 87, 87),
-    'gray35': (89, 89, 89),
-    'gray36': (92, 92, 92),
-    'gray37': (94, 94, 94),
-    'gray38': (97, 97, 97),
-    'gray39': (99, 99, 99),
-    'gray4': (10, 10, 10),
-    'gray40': (102, 102, 102),
-    'gray42': (107, 107, 107),
-    'gray43': (110, 110, 110),
-    'gray44': (112, 112, 112),
-    'gray45': (115, 115, 115),
-    'gray46': (117, 117, 117),
-    'gray47': (120, 120, 120),
-    'gray48': (122, 122, 122),
-    'gray49': (125, 125, 125),
-    'gray5': (13, 13, 13),
-    'gray50': (127, 127, 127),
-    'gray51': (130, 130, 130),
-    'gray52': (133, 133, 133),
-    'gray53': (135, 135, 135),
-    'gray54': (138, 138, 138),
-    'gray55': (140, 140, 140),
-    'gray56': (143, 143, 143),
-    'gray57': (145, 145, 145),
-    'gray58': (148, 148, 148),
-    'gray59': (150, 150, 150),
-    'gray6': (15, 15, 15),
-    'gray60': (153, 153, 153),
-    'gray61': (156, 156, 156),
-    'gray62': (158, 158, 158),
-    'gray63': (161, 161, 161),
-    'gray64': (163, 163, 163),
-    'gray65': (166, 166, 166),
-    'gray66': (168, 168, 168),
-    'gray67': (171, 171, 171),
-    'gray68': (173, 173, 173),
-    'gray69': (176, 176, 176),
-    'gray7': (18, 18, 18),
-    'gray70': (179, 179, 179),
-    'gray71': (181, 181, 181),
-    'gray72': (184, 184, 184),
-    'gray73': (186, 186, 186),
-    'gray74': (189, 189, 189),
-    'gray75': (191, 191, 191),
-    'gray76': (194, 194, 194),
-    'gray77': (196, 196, 196),
-    'gray78': (199, 199, 199),
-    'gray79': (201, 201, 201),
-    'gray8': (20, 20, 20),
-    'gray80': (204, 204, 204),
-    'gray81': (207, 207, 207),
-    'gray82': (209, 209, 209),
-    'gray83': (212, 212, 212),
-    'gray84': (214, 214, 214),
-    'gray85': (217, 217, 217),
-    'gray86': (219, 219, 219),
-    'gray87': (222, 222, 222),
-    'gray88': (224, 224, 224),
-    'gray89': (227, 227, 227),
-    'gray9': (23, 23, 23),
-    'gray90': (229, 229, 229),
-    'gray91': (232, 232, 232),
-    'gray92': (235, 235, 235),
-    'gray93': (237, 237, 237),
-    'gray94': (240, 240, 240),
-    'gray95': (242, 242, 242),
-    'gray97': (247, 247, 247),
-    'gray98': (250, 250, 250),
-    'gray99': (252, 252, 252),
-    'green': (0, 128, 0),
-    'green1': (0, 255, 0),
-    'green2': (0, 238, 0),
-    'green3': (0, 205, 0),
-    'green4': (0, 139, 0),
-    'greenyellow': (173, 255, 47),
-    'honeydew1': (240, 255, 240),
-    'honeydew2': (224, 238, 224),
-    'honeydew3': (193, 205, 193),
-    'honeydew4': (131, 139, 131),
-    'hotpink': (255, 105, 180),
-    'hotpink1': (255, 110, 180),
-    'hotpink2': (238, 106, 167),
-    'hotpink3': (205, 96, 144),
-    'hotpink4': (139, 58, 98),
-    'indianred': (176, 23, 31),
-    'indianred': (205, 92, 92),
-    'indianred1': (255, 106, 106),
-    'indianred2': (238, 99, 99),
-    'indianred3': (205, 85, 85),
-    'indianred4': (139, 58, 58),
-    'indigo': (75, 0, 130),
-    'ivory1': (255, 255, 240),
-    'ivory2': (238, 238, 224),
-    'ivory3': (205, 205, 193),
-    'ivory4': (139, 139, 131),
-    'ivoryblack': (41, 36, 33),
-    'khaki': (240, 230, 140),
-    'khaki1': (255, 246, 143),
-    'khaki2': (238, 230, 133),
-    'khaki3': (205, 198, 115),
-    'khaki4': (139, 134, 78),
-    'lavender': (230, 230, 250),
-    'lavenderblush1': (255, 240, 245),
-    'lavenderblush2': (238, 224, 229),
-    'lavenderblush3': (205, 193, 197),
-    'lavenderblush4': (139, 131, 134),
-    'lawngreen': (124, 252, 0),
-    'lemonchiffon1': (255, 250, 205),
-    'lemonchiffon2': (238, 233, 191),
-    'lemonchiffon3': (205, 201, 165),
-    'lemonchiffon4': (139, 137, 112),
-    'lightblue': (173, 216, 230),
-    'lightblue1': (191, 239, 255),
-    'lightblue2': (178, 223, 238),
-    'lightblue3': (154, 192, 205),
-    'lightblue4': (104, 131, 139),
-    'lightcoral': (240, 128, 128),
-    'lightcyan1': (224, 255, 255),
-    'lightcyan2': (209, 238, 238),
-    'lightcyan3': (180, 205, 205),
-    'lightcyan4': (122, 139, 139),
-    'lightgoldenrod1': (255, 236, 139),
-    'lightgoldenrod2': (238, 220, 130),
-    'lightgoldenrod3': (205, 190, 112),
-    'lightgoldenrod4': (139, 129, 76),
-    'lightgoldenrodyellow': (250, 250, 210),
-    'lightgrey': (211, 211, 211),
-    'lightpink': (255, 182, 193),
-    'lightpink1': (255, 174, 185),
-    'lightpink2': (238, 162, 173),
-    'lightpink3': (205, 140, 149),
-    'lightpink4': (139, 95, 101),
-    'lightsalmon1': (255, 160, 122),
-    'lightsalmon2': (238, 149, 114),
-    'lightsalmon3': (205, 129, 98),
-    'lightsalmon4': (139, 87, 66),
-    'lightseagreen': (32, 178, 170),
-    'lightskyblue': (135, 206, 250),
-    'lightskyblue1': (176, 226, 255),
-    'lightskyblue2': (164, 211, 238),
-    'lightskyblue3': (141, 182, 205),
-    'lightskyblue4': (96, 123, 139),
-    'lightslateblue': (132, 112, 255),
-    'lightslategray': (119, 136, 153),
-    'lightsteelblue': (176, 196, 222),
-    'lightsteelblue1': (202, 225, 255),
-    'lightsteelblue2': (188, 210, 238),
-    'lightsteelblue3': (162, 181, 205),
-    'lightsteelblue4': (110, 123, 139),
-    'lightyellow1': (255, 255, 224),
-    'lightyellow2': (238, 238, 209),
-    'lightyellow3': (205, 205, 180),
-    'lightyellow4': (139, 139, 122),
-    'limegreen': (50, 205, 50),
-    'linen': (250, 240, 230),
-    'magenta': (255, 0, 255),
-    'magenta2': (238, 0, 238),
-    'magenta3': (205, 0, 205),
-    'magenta4': (139, 0, 139),
-    'manganeseblue': (3, 168, 158),
-    'maroon': (128, 0, 0),
-    'maroon1': (255, 52, 179),
-    'maroon2': (238, 48, 167),
-    'maroon3': (205, 41, 144),
-    'maroon4': (139, 28, 98),
-    'mediumorchid': (186, 85, 211),
-    'mediumorchid1': (224, 102, 255),
-    'mediumorchid2': (209, 95, 238),
-    'mediumorchid3': (180, 82, 205),
-    'mediumorchid4': (122, 55, 139),
-    'mediumpurple': (147, 112, 219),
-    'mediumpurple1': (171, 130, 255),
-    'mediumpurple2': (159, 121, 238),
-    'mediumpurple3': (137, 104, 205),
-    'mediumpurple4': (93, 71, 139),
-    'mediumseagreen': (60, 179, 113),
-    'mediumslateblue': (123, 104, 238),
-    'mediumspringgreen': (0, 250, 154),
-    'mediumturquoise': (72, 209, 204),
-    'mediumvioletred': (199, 21, 133),
-    'melon': (227, 168, 105),
-    'midnightblue': (25, 25, 112),
-    'mint': (189, 252, 201),
-    'mintcream': (245, 255, 250),
-    'mistyrose1': (255, 228, 225),
-    'mistyrose2': (238, 213, 210),
-    'mistyrose3': (205, 183, 181),
-    'mistyrose4': (139, 125, 123),
-    'moccasin': (255, 228, 181),
-    'navajowhite1': (255, 222, 173),
-    'navajowhite2': (238, 207, 161),
-    'navajowhite3': (205, 179, 139),
-    'navajowhite4': (139, 121, 94),
-    'navy': (0, 0, 128),
-    'oldlace': (253, 245, 230),
-    'olive': (128, 128, 0),
-    'olivedrab': (107, 142, 35),
-    'olivedrab1': (192, 255, 62),
-    'olivedrab2': (179, 238, 58),
-    'olivedrab3': (154, 205, 50),
-    'olivedrab4': (105, 139, 34),
-    'orange': (255, 128, 0),
-    'orange1': (255, 165, 0),
-    'orange2': (238, 154, 0),
-    'orange3': (205, 133, 0),
-    'orange4': (139, 90, 0),
-    'orangered1': (255, 69, 0),
-    'orangered2': (238, 64, 0),
-    'orangered3': (205, 55, 0),
-    'orangered4': (139, 37, 0),
-    'orchid': (218, 112, 214),
-    'orchid1': (255, 131, 250),
-    'orchid2': (238, 122, 233),
-    'orchid3': (205, 105, 201),
-    'orchid4': (139, 71, 137),
-    'palegoldenrod': (238, 232, 170),
-    'palegreen': (152, 251, 152),
-    'palegreen1': (154, 255, 154),
-    'palegreen2': (144, 238, 144),
-    'palegreen3': (124, 205, 124),
-    'palegreen4': (84, 139, 84),
-    'paleturquoise1': (187, 255, 255),
-    'paleturquoise2': (174, 238, 238),
-    'paleturquoise3': (150, 205, 205),
-    'paleturquoise4': (102, 139, 139),
-    'palevioletred': (219, 112, 147),
-    'palevioletred1': (255, 130, 171),
-    'palevioletred2': (238, 121, 159),
-    'palevioletred3': (205, 104, 137),
-    'palevioletred4': (139, 71, 93),
-    'papayawhip': (255, 239, 213),
-    'peachpuff1': (255, 218, 185),
-    'peachpuff2': (238, 203, 173),
-    'peachpuff3': (205, 175, 149),
-    'peachpuff4': (139, 119, 101),
-    'peacock': (51, 161, 201),
-    'pink': (255, 192, 203),
-    'pink1': (255, 181, 197),
-    'pink2': (238, 169, 184),
-    'pink3': (205, 145, 158),
-    'pink4': (139, 99, 108),
-    'plum': (221, 160, 221),
-    'plum1': (255, 187, 255),
-    'plum2': (238, 174, 238),
-    'plum3': (205, 150, 205),
-    'plum4': (139, 102, 139),
-    'powderblue': (176, 224, 230),
-    'purple': (128, 0, 128),
-    'purple1': (155, 48, 255),
-    'purple2': (145, 44, 238),
-    'purple3': (125, 38, 205),
-    'purple4': (85, 26, 139),
-    'raspberry': (135, 38, 87),
-    'rawsienna': (199, 97, 20),
-    'red1': (255, 0, 0),
-    'red2': (238, 0, 0),
-    'red3': (205, 0, 0),
-    'red4': (139, 0, 0),
-    'rosybrown': (188, 143, 143),
-    'rosybrown1': (255, 193, 193),
-    'rosybrown2': (238, 180, 180),
-    'rosybrown3': (205, 155, 155),
-    'rosybrown4': (139, 105, 105),
-    'royalblue': (65, 105, 225),
-    'royalblue1': (72, 118, 255),
-    'royalblue2': (67, 110, 238),
-    'royalblue3': (58, 95, 205),
-    'royalblue4': (39, 64, 139),
-    'salmon': (250, 128, 114),
-    'salmon1': (255, 140, 105),
-    'salmon2': (238, 130, 98),
-    'salmon3': (205, 112, 84),
-    'salmon4': (139, 76, 57),
-    'sandybrown': (244, 164, 96),
-    'sapgreen': (48, 128, 20),
-    'seagreen1': (84, 255, 159),
-    'seagreen2': (78, 238, 148),
-    'seagreen3': (67, 205, 128),
-    'seagreen4': (46, 139, 87),
-    'seashell1': (255, 245, 238),
-    'seashell2': (238, 229, 222),
-    'seashell3': (205, 197, 191),
-    'seashell4': (139, 134, 130),
-    'sepia': (94, 38, 18),
-    'sgibeet': (142, 56, 142),
-    'sgibrightgray': (197, 193, 170),
-    'sgichartreuse': (113, 198, 113),
-    'sgidarkgray': (85, 85, 85),
-    'sgigray12': (30, 30, 30),
-    'sgigray16': (40, 40, 40),
-    'sgigray32': (81, 81, 81),
-    'sgigray36': (91, 91, 91),
-    'sgigray52': (132, 132, 132),
-    'sgigray56': (142, 142, 142),
-    'sgigray72': (183, 183, 183),
-    'sgigray76': (193, 193, 193),
-    'sgigray92': (234, 234, 234),
-    'sgigray96': (244, 244, 244),
-    'sgilightblue': (125, 158, 192),
-    'sgilightgray': (170, 170, 170),
-    'sgiolivedrab': (142, 142, 56),
-    'sgisalmon': (198, 113, 113),
-    'sgislateblue': (113, 113, 198),
-    'sgiteal': (56, 142, 142),
-    'sienna': (160, 82, 45),
-    'sienna1': (255, 130, 71),
-    'sienna2': (238, 121, 66),
-    'sienna3': (205, 104, 57),
-    'sienna4': (139, 71, 38),
-    'silver': (192, 192, 192),
-    'skyblue': (135, 206, 235),
-    'skyblue1': (135, 206, 255),
-    'skyblue2': (126, 192, 238),
-    'skyblue3': (108, 166, 205),
-    'skyblue4': (74, 112, 139),
-    'slateblue': (106, 90, 205),
-    'slateblue1': (131, 111, 255),
-    'slateblue2': (122, 103, 238),
-    'slateblue3': (105, 89, 205),
-    'slateblue4': (71, 60, 139),
-    'slategray': (112, 128, 144),
-    'slategray1': (198, 226, 255),
-    'slategray2': (185, 211, 238),
-    'slategray3': (159, 182, 205),
-    'slategray4': (108, 123, 139),
-    'snow1': (255, 250, 250),
-    'snow2': (238, 233, 233),
-    'snow3': (205, 201, 201),
-    'snow4': (139, 137, 137),
-    'springgreen': (0, 255, 127),
-    'springgreen1': (0, 238, 118),
-    'springgreen2': (0, 205, 102),
-    'springgreen3': (0, 139, 69),
-    'steelblue': (70, 130, 180),
-    'steelblue1': (99, 184, 255),
-    'steelblue2': (92, 172, 238),
-    'steelblue3': (79, 148, 205),
-    'steelblue4': (54, 100, 139),
-    'tan': (210, 180, 140),
-    'tan1': (255, 165, 79),
-    'tan2': (238, 154, 73),
-    'tan3': (205, 133, 63),
-    'tan4': (139, 90, 43),
-    'teal': (0, 128, 128),
-    'thistle': (216, 191, 216),
-    'thistle1': (255, 225, 255),
-    'thistle2': (238, 210, 238),
-    'thistle3': (205, 181, 205),
-    'thistle4': (139, 123, 139),
-    'tomato1': (255, 99, 71),
-    'tomato2': (238, 92, 66),
-    'tomato3': (205, 79, 57),
-    'tomato4': (139, 54, 38),
-    'turquoise': (64, 224, 208),
-    'turquoise1': (0, 245, 255),
-    'turquoise2': (0, 229, 238),
-    'turquoise3': (0, 197, 205),
-    'turquoise4': (0, 134, 139),
-    'turquoiseblue': (0, 199, 140),
-    'violet': (238, 130, 238),
-    'violetred': (208, 32, 144),
-    'violetred1': (255, 62, 150),
-    'violetred2': (238, 58, 140),
-    'violetred3': (205, 50, 120),
-    'violetred4': (139, 34, 82),
-    'warmgrey': (128, 128, 105),
-    'wheat': (245, 222, 179),
-    'wheat1': (255, 231, 186),
-    'wheat2': (238, 216, 174),
-    'wheat3': (205, 186, 150),
-    'wheat4': (139, 126, 102),
-    'white': (255, 255, 255),
-    'whitesmoke': (245, 245, 245),
-    'whitesmoke': (245, 245, 245),
-    'yellow1': (255, 255, 0),
-    'yellow2': (238, 238, 0),
-    'yellow3': (205, 205, 0),
-    'yellow4': (139, 139, 0)
-}
+def build_color_map():
+    """Builds the map from color name to RGB tuple.
+
+    Returns:
+        A dictionary mapping each color name to an RGB tuple.
+    """
+
+    color_map = {
+        'white': (255, 255, 255),
+        'black': (0, 0, 0),
+        'red': (255, 0, 0),
+        'lime': (0, 255, 0),
+        'blue': (0, 0, 255),
+        'yellow': (255, 255, 0),
+        'cyan': (0, 255, 255),
+        'magenta': (255, 0, 255),
+        'silver': (192, 192, 192),
+        'gray': (128, 128, 128),
+        'maroon': (128, 0, 0),
+        'olive': (128, 128, 0),
+        'green': (0, 128, 0),
+        'purple': (128, 0, 128),
+        'teal': (0, 128, 128),
+        'navy': (0, 0, 128),
+        'aliceblue': (240, 248, 255),
+        'antiquewhite': (250, 235, 215),
+        'antiquewhite1': (255, 239, 219),
+        'antiquewhite2': (238, 223, 204),
+        'antiquewhite3': (205, 192, 176),
+        'antiquewhite4': (139, 131, 120),
+        'aqua': (0, 255, 255),
+        'aquamarine1': (127, 255, 212),
+        'aquamarine2': (118, 238, 198),
+        'aquamarine3': (102, 205, 170),
+        'aquamarine4': (69, 139, 116),
+        'azure1': (240, 255, 255),
+        'azure2': (224, 238, 238),
+        'azure3': (193, 205, 205),
+        'azure4': (131, 139, 139),
+        'banana': (227, 207, 87),
+        'beige': (245, 245, 220),
+        'bisque1': (255, 228, 196),
+        'bisque2': (238, 213, 183),
+        'bisque3': (205, 183, 158),
+        'bisque4': (139, 125, 107),
+        'black': (0, 0, 0),
+        'blanchedalmond': (255, 235, 205),
+        'blue': (0, 0, 255),
+        'blue2': (0, 0, 238),
+        'blue3': (0, 0, 205),
+        'blue4': (0, 0, 139),
+        'blueviolet': (138, 43, 226),
+        'brick': (156, 102, 31),
+        'brown': (165, 42, 42),
+        'brown1': (255, 64, 64),
+        'brown2': (238, 59, 59),
+        'brown3': (205, 51, 51),
+        'brown4': (139, 35, 35),
+        'burlywood': (222, 184, 135),
+        'burlywood1': (255, 211, 155),
+        'burlywood2': (238, 197, 145),
+        'burlywood3': (205, 170, 125),
+        'burlywood4': (139, 115, 85),
+        'burntsienna': (138, 54, 15),
+        'burntumber': (138, 51, 36),
+        'cadetblue': (95, 158, 160),
+        'cadetblue1': (152, 245, 255),
+        'cadetblue2': (142, 229, 238),
+        'cadetblue3': (122, 197, 205),
+        'cadetblue4': (83, 134, 139),
+        'cadmiumorange': (255, 97, 3),
+        'cadmiumyellow': (255, 153, 18),
+        'carrot': (237, 145, 33),
+        'chartreuse1': (127, 255, 0),
+        'chartreuse2': (118, 238, 0),
+        'chartreuse3': (102, 205, 0),
+        'chartreuse4': (69, 139, 0),
+        'chocolate': (210, 105, 30),
+        'chocolate1': (255, 127, 36),
+        'chocolate2': (238, 118, 33),
+        'chocolate3': (205, 102, 29),
+        'chocolate4': (139, 69, 19),
+        'cobalt': (61, 89, 171),
+        'cobaltgreen': (61, 145, 64),
+        'coldgrey': (128, 138, 135),
+        'coral': (255, 127, 80),
+        'coral1': (255, 114, 86),
+        'coral2': (238, 106, 80),
+        'coral3': (205, 91, 69),
+        'coral4': (139, 62, 47),
+        'cornflowerblue': (100, 149, 237),
+        'cornsilk1': (255, 248, 220),
+        'cornsilk2': (238, 232, 205),
+        'cornsilk3': (205, 200, 177),
+        'cornsilk4': (139, 136, 120),
+        'crimson': (220, 20, 60),
+        'cyan2': (0, 238, 238),
+        'cyan3': (0, 205, 205),
+        'cyan4': (0, 139, 139),
+        'darkgoldenrod': (184, 134, 11),
+        'darkgoldenrod1': (255, 185, 15),
+        'darkgoldenrod2': (238, 173, 14),
+        'darkgoldenrod3': (205, 149, 12),
+        'darkgoldenrod4': (139, 101, 8),
+        'darkgray': (169, 169, 169),
+        'darkgreen': (0, 100, 0),
+        'darkkhaki': (189, 183, 107),
+        'darkolivegreen': (85, 107, 47),
+        'darkolivegreen1': (202, 255, 112),
+        'darkolivegreen2': (188, 238, 104),
+        'darkolivegreen3': (162, 205, 90),
+        'darkolivegreen4': (110, 139, 61),
+        'darkorange': (255, 140, 0),
+        'darkorange1': (255, 127, 0),
+        'darkorange2': (238, 118, 0),
+        'darkorange3': (205, 102, 0),
+        'darkorange4': (139, 69, 0),
+        'darkorchid': (153, 50, 204),
+        'darkorchid1': (191, 62, 255),
+        'darkorchid2': (178, 58, 238),
+        'darkorchid3': (154, 50, 205),
+        'darkorchid4': (104, 34, 139),
+        'darksalmon': (233, 150, 122),
+        'darkseagreen': (143, 188, 143),
+        'darkseagreen1': (193, 255, 193),
+        'darkseagreen2': (180, 238, 180),
+        'darkseagreen3': (155, 205, 155),
+        'darkseagreen4': (105, 139, 105),
+        'darkslateblue': (72, 61, 139),
+        'darkslategray': (47, 79, 79),
+        'darkslategray1': (151, 255, 255),
+        'darkslategray2': (141, 238, 238),
+        'darkslategray3': (121, 205, 205),
+        'darkslategray4': (82, 139, 139),
+        'darkturquoise': (0, 206, 209),
+        'darkviolet': (148, 0, 211),
+        'deeppink1': (255, 20, 147),
+        'deeppink2': (238, 18, 137),
+        'deeppink3': (205, 16, 118),
+        'deeppink4': (139, 10, 80),
+        'deepskyblue1': (0, 191, 255),
+        'deepskyblue2': (0, 178, 238),
+        'deepskyblue3': (0, 154, 205),
+        'deepskyblue4': (0, 104, 139),
+        'dimgray': (105, 105, 105),
+        'dimgray': (105, 105, 105),
+        'dodgerblue1': (30, 144, 255),
+        'dodgerblue2': (28, 134, 238),
+        'dodgerblue3': (24, 116, 205),
+        'dodgerblue4': (16, 78, 139),
+        'eggshell': (252, 230, 201),
+        'emeraldgreen': (0, 201, 87),
+        'firebrick': (178, 34, 34),
+        'firebrick1': (255, 48, 48),
+        'firebrick2': (238, 44, 44),
+        'firebrick3': (205, 38, 38),
+        'firebrick4': (139, 26, 26),
+        'flesh': (255, 125, 64),
+        'floralwhite': (255, 250, 240),
+        'forestgreen': (34, 139, 34),
+        'gainsboro': (220, 220, 220),
+        'ghostwhite': (248, 248, 255),
+        'gold1': (255, 215, 0),
+        'gold2': (238, 201, 0),
+        'gold3': (205, 173, 0),
+        'gold4': (139, 117, 0),
+        'goldenrod': (218, 165, 32),
+        'goldenrod1': (255, 193, 37),
+        'goldenrod2': (238, 180, 34),
+        'goldenrod3': (205, 155, 29),
+        'goldenrod4': (139, 105, 20),
+        'gray': (128, 128, 128),
+        'gray1': (3, 3, 3),
+        'gray10': (26, 26, 26),
+        'gray11': (28, 28, 28),
+        'gray12': (31, 31, 31),
+        'gray13': (33, 33, 33),
+        'gray14': (36, 36, 36),
+        'gray15': (38, 38, 38),
+        'gray16': (41, 41, 41),
+        'gray17': (43, 43, 43),
+        'gray18': (46, 46, 46),
+        'gray19': (48, 48, 48),
+        'gray2': (5, 5, 5),
+        'gray20': (51, 51, 51),
+        'gray21': (54, 54, 54),
+        'gray22': (56, 56, 56),
+        'gray23': (59, 59, 59),
+        'gray24': (61, 61, 61),
+        'gray25': (64, 64, 64),
+        'gray26': (66, 66, 66),
+        'gray27': (69, 69, 69),
+        'gray28': (71, 71, 71),
+        'gray29': (74, 74, 74),
+        'gray3': (8, 8, 8),
+        'gray30': (77, 77, 77),
+        'gray31': (79, 79, 79),
+        'gray32': (82, 82, 82),
+        'gray33': (84, 84, 84),
+        'gray34': (87, 87, 87),
+        'gray35': (89, 89, 89),
+        'gray36': (92, 92, 92),
+        'gray37': (94, 94, 94),
+        'gray38': (97, 97, 97),
+        'gray39': (99, 99, 99),
+        'gray4': (10, 10, 10),
+        'gray40': (102, 102, 102),
+        'gray42': (107, 107, 107),
+        'gray43': (110, 110, 110),
+        'gray44': (112, 112, 112),
+        'gray45': (115, 115, 115),
+        'gray46': (117, 117, 117),
+        'gray47': (120, 120, 120),
+        'gray48': (122, 122, 122),
+        'gray49': (125, 125, 125),
+        'gray5': (13, 13, 13),
+        'gray50': (127, 127, 127),
+        'gray51': (130, 130, 130),
+        'gray52': (133, 133, 133),
+        'gray53': (135, 135, 135),
+        'gray54': (138, 138, 138),
+        'gray55': (140, 140, 140),
+        'gray56': (143, 143, 143),
+        'gray57': (145, 145, 145),
+        'gray58': (148, 148, 148),
+        'gray59': (150, 150, 150),
+        'gray6': (15, 15, 15),
+        'gray60': (153, 153, 153),
+        'gray61': (156, 156, 156),
+        'gray62': (158, 158, 158),
+        'gray63': (161, 161, 161),
+        'gray64': (163, 163, 163),
+        'gray65': (166, 166, 166),
+        'gray66': (168, 168, 168),
+        'gray67': (171, 171, 171),
+        'gray68': (173, 173, 173),
+        'gray69': (176, 176, 176),
+        'gray7': (18, 18, 18),
+        'gray70': (179, 179, 179),
+        'gray71': (181, 181, 181),
+        'gray72': (184, 184, 184),
+        'gray73': (186, 186, 186),
+        'gray74': (189, 189, 189),
+        'gray75': (191, 191, 191),
+        'gray76': (194, 194, 194),
+        'gray77': (196, 196, 196),
+        'gray78': (199, 199, 199),
+        'gray79': (201, 201, 201),
+        'gray8': (20, 20, 20),
+        'gray80': (204, 204, 204),
+        'gray81': (207, 207, 207),
+        'gray82': (209, 209, 209),
+        'gray83': (212, 212, 212),
+        'gray84': (214, 214, 214),
+        'gray85': (217, 217, 217),
+        'gray86': (219, 219, 219),
+        'gray87': (222, 222, 222),
+        'gray88': (224, 224, 224),
+        'gray89': (227, 227, 227),
+        'gray9': (23, 23, 23),
+        'gray90': (229, 229, 229),
+        'gray91': (232, 232, 232),
+        'gray92': (235, 235, 235),
+        'gray93': (237, 237, 237),
+        'gray94': (240, 240, 240),
+        'gray95': (242, 242, 242),
+        'gray97': (247, 247, 247),
+        'gray98': (250, 250, 250),
+        'gray99': (252, 252, 252),
+        'green': (0, 128, 0),
+        'green1': (0, 255, 0),
+        'green2': (0, 238, 0),
+        'green3': (0, 205, 0),
+        'green4': (0, 139, 0),
+        'greenyellow': (173, 255, 47),
+        'honeydew1': (240, 255, 240),
+        'honeydew2': (224, 238, 224),
+        'honeydew3': (193, 205, 193),
+        'honeydew4': (131, 139, 131),
+        'hotpink': (255, 105, 180),
+        'hotpink1': (255, 110, 180),
+        'hotpink2': (238, 106, 167),
+        'hotpink3': (205, 96, 144),
+        'hotpink4': (139, 58, 98),
+        'indianred': (176, 23, 31),
+        'indianred': (205, 92, 92),
+        'indianred1': (255, 106, 106),
+        'indianred2': (238, 99, 99),
+        'indianred3': (205, 85, 85),
+        'indianred4': (139, 58, 58),
+        'indigo': (75, 0, 130),
+        'ivory1': (255, 255, 240),
+        'ivory2': (238, 238, 224),
+        'ivory3': (205, 205, 193),
+        'ivory4': (139, 139, 131),
+        'ivoryblack': (41, 36, 33),
+        'khaki': (240, 230, 140),
+        'khaki1': (255, 246, 143),
+        'khaki2': (238, 230, 133),
+        'khaki3': (205, 198, 115),
+        'khaki4': (139, 134, 78),
+        'lavender': (230, 230, 250),
+        'lavenderblush1': (255, 240, 245),
+        'lavenderblush2': (238, 224, 229),
+        'lavenderblush3': (205, 193, 197),
+        'lavenderblush4': (139, 131, 134),
+        'lawngreen': (124, 252, 0),
+        'lemonchiffon1': (255, 250, 205),
+        'lemonchiffon2': (238, 233, 191),
+        'lemonchiffon3': (205, 201, 165),
+        'lemonchiffon4': (139, 137, 112),
+        'lightblue': (173, 216, 230),
+        'lightblue1': (191, 239, 255),
+        'lightblue2': (178, 223, 238),
+        'lightblue3': (154, 192, 205),
+        'lightblue4': (104, 131, 139),
+        'lightcoral': (240, 128, 128),
+        'lightcyan1': (224, 255, 255),
+        'lightcyan2': (209, 238, 238),
+        'lightcyan3': (180, 205, 205),
+        'lightcyan4': (122, 139, 139),
+        'lightgoldenrod1': (255, 236, 139),
+        'lightgoldenrod2': (238, 220, 130),
+        'lightgoldenrod3': (205, 190, 112),
+        'lightgoldenrod4': (139, 129, 76),
+        'lightgoldenrodyellow': (250, 250, 210),
+        'lightgrey': (211, 211, 211),
+        'lightpink': (255, 182, 193),
+        'lightpink1': (255, 174, 185),
+        'lightpink2': (238, 162, 173),
+        'lightpink3': (205, 140, 149),
+        'lightpink4': (139, 95, 101),
+        'lightsalmon1': (255, 160, 122),
+        'lightsalmon2': (238, 149, 114),
+        'lightsalmon3': (205, 129, 98),
+        'lightsalmon4': (139, 87, 66),
+        'lightseagreen': (32, 178, 170),
+        'lightskyblue': (135, 206, 250),
+        'lightskyblue1': (176, 226, 255),
+        'lightskyblue2': (164, 211, 238),
+        'lightskyblue3': (141, 182, 205),
+        'lightskyblue4': (96, 123, 139),
+        'lightslateblue': (132, 112, 255),
+        'lightslategray': (119, 136, 153),
+        'lightsteelblue': (176, 196, 222),
+        'lightsteelblue1': (202, 225, 255),
+        'lightsteelblue2': (188, 210, 238),
+        'lightsteelblue3': (162, 181, 205),
+        'lightsteelblue4': (110, 123, 139),
+        'lightyellow1': (255, 255, 224),
+        'lightyellow2': (238, 238, 209),
+        'lightyellow3': (205, 205, 180),
+        'lightyellow4': (139, 139, 122),
+        'limegreen': (50, 205, 50),
+        'linen': (250, 240, 230),
+        'magenta': (255, 0, 255),
+        'magenta2': (238, 0, 238),
+        'magenta3': (205, 0, 205),
+        'magenta4': (139, 0, 139),
+        'manganeseblue': (3, 168, 158),
+        'maroon': (128, 0, 0),
+        'maroon1': (255, 52, 179),
+        'maroon2': (238, 48, 167),
+        'maroon3': (205, 41, 144),
+        'maroon4': (139, 28, 98),
+        'mediumorchid': (186, 85, 211),
+        'mediumorchid1': (224, 102, 255),
+        'mediumorchid2': (209, 95, 238),
+        'mediumorchid3': (180, 82, 205),
+        'mediumorchid4': (122, 55, 139),
+        'mediumpurple': (147, 112, 219),
+        'mediumpurple1': (171, 130, 255),
+        'mediumpurple2': (159, 121, 238),
+        'mediumpurple3': (137, 104, 205),
+        'mediumpurple4': (93, 71, 139),
+        'mediumseagreen': (60, 179, 113),
+        'mediumslateblue': (123, 104, 238),
+        'mediumspringgreen': (0, 250, 154),
+        'mediumturquoise': (72, 209, 204),
+        'mediumvioletred': (199, 21, 133),
+        'melon': (227, 168, 105),
+        'midnightblue': (25, 25, 112),
+        'mint': (189, 252, 201),
+        'mintcream': (245, 255, 250),
+        'mistyrose1': (255, 228, 225),
+        'mistyrose2': (238, 213, 210),
+        'mistyrose3': (205, 183, 181),
+        'mistyrose4': (139, 125, 123),
+        'moccasin': (255, 228, 181),
+        'navajowhite1': (255, 222, 173),
+        'navajowhite2': (238, 207, 161),
+        'navajowhite3': (205, 179, 139),
+        'navajowhite4': (139, 121, 94),
+        'navy': (0, 0, 128),
+        'oldlace': (253, 245, 230),
+        'olive': (128, 128, 0),
+        'olivedrab': (107, 142, 35),
+        'olivedrab1': (192, 255, 62),
+        'olivedrab2': (179, 238, 58),
+        'olivedrab3': (154, 205, 50),
+        'olivedrab4': (105, 139, 34),
+        'orange': (255, 128, 0),
+        'orange1': (255, 165, 0),
+        'orange2': (238, 154, 0),
+        'orange3': (205, 133, 0),
+        'orange4': (139, 90, 0),
+        'orangered1': (255, 69, 0),
+        'orangered2': (238, 64, 0),
+        'orangered3': (205, 55, 0),
+        'orangered4': (139, 37, 0),
+        'orchid': (218, 112, 214),
+        'orchid1': (255, 131, 250),
+        'orchid2': (238, 122, 233),
+        'orchid3': (205, 105, 201),
+        'orchid4': (139, 71, 137),
+        'palegoldenrod': (238, 232, 170),
+        'palegreen': (152, 251, 152),
+        'palegreen1': (154, 255, 154),
+        'palegreen2': (144, 238, 144),
+        'palegreen3': (124, 205, 124),
+        'palegreen4': (84, 139, 84),
+        'paleturquoise1': (187, 255, 255),
+        'paleturquoise2': (174, 238, 238),
+        'paleturquoise3': (150, 205, 205),
+        'paleturquoise4': (102, 139, 139),
+        'palevioletred': (219, 112, 147),
+        'palevioletred1': (255, 130, 171),
+        'palevioletred2': (238, 121, 159),
+        'palevioletred3': (205, 104, 137),
+        'palevioletred4': (139, 71, 93),
+        'papayawhip': (255, 239, 213),
+        'peachpuff1': (255, 218, 185),
+        'peachpuff2': (238, 203, 173),
+        'peachpuff3': (205, 175, 149),
+        'peachpuff4': (139, 119, 101),
+        'peacock': (51, 161, 201),
+        'pink': (255, 192, 203),
+        'pink1': (255, 181, 197),
+        'pink2': (238, 169, 184),
+        'pink3': (205, 145, 158),
+        'pink4': (139, 99, 108),
+        'plum': (221, 160, 221),
+        'plum1': (255, 187, 255),
+        'plum2': (238, 174, 238),
+        'plum3': (205, 150, 205),
+        'plum4': (139, 102, 139),
+        'powderblue': (176, 224, 230),
+        'purple': (128, 0, 128),
+        'purple1': (155, 48, 255),
+        'purple2': (145, 44, 238),
+        'purple3': (125, 38, 205),
+        'purple4': (85, 26, 139),
+        'raspberry': (135, 38, 87),
+        'rawsienna': (199, 97, 20),
+        'red1': (255, 0, 0),
+        'red2': (238, 0, 0),
+        'red3': (205, 0, 0),
+        'red4': (139, 0, 0),
+        'rosybrown': (188, 143, 143),
+        'rosybrown1': (255, 193, 193),
+        'rosybrown2': (238, 180, 180),
+        'rosybrown3': (205, 155, 155),
+        'rosybrown4': (139, 105, 105),
+        'royalblue': (65, 105, 225),
+        'royalblue1': (72, 118, 255),
+        'royalblue2': (67, 110, 238),
+        'royalblue3': (58, 95, 205),
+        'royalblue4': (39, 64, 139),
+        'salmon': (250, 128, 114),
+        'salmon1': (255, 140, 105),
+        'salmon2': (238, 130, 98),
+        'salmon3': (205, 112, 84),
+        'salmon4': (139, 76, 57),
+        'sandybrown': (244, 164, 96),
+        'sapgreen': (48, 128, 20),
+        'seagreen1': (84, 255, 159),
+        'seagreen2': (78, 238, 148),
+        'seagreen3': (67, 205, 128),
+        'seagreen4': (46, 139, 87),
+        'seashell1': (255, 245, 238),
+        'seashell2': (238, 229, 222),
+        'seashell3': (205, 197, 191),
+        'seashell4': (139, 134, 130),
+        'sepia': (94, 38, 18),
+        'sgibeet': (142, 56, 142),
+        'sgibrightgray': (197, 193, 170),
+        'sgichartreuse': (113, 198, 113),
+        'sgidarkgray': (85, 85, 85),
+        'sgigray12': (30, 30, 30),
+        'sgigray16': (40, 40, 40),
+        'sgigray32': (81, 81, 81),
+        'sgigray36': (91, 91, 91),
+        'sgigray52': (132, 132, 132),
+        'sgigray56': (142, 142, 142),
+        'sgigray72': (183, 183, 183),
+        'sgigray76': (193, 193, 193),
+        'sgigray92': (234, 234, 234),
+        'sgigray96': (244, 244, 244),
+        'sgilightblue': (125, 158, 192),
+        'sgilightgray': (170, 170, 170),
+        'sgiolivedrab': (142, 142, 56),
+        'sgisalmon': (198, 113, 113),
+        'sgislateblue': (113, 113, 198),
+        'sgiteal': (56, 142, 142),
+        'sienna': (160, 82, 45),
+        'sienna1': (255, 130, 71),
+        'sienna2': (238, 121, 66),
+        'sienna3': (205, 104, 57),
+        'sienna4': (139, 71, 38),
+        'silver': (192, 192, 192),
+        'skyblue': (135, 206, 235),
+        'skyblue1': (135, 206, 255),
+        'skyblue2': (126, 192, 238),
+        'skyblue3': (108, 166, 205),
+        'skyblue4': (74, 112, 139),
+        'slateblue': (106, 90, 205),
+        'slateblue1': (131, 111, 255),
+        'slateblue2': (122, 103, 238),
+        'slateblue3': (105, 89, 205),
+        'slateblue4': (71, 60, 139),
+        'slategray': (112, 128, 144),
+        'slategray1': (198, 226, 255),
+        'slategray2': (185, 211, 238),
+        'slategray3': (159, 182, 205),
+        'slategray4': (108, 123, 139),
+        'snow1': (255, 250, 250),
+        'snow2': (238, 233, 233),
+        'snow3': (205, 201, 201),
+        'snow4': (139, 137, 137),
+        'springgreen': (0, 255, 127),
+        'springgreen1': (0, 238, 118),
+        'springgreen2': (0, 205, 102),
+        'springgreen3': (0, 139, 69),
+        'steelblue': (70, 130, 180),
+        'steelblue1': (99, 184, 255),
+        'steelblue2': (92, 172, 238),
+        'steelblue3': (79, 148, 205),
+        'steelblue4': (54, 100, 139),
+        'tan': (210, 180, 140),
+        'tan1': (255, 165, 79),
+        'tan2': (238, 154, 73),
+        'tan3': (205, 133, 63),
+        'tan4': (139, 90, 43),
+        'teal': (0, 128, 128),
+        'thistle': (216, 191, 216),
+        'thistle1': (255, 225, 255),
+        'thistle2': (238, 210, 238),
+        'thistle3': (205, 181, 205),
+        'thistle4': (139, 123, 139),
+        'tomato1': (255, 99, 71),
+        'tomato2': (238, 92, 66),
+        'tomato3': (205, 79, 57),
+        'tomato4': (139, 54, 38),
+        'turquoise': (64, 224, 208),
+        'turquoise1': (0, 245, 255),
+        'turquoise2': (0, 229, 238),
+        'turquoise3': (0, 197, 205),
+        'turquoise4': (0, 134, 139),
+        'turquoiseblue': (0, 199, 140),
+        'violet': (238, 130, 238),
+        'violetred': (208, 32, 144),
+        'violetred1': (255, 62, 150),
+        'violetred2': (238, 58, 140),
+        'violetred3': (205, 50, 120),
+        'violetred4': (139, 34, 82),
+        'warmgrey': (128, 128, 105),
+        'wheat': (245, 222, 179),
+        'wheat1': (255, 231, 186),
+        'wheat2': (238, 216, 174),
+        'wheat3': (205, 186, 150),
+        'wheat4': (139, 126, 102),
+        'white': (255, 255, 255),
+        'whitesmoke': (245, 245, 245),
+        'whitesmoke': (245, 245, 245),
+        'yellow1': (255, 255, 0),
+        'yellow2': (238, 238, 0),
+        'yellow3': (205, 205, 0),
+        'yellow4': (139, 139, 0)
+    }
+
+    return color_map
+
+def build_ordered_colors():
+    """Builds the list of color names in the order colors are assigned to squares.
+
+    Returns:
+        A list of color names.
+    """
+
+    ordered_colors = [
+        'white',
+        'black',
+        'red',
+        'lime',
+        'blue',
+        'yellow',
+        'cyan',
+        'magenta',
+        'silver',
+        'gray',
+        'maroon',
+        'olive',
+        'green',
+        'purple',
+        'teal',
+        'navy',
+        'gray48',
+        'lightskyblue3',
+        'gray6',
+        'snow4',
+        'antiquewhite2',
+        'lightyellow3',
+        'cornsilk2',
+        'gray54',
+        'maroon3',
+        'palegreen',
+        'cyan3',
+        'navajowhite4',
+        'gray43',
+        'orange',
+        'orangered3',
+        'orangered1',
+        'lemonchiffon3',
+        'deepskyblue1',
+        'turquoise4',
+        'azure1',
+        'thistle2',
+        'olivedrab3',
+        'honeydew3',
+        'gray83',
+        'chartreuse1',
+        'cadetblue3',
+        'khaki',
+        'skyblue3',
+        'turquoise3',
+        'lawngreen',
+        'gold3',
+        'indianred3',
+        'orange2',
+        'gray36',
+        'deeppink1',
+        'seashell4',
+        'plum4',
+        'navajowhite1',
+        'mediumslateblue',
+        'peacock',
+        'violetred3',
+        'khaki3',
+        'salmon4',
+        'burntsienna',
+        'dodgerblue1',
+        'gray22',
+        'gray29',
+        'red2',
+        'azure2',
+        'red3',
+        'lightgrey',
+        'gray74',
+        'darkolivegreen1',
+        'wheat1',
+        'darkgoldenrod',
+        'firebrick4',
+        'gray62',
+        'darkviolet',
+        'aquamarine2',
+        'darkolivegreen',
+        'palegreen3',
+        'green3',
+        'gray44',
+        'olivedrab2',
+        'gray34',
+        'gray17',
+        'gray92',
+        'palevioletred1',
+        'seashell2',
+        'carrot',
+        'salmon2',
+        'olivedrab',
+        'sgigray56',
+        'burntumber',
+        'dodgerblue3',
+        'gray64',
+        'snow3',
+        'sgigray12',
+        'seagreen3',
+        'royalblue',
+        'violetred1',
+        'mistyrose3',
+        'cornsilk1',
+        'plum3',
+        'forestgreen',
+        'coldgrey',
+        'mediumorchid',
+        'maroon4',
+        'slategray',
+        'sgiolivedrab',
+        'tan3',
+        'dimgray',
+        'gray97',
+        'rosybrown',
+        'greenyellow',
+        'maroon2',
+        'darkorange4',
+        'lavender',
+        'gray89',
+        'olivedrab1',
+        'darkslategray',
+        'gray50',
+        'cadmiumorange',
+        'lightsteelblue2',
+        'lightslateblue',
+        'cobalt',
+        'burlywood2',
+        'lightsteelblue4',
+        'violetred2',
+        'gray84',
+        'thistle4',
+        'darkolivegreen3',
+        'darkslateblue',
+        'emeraldgreen',
+        'sgichartreuse',
+        'darkorchid2',
+        'plum2',
+        'lightyellow1',
+        'springgreen',
+        'darkslategray3',
+        'sgiteal',
+        'lightsalmon4',
+        'yellow3',
+        'turquoiseblue',
+        'orange4',
+        'tan4',
+        'mistyrose2',
+        'mistyrose1',
+        'ivory3',
+        'gray91',
+        'lightgoldenrodyellow',
+        'chartreuse2',
+        'crimson',
+        'lightcoral',
+        'gray13',
+        'oldlace',
+        'lightsalmon1',
+        'rosybrown1',
+        'seagreen1',
+        'magenta3',
+        'limegreen',
+        'gray72',
+        'gray24',
+        'lightseagreen',
+        'hotpink2',
+        'hotpink3',
+        'brown2',
+        'lightpink2',
+        'gray52',
+        'lavenderblush3',
+        'brown4',
+        'lightskyblue2',
+        'eggshell',
+        'palegreen2',
+        'brown1',
+        'turquoise2',
+        'bisque1',
+        'gray94',
+        'salmon3',
+        'gray40',
+        'lightblue4',
+        'lightsteelblue',
+        'gray31',
+        'palevioletred3',
+        'gray87',
+        'sgislateblue',
+        'hotpink',
+        'violet',
+        'gray77',
+        'darkorange1',
+        'gray85',
+        'sgibrightgray',
+        'thistle1',
+        'lavenderblush4',
+        'goldenrod4',
+        'gray12',
+        'manganeseblue',
+        'purple1',
+        'yellow2',
+        'firebrick3',
+        'gray66',
+        'rosybrown2',
+        'lightpink',
+        'mediumpurple2',
+        'aquamarine3',
+        'beige',
+        'skyblue2',
+        'snow2',
+        'melon',
+        'gray90',
+        'tan',
+        'gray78',
+        'linen',
+        'firebrick',
+        'mistyrose4',
+        'royalblue2',
+        'maroon1',
+        'ghostwhite',
+        'plum1',
+        'gray38',
+        'antiquewhite',
+        'gray47',
+        'purple3',
+        'gray88',
+        'slategray1',
+        'darkorchid1',
+        'gray95',
+        'papayawhip',
+        'gray81',
+        'gray53',
+        'darkgoldenrod2',
+        'darkgreen',
+        'gray11',
+        'slategray4',
+        'darkgoldenrod1',
+        'banana',
+        'lightcyan3',
+        'gray21',
+        'red1',
+        'gray51',
+        'gray4',
+        'green4',
+        'darkturquoise',
+        'lightgoldenrod3',
+        'salmon1',
+        'lightskyblue1',
+        'gray23',
+        'gold4',
+        'gray25',
+        'sienna',
+        'indianred1',
+        'gray70',
+        'tomato3',
+        'tan1',
+        'gray76',
+        'brick',
+        'sienna3',
+        'gray27',
+        'azure4',
+        'lightsteelblue1',
+        'yellow1',
+        'lemonchiffon4',
+        'gray69',
+        'gray65',
+        'gray63',
+        'magenta4',
+        'pink',
+        'palevioletred',
+        'gray19',
+        'lightpink1',
+        'rawsienna',
+        'palevioletred2',
+        'mediumvioletred',
+        'gray86',
+        'seagreen4',
+        'darkorchid4',
+        'honeydew2',
+        'slateblue2',
+        'cadetblue1',
+        'purple2',
+        'gray30',
+        'pink1',
+        'bisque4',
+        'springgreen3',
+        'orange1',
+        'goldenrod2',
+        'deeppink2',
+        'violetred',
+        'lightcyan4',
+        'steelblue4',
+        'cadetblue2',
+        'coral2',
+        'brown',
+        'aliceblue',
+        'cornflowerblue',
+        'royalblue3',
+        'gray98',
+        'gray18',
+        'ivoryblack',
+        'lightpink3',
+        'lightpink4',
+        'gray60',
+        'skyblue1',
+        'plum',
+        'gray71',
+        'magenta2',
+        'gray55',
+        'pink2',
+        'orchid',
+        'hotpink1',
+        'gray9',
+        'lightcyan1',
+        'sgibeet',
+        'salmon',
+        'wheat3',
+        'bisque3',
+        'lightblue',
+        'honeydew1',
+        'azure3',
+        'slateblue1',
+        'navajowhite2',
+        'gray20',
+        'slateblue',
+        'tomato4',
+        'mediumorchid1',
+        'orchid2',
+        'steelblue2',
+        'wheat4',
+        'skyblue4',
+        'paleturquoise1',
+        'darkorchid',
+        'warmgrey',
+        'mediumspringgreen',
+        'deepskyblue2',
+        'blue3',
+        'lightyellow4',
+        'gray16',
+        'pink3',
+        'darkolivegreen4',
+        'ivory2',
+        'darkslategray4',
+        'deepskyblue4',
+        'darkseagreen4',
+        'sienna2',
+        'darkseagreen',
+        'hotpink4',
+        'paleturquoise4',
+        'turquoise',
+        'moccasin',
+        'cadetblue4',
+        'indianred2',
+        'cyan4',
+        'darkkhaki',
+        'lightsalmon2',
+        'lavenderblush1',
+        'peachpuff2',
+        'gray42',
+        'gray57',
+        'chartreuse4',
+        'darkseagreen1',
+        'darkgoldenrod4',
+        'darkslategray2',
+        'burlywood',
+        'gray45',
+        'springgreen2',
+        'sgigray52',
+        'thistle3',
+        'gray3',
+        'palegreen4',
+        'firebrick2',
+        'seagreen2',
+        'coral4',
+        'gray79',
+        'burlywood4',
+        'sepia',
+        'gray73',
+        'sgigray16',
+        'red4',
+        'darkorange',
+        'darkgoldenrod3',
+        'goldenrod3',
+        'paleturquoise2',
+        'rosybrown4',
+        'lightyellow2',
+        'orange3',
+        'gray8',
+        'bisque2',
+        'palegreen1',
+        'sgigray96',
+        'brown3',
+        'darkorange2',
+        'coral1',
+        'lavenderblush2',
+        'indigo',
+        'whitesmoke',
+        'dodgerblue4',
+        'darkslategray1',
+        'cadetblue',
+        'gray32',
+        'gray14',
+        'aqua',
+        'gray35',
+        'ivory1',
+        'darksalmon',
+        'gray28',
+        'darkorange3',
+        'dodgerblue2',
+        'sgigray92',
+        'cornsilk3',
+        'gray56',
+        'raspberry',
+        'floralwhite',
+        'mediumpurple4',
+        'seashell3',
+        'palegoldenrod',
+        'orangered2',
+        'gray59',
+        'gray61',
+        'sgigray32',
+        'coral3',
+        'burlywood1',
+        'snow1',
+        'deepskyblue3',
+        'gray93',
+        'seashell1',
+        'indianred',
+        'gray2',
+        'mint',
+        'lightsteelblue3',
+        'blue4',
+        'darkorchid3',
+        'gray46',
+        'gray15',
+        'purple4',
+        'aquamarine1',
+        'royalblue4',
+        'blueviolet',
+        'lightgoldenrod2',
+        'sienna4',
+        'tomato1',
+        'khaki4',
+        'mediumpurple3',
+        'mediumpurple1',
+        'gray80',
+        'olivedrab4',
+        'gray10',
+        'gray5',
+        'deeppink4',
+        'antiquewhite1',
+        'peachpuff1',
+        'deeppink3',
+        'turquoise1',
+        'gray99',
+        'chocolate4',
+        'peachpuff3',
+        'slategray3',
+        'lightgoldenrod1',
+        'wheat2',
+        'gray49',
+        'paleturquoise3',
+        'lightcyan2',
+        'sienna1',
+        'blanchedalmond',
+        'gray7',
+        'lightskyblue',
+        'chocolate3',
+        'thistle',
+        'green2',
+        'firebrick1',
+        'green1',
+        'darkseagreen2',
+        'gray75',
+        'gold2',
+        'lightsalmon3',
+        'mediumseagreen',
+        'midnightblue',
+        'mediumorchid2',
+        'lightslategray',
+        'sgilightgray',
+        'navajowhite3',
+        'chartreuse3',
+        'palevioletred4',
+        'lightblue3',
+        'coral',
+        'sgisalmon',
+        'khaki1',
+        'cadmiumyellow',
+        'lightblue2',
+        'gray39',
+        'darkolivegreen2',
+        'yellow4',
+        'mediumturquoise',
+        'sgidarkgray',
+        'lightskyblue4',
+        'antiquewhite4',
+        'goldenrod',
+        'blue2',
+        'burlywood3',
+        'orangered4',
+        'ivory4',
+        'khaki2',
+        'peachpuff4',
+        'chocolate2',
+        'slategray2',
+        'sandybrown',
+        'pink4',
+        'mediumpurple',
+        'steelblue1',
+        'gray26',
+        'indianred4',
+        'lemonchiffon2',
+        'chocolate1',
+        'lightblue1',
+        'sapgreen',
+        'darkgray',
+        'gray82',
+        'royalblue1',
+        'aquamarine4',
+        'gainsboro',
+        'mediumorchid3',
+        'tomato2',
+        'honeydew4',
+        'cobaltgreen',
+        'gray1',
+        'gray68',
+        'steelblue3',
+        'orchid4',
+        'gray67',
+        'slateblue3',
+        'antiquewhite3',
+        'sgigray72',
+        'cornsilk4',
+        'lightgoldenrod4',
+        'gold1',
+        'sgilightblue',
+        'violetred4',
+        'orchid3',
+        'gray33',
+        'chocolate',
+        'wheat',
+        'tan2',
+        'steelblue',
+        'lemonchiffon1',
+        'gray58',
+        'slateblue4',
+        'mediumorchid4',
+        'rosybrown3',
+        'powderblue',
+        'cyan2',
+        'goldenrod1',
+        'darkseagreen3',
+        'sgigray76',
+        'orchid1',
+        'flesh',
+        'mintcream',
+        'skyblue',
+        'sgigray36',
+        'gray37',
+        'springgreen1'
+    ]
+
+    return ordered_colors
+
+def __getattr__(name):
+    """Builds the color tables the first time they are accessed.
+
+    COLOR_MAP, ORDERED_COLORS, and COLORS are only needed for display,
+    so they are not built when the simulation runs headless.
+
+    Arguments:
+        name(str): The name of the module attribute being accessed.
+
+    Returns:
+        The value of the attribute.
+    """
+
+    if name == 'COLOR_MAP':
+        value = build_color_map()
+    elif name == 'ORDERED_COLORS':
+        value = build_ordered_colors()
+    elif name == 'COLORS':
+        module = sys.modules[__name__]
+        value = [module.COLOR_MAP[color] for color in module.ORDERED_COLORS]
+    else:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, name))
 
-ORDERED_COLORS = [
-    'white',
-    'black',
-    'red',
-    'lime',
-    'blue',
-    'yellow',
-    'cyan',
-    'magenta',
-    'silver',
-    'gray',
-    'maroon',
-    'olive',
-    'green',
-    'purple',
-    'teal',
-    'navy',
-    'gray48',
-    'lightskyblue3',
-    'gray6',
-    'snow4',
-    'antiquewhite2',
-    'lightyellow3',
-    'cornsilk2',
-    'gray54',
-    'maroon3',
-    'palegreen',
-    'cyan3',
-    'navajowhite4',
-    'gray43',
-    'orange',
-    'orangered3',
-    'orangered1',
-    'lemonchiffon3',
-    'deepskyblue1',
-    'turquoise4',
-    'azure1',
-    'thistle2',
-    'olivedrab3',
-    'honeydew3',
-    'gray83',
-    'chartreuse1',
-    'cadetblue3',
-    'khaki',
-    'skyblue3',
-    'turquoise3',
-    'lawngreen',
-    'gold3',
-    'indianred3',
-    'orange2',
-    'gray36',
-    'deeppink1',
-    'seashell4',
-    'plum4',
-    'navajowhite1',
-    'mediumslateblue',
-    'peacock',
-    'violetred3',
-    'khaki3',
-    'salmon4',
-    'burntsienna',
-    'dodgerblue1',
-    'gray22',
-    'gray29',
-    'red2',
-    'azure2',
-    'red3',
-    'lightgrey',
-    'gray74',
-    'darkolivegreen1',
-    'wheat1',
-    'darkgoldenrod',
-    'firebrick4',
-    'gray62',
-    'darkviolet',
-    'aquamarine2',
-    'darkolivegreen',
-    'palegreen3',
-    'green3',
-    'gray44',
-    'olivedrab2',
-    'gray34',
-    'gray17',
-    'gray92',
-    'palevioletred1',
-    'seashell2',
-    'carrot',
-    'salmon2',
-    'olivedrab',
-    'sgigray56',
-    'burntumber',
-    'dodgerblue3',
-    'gray64',
-    'snow3',
-    'sgigray12',
-    'seagreen3',
-    'royalblue',
-    'violetred1',
-    'mistyrose3',
-    'cornsilk1',
-    'plum3',
-    'forestgreen',
-    'coldgrey',
-    'mediumorchid',
-    'maroon4',
-    'slategray',
-    'sgiolivedrab',
-    'tan3',
-    'dimgray',
-    'gray97',
-    'rosybrown',
-    'greenyellow',
-    'maroon2',
-    'darkorange4',
-    'lavender',
-    'gray89',
-    'olivedrab1',
-    'darkslategray',
-    'gray50',
-    'cadmiumorange',
-    'lightsteelblue2',
-    'lightslateblue',
-    'cobalt',
-    'burlywood2',
-    'lightsteelblue4',
-    'violetred2',
-    'gray84',
-    'thistle4',
-    'darkolivegreen3',
-    'darkslateblue',
-    'emeraldgreen',
-    'sgichartreuse',
-    'darkorchid2',
-    'plum2',
-    'lightyellow1',
-    'springgreen',
-    'darkslategray3',
-    'sgiteal',
-    'lightsalmon4',
-    'yellow3',
-    'turquoiseblue',
-    'orange4',
-    'tan4',
-    'mistyrose2',
-    'mistyrose1',
-    'ivory3',
-    'gray91',
-    'lightgoldenrodyellow',
-    'chartreuse2',
-    'crimson',
-    'lightcoral',
-    'gray13',
-    'oldlace',
-    'lightsalmon1',
-    'rosybrown1',
-    'seagreen1',
-    'magenta3',
-    'limegreen',
-    'gray72',
-    'gray24',
-    'lightseagreen',
-    'hotpink2',
-    'hotpink3',
-    'brown2',
-    'lightpink2',
-    'gray52',
-    'lavenderblush3',
-    'brown4',
-    'lightskyblue2',
-    'eggshell',
-    'palegreen2',
-    'brown1',
-    'turquoise2',
-    'bisque1',
-    'gray94',
-    'salmon3',
-    'gray40',
-    'lightblue4',
-    'lightsteelblue',
-    'gray31',
-    'palevioletred3',
-    'gray87',
-    'sgislateblue',
-    'hotpink',
-    'violet',
-    'gray77',
-    'darkorange1',
-    'gray85',
-    'sgibrightgray',
-    'thistle1',
-    'lavenderblush4',
-    'goldenrod4',
-    'gray12',
-    'manganeseblue',
-    'purple1',
-    'yellow2',
-    'firebrick3',
-    'gray66',
-    'rosybrown2',
-    'lightpink',
-    'mediumpurple2',
-    'aquamarine3',
-    'beige',
-    'skyblue2',
-    'snow2',
-    'melon',
-    'gray90',
-    'tan',
-    'gray78',
-    'linen',
-    'firebrick',
-    'mistyrose4',
-    'royalblue2',
-    'maroon1',
-    'ghostwhite',
-    'plum1',
-    'gray38',
-    'antiquewhite',
-    'gray47',
-    'purple3',
-    'gray88',
-    'slategray1',
-    'darkorchid1',
-    'gray95',
-    'papayawhip',
-    'gray81',
-    'gray53',
-    'darkgoldenrod2',
-    'darkgreen',
-    'gray11',
-    'slategray4',
-    'darkgoldenrod1',
-    'banana',
-    'lightcyan3',
-    'gray21',
-    'red1',
-    'gray51',
-    'gray4',
-    'green4',
-    'darkturquoise',
-    'lightgoldenrod3',
-    'salmon1',
-    'lightskyblue1',
-    'gray23',
-    'gold4',
-    'gray25',
-    'sienna',
-    'indianred1',
-    'gray70',
-    'tomato3',
-    'tan1',
-    'gray76',
-    'brick',
-    'sienna3',
-    'gray27',
-    'azure4',
-    'lightsteelblue1',
-    'yellow1',
-    'lemonchiffon4',
-    'gray69',
-    'gray65',
-    'gray63',
-    'magenta4',
-    'pink',
-    'palevioletred',
-    'gray19',
-    'lightpink1',
-    'rawsienna',
-    'palevioletred2',
-    'mediumvioletred',
-    'gray86',
-    'seagreen4',
-    'darkorchid4',
-    'honeydew2',
-    'slateblue2',
-    'cadetblue1',
-    'purple2',
-    'gray30',
-    'pink1',
-    'bisque4',
-    'springgreen3',
-    'orange1',
-    'goldenrod2',
-    'deeppink2',
-    'violetred',
-    'lightcyan4',
-    'steelblue4',
-    'cadetblue2',
-    'coral2',
-    'brown',
-    'aliceblue',
-    'cornflowerblue',
-    'royalblue3',
-    'gray98',
-    'gray18',
-    'ivoryblack',
-    'lightpink3',
-    'lightpink4',
-    'gray60',
-    'skyblue1',
-    'plum',
-    'gray71',
-    'magenta2',
-    'gray55',
-    'pink2',
-    'orchid',
-    'hotpink1',
-    'gray9',
-    'lightcyan1',
-    'sgibeet',
-    'salmon',
-    'wheat3',
-    'bisque3',
-    'lightblue',
-    'honeydew1',
-    'azure3',
-    'slateblue1',
-    'navajowhite2',
-    'gray20',
-    'slateblue',
-    'tomato4',
-    'mediumorchid1',
-    'orchid2',
-    'steelblue2',
-    'wheat4',
-    'skyblue4',
-    'paleturquoise1',
-    'darkorchid',
-    'warmgrey',
-    'mediumspringgreen',
-    'deepskyblue2',
-    'blue3',
-    'lightyellow4',
-    'gray16',
-    'pink3',
-    'darkolivegreen4',
-    'ivory2',
-    'darkslategray4',
-    'deepskyblue4',
-    'darkseagreen4',
-    'sienna2',
-    'darkseagreen',
-    'hotpink4',
-    'paleturquoise4',
-    'turquoise',
-    'moccasin',
-    'cadetblue4',
-    'indianred2',
-    'cyan4',
-    'darkkhaki',
-    'lightsalmon2',
-    'lavenderblush1',
-    'peachpuff2',
-    'gray42',
-    'gray57',
-    'chartreuse4',
-    'darkseagreen1',
-    'darkgoldenrod4',
-    'darkslategray2',
-    'burlywood',
-    'gray45',
-    'springgreen2',
-    'sgigray52',
-    'thistle3',
-    'gray3',
-    'palegreen4',
-    'firebrick2',
-    'seagreen2',
-    'coral4',
-    'gray79',
-    'burlywood4',
-    'sepia',
-    'gray73',
-    'sgigray16',
-    'red4',
-    'darkorange',
-    'darkgoldenrod3',
-    'goldenrod3',
-    'paleturquoise2',
-    'rosybrown4',
-    'lightyellow2',
-    'orange3',
-    'gray8',
-    'bisque2',
-    'palegreen1',
-    'sgigray96',
-    'brown3',
-    'darkorange2',
-    'coral1',
-    'lavenderblush2',
-    'indigo',
-    'whitesmoke',
-    'dodgerblue4',
-    'darkslategray1',
-    'cadetblue',
-    'gray32',
-    'gray14',
-    'aqua',
-    'gray35',
-    'ivory1',
-    'darksalmon',
-    'gray28',
-    'darkorange3',
-    'dodgerblue2',
-    'sgigray92',
-    'cornsilk3',
-    'gray56',
-    'raspberry',
-    'floralwhite',
-    'mediumpurple4',
-    'seashell3',
-    'palegoldenrod',
-    'orangered2',
-    'gray59',
-    'gray61',
-    'sgigray32',
-    'coral3',
-    'burlywood1',
-    'snow1',
-    'deepskyblue3',
-    'gray93',
-    'seashell1',
-    'indianred',
-    'gray2',
-    'mint',
-    'lightsteelblue3',
-    'blue4',
-    'darkorchid3',
-    'gray46',
-    'gray15',
-    'purple4',
-    'aquamarine1',
-    'royalblue4',
-    'blueviolet',
-    'lightgoldenrod2',
-    'sienna4',
-    'tomato1',
-    'khaki4',
-    'mediumpurple3',
-    'mediumpurple1',
-    'gray80',
-    'olivedrab4',
-    'gray10',
-    'gray5',
-    'deeppink4',
-    'antiquewhite1',
-    'peachpuff1',
-    'deeppink3',
-    'turquoise1',
-    'gray99',
-    'chocolate4',
-    'peachpuff3',
-    'slategray3',
-    'lightgoldenrod1',
-    'wheat2',
-    'gray49',
-    'paleturquoise3',
-    'lightcyan2',
-    'sienna1',
-    'blanchedalmond',
-    'gray7',
-    'lightskyblue',
-    'chocolate3',
-    'thistle',
-    'green2',
-    'firebrick1',
-    'green1',
-    'darkseagreen2',
-    'gray75',
-    'gold2',
-    'lightsalmon3',
-    'mediumseagreen',
-    'midnightblue',
-    'mediumorchid2',
-    'lightslategray',
-    'sgilightgray',
-    'navajowhite3',
-    'chartreuse3',
-    'palevioletred4',
-    'lightblue3',
-    'coral',
-    'sgisalmon',
-    'khaki1',
-    'cadmiumyellow',
-    'lightblue2',
-    'gray39',
-    'darkolivegreen2',
-    'yellow4',
-    'mediumturquoise',
-    'sgidarkgray',
-    'lightskyblue4',
-    'antiquewhite4',
-    'goldenrod',
-    'blue2',
-    'burlywood3',
-    'orangered4',
-    'ivory4',
-    'khaki2',
-    'peachpuff4',
-    'chocolate2',
-    'slategray2',
-    'sandybrown',
-    'pink4',
-    'mediumpurple',
-    'steelblue1',
-    'gray26',
-    'indianred4',
-    'lemonchiffon2',
-    'chocolate1',
-    'lightblue1',
-    'sapgreen',
-    'darkgray',
-    'gray82',
-    'royalblue1',
-    'aquamarine4',
-    'gainsboro',
-    'mediumorchid3',
-    'tomato2',
-    'honeydew4',
-    'cobaltgreen',
-    'gray1',
-    'gray68',
-    'steelblue3',
-    'orchid4',
-    'gray67',
-    'slateblue3',
-    'antiquewhite3',
-    'sgigray72',
-    'cornsilk4',
-    'lightgoldenrod4',
-    'gold1',
-    'sgilightblue',
-    'violetred4',
-    'orchid3',
-    'gray33',
-    'chocolate',
-    'wheat',
-    'tan2',
-    'steelblue',
-    'lemonchiffon1',
-    'gray58',
-    'slateblue4',
-    'mediumorchid4',
-    'rosybrown3',
-    'powderblue',
-    'cyan2',
-    'goldenrod1',
-    'darkseagreen3',
-    'sgigray76',
-    'orchid1',
-    'flesh',
-    'mintcream',
-    'skyblue',
-    'sgigray36',
-    'gray37',
-    'springgreen1'
-]
+    globals()[name] = value
 
-COLORS = [COLOR_MAP[color] for color in ORDERED_COLORS]
+    return value
@@ -0,0 +1,239 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import queue
+import threading
+
+class Command:
+    """A Command is a request received on the control socket, waiting to be handled by the simulation."""
+
+    def __init__(self, name, args, future):
+        """Initializes the Command.
+
+        Arguments:
+            name(str): The name of the command (ex. "step").
+            args(list): The words after the name.
+            future(Future): The future which is resolved with the reply.
+        """
+
+        self.name = name
+        self.args = args
+        self.future = future
+
+    def get_int(self, index, default=None):
+        """Gets an integer argument, which may be in scientific notation.
+
+        Arguments:
+            index(int): The index of the argument.
+            default(int): The value if the argument is missing (None if it is required).
+
+        Returns:
+            The integer.
+        """
+
+        if index >= len(self.args):
+            if default is None:
+                raise Exception('Command "{}" requires argument {}'.format(self.name, index + 1))
+
+            return default
+
+        try:
+            return int(float(self.args[index]))
+        except ValueError:
+            raise Exception('Argument "{}" of command "{}" is not a number'.format(self.args[index], self.name))
+
+    def get_str(self, index):
+        """Gets a required string argument.
+
+        Arguments:
+            index(int): The index of the argument.
+
+        Returns:
+            The string.
+        """
+
+        if index >= len(self.args):
+            raise Exception('Command "{}" requires argument {}'.format(self.name, index + 1))
+
+        return self.args[index]
+
+    def reply(self, **result):
+        """Replies that the command succeeded.
+
+        Arguments:
+            result(dict): JSON-serializable values to include in the reply.
+        """
+
+        self.future.set_result(dict(ok=True, **result))
+
+    def fail(self, message):
+        """Replies that the command failed.
+
+        Arguments:
+            message(str): A description of the error.
+        """
+
+        self.future.set_result({'ok': False, 'error': message})
+
+
+def get_status(board, step, paused):
+    """Describes the state of a simulation for replies to commands.
+
+    Arguments:
+        board(Board): The Board.
+        step(int): The step the simulation is at.
+        paused(bool): True if the simulation is paused.
+
+    Returns:
+        A JSON-serializable dictionary with the step, whether the
+        simulation is paused or halted, and the statistics of the Board.
+    """
+
+    stats = board.stats
+
+    return {
+        'step': step,
+        'paused': paused,
+        'halted': board.is_halted(),
+        'num_visited': stats.num_visited,
+        'bounding_box': stats.bounding_box,
+        'color_counts': stats.color_counts
+    }
+
+class ControlServer:
+    """A ControlServer accepts commands for a running simulation on a local socket.
+
+    The server runs an asyncio event loop in a background thread.
+    Each client sends one command per line (ex. "step 1000") and
+    receives one JSON object per line in reply. Commands are put on
+    a queue which the simulation polls between batches of steps, so
+    the steps themselves are never slowed down, and the reply is sent
+    once the simulation has handled the command.
+
+    Commands are handled by the simulation, which typically supports:
+        pause, resume, step N, status (or stats), snapshot PATH,
+        png PATH [SCALE], display_frequency N, and quit.
+    """
+
+    def __init__(self, address):
+        """Starts the ControlServer.
+
+        Arguments:
+            address(str): A port number or "host:port" to listen on TCP
+                (host defaults to localhost), or otherwise the path of a
+                UNIX socket.
+        """
+
+        self.address = address
+        self.commands = queue.Queue()
+        self.loop = asyncio.new_event_loop()
+
+        started = concurrent.futures.Future()
+        self.thread = threading.Thread(target=self.serve, args=(started,), daemon=True)
+        self.thread.start()
+
+        # Raise errors such as the address being in use here
+        started.result()
+
+    def get_tcp_address(self):
+        """Parses the address as a TCP host and port.
+
+        Returns:
+            A tuple of the host and port (None if the address is a UNIX socket path).
+        """
+
+        host, _, port = self.address.rpartition(':')
+
+        if not port.isdigit():
+            return None
+
+        return host or '127.0.0.1', int(port)
+
+    def serve(self, started):
+        """Runs the event loop of the server (in the background thread).
+
+        Arguments:
+            started(Future): Resolved once the server is listening.
+        """
+
+        asyncio.set_event_loop(self.loop)
+        tcp_address = self.get_tcp_address()
+
+        try:
+            if tcp_address is not None:
+                server = self.loop.run_until_complete(asyncio.start_server(self.handle_client, *tcp_address))
+            else:
+                server = self.loop.run_until_complete(asyncio.start_unix_server(self.handle_client, self.address))
+        except Exception as error:
+            started.set_exception(error)
+            return
+
+        started.set_result(None)
+
+        self.loop.run_forever()
+
+        # Disconnect clients which are still connected
+        server.close()
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    async def handle_client(self, reader, writer):
+        """Reads commands from a client and writes the replies.
+
+        Arguments:
+            reader(StreamReader): The stream of commands.
+            writer(StreamWriter): The stream of replies.
+        """
+
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                words = line.decode().split()
+                if not words:
+                    continue
+
+                future = concurrent.futures.Future()
+                self.commands.put(Command(words[0].lower(), words[1:], future))
+                result = await asyncio.wrap_future(future)
+
+                writer.write((json.dumps(result) + '\n').encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # The client disconnected or the server is closing
+            pass
+        finally:
+            writer.close()
+
+    def poll(self):
+        """Gets the commands received since the last poll without waiting.
+
+        Returns:
+            A list of Commands, each of which must be replied to.
+        """
+
+        commands = []
+
+        while not self.commands.empty():
+            commands.append(self.commands.get_nowait())
+
+        return commands
+
+    def close(self):
+        """Fails any commands which were not handled and stops the server."""
+
+        for command in self.poll():
+            command.fail('The simulation has exited')
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+        if self.get_tcp_address() is None and os.path.exists(self.address):
+            os.remove(self.address)
@@ -0,0 +1,129 @@
+from collections import namedtuple
+
+import numpy as np
+
+from history import History
+
+# Fields of each change record, which are also the keys of each chunk of records
+DELTA_FIELDS = ('step', 'flea', 'row', 'col', 'old_color', 'color', 'flea_row', 'flea_col', 'direction', 'facing')
+
+# A single change record: the step the simulation is at after the change, the
+# flea, the square it recolored with the square's old and new colors, and
+# the flea's new row, column, direction, and facing
+Delta = namedtuple('Delta', DELTA_FIELDS)
+
+def get_chunk(board, history, num_steps, step):
+    """Converts the steps recorded in a History into a chunk of change records.
+
+    Arguments:
+        board(Board): The Board, after the steps.
+        history(History): A History which recorded the steps from its first slot.
+        num_steps(int): The number of steps recorded.
+        step(int): The step the simulation was at before the steps.
+
+    Returns:
+        A dictionary of arrays with one entry per flea per step,
+        ordered by step and then by flea (see DELTA_FIELDS).
+    """
+
+    store = board.flea_store
+    num_fleas = len(store)
+
+    # Copy since the History is reused for the next chunk
+    rows = history.rows[:num_steps].copy()
+    cols = history.cols[:num_steps].copy()
+    old_colors = history.colors[:num_steps].copy()
+
+    # A flea's state after a step is its state before the next step
+    flea_arrays = []
+    for recorded, current in [(history.rows, store.rows), (history.cols, store.cols),
+                              (history.directions, store.directions), (history.facings, store.facings)]:
+        flea_arrays.append(np.concatenate([recorded[1:num_steps], current[None]]).reshape(-1))
+
+    # A square under k fleas takes k transitions in one step, which are
+    # applied by binary decomposition of k as in Board.change_square_colors
+    step_indices = np.repeat(np.arange(num_steps, dtype=np.int64), num_fleas)
+    keys = (step_indices * board.num_rows + rows.reshape(-1)) * board.num_cols + cols.reshape(-1)
+    _, first, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+
+    new_colors = old_colors.reshape(-1)[first]
+    transitions = board.transitions
+    while True:
+        odd = (counts & 1).astype(bool)
+        new_colors[odd] = transitions[new_colors[odd]]
+        counts >>= 1
+
+        if not counts.any():
+            break
+
+        transitions = transitions[transitions]
+
+    return dict(zip(DELTA_FIELDS, [step + 1 + step_indices,
+                                   np.tile(np.arange(num_fleas, dtype=np.int64), num_steps),
+                                   rows.reshape(-1),
+                                   cols.reshape(-1),
+                                   old_colors.reshape(-1),
+                                   new_colors[inverse.reshape(-1)]] + flea_arrays))
+
+def iter_deltas(board, num_steps, batch=None, breakpoints=None, step=0):
+    """Steps a Board and yields the changes made by each step.
+
+    Every step changes the color of the square under each flea and
+    moves each flea, so each step yields one change record per flea.
+    The steps are run with Board.run (so the compiled kernel runs them
+    when it can) while a History captures the state before each step,
+    from which the records are computed in bulk.
+
+    The Board's History, if it is enabled, keeps recording the steps,
+    so they can still be undone.
+
+    Arguments:
+        board(Board): The Board to step.
+        num_steps(int): The maximum number of steps to take. Fewer are
+            taken if the simulation halts or hits a breakpoint.
+        batch(int): The number of steps whose records are yielded together as
+            a dictionary of arrays keyed by DELTA_FIELDS (None to take one
+            step at a time and yield each record as a Delta).
+        breakpoints(Breakpoints): Breakpoints attached to the Board which
+            end the steps when they are hit (see Board.run).
+        step(int): The step the simulation is at.
+
+    Yields:
+        A Delta for each flea after each step, or a dictionary of arrays
+        of the records of up to batch steps.
+    """
+
+    board_history = board.history
+    history = History(board, batch or 1)
+
+    board.history = history
+    try:
+        while num_steps > 0:
+            history.clear()
+            batch_size = min(history.capacity, num_steps)
+            num_batch_steps = board.run(batch_size, breakpoints)
+
+            if num_batch_steps == 0:
+                break
+
+            chunk = get_chunk(board, history, num_batch_steps, step)
+            if board_history is not None:
+                board_history.extend(history, num_batch_steps)
+
+            # Consumers see the Board's own History while they run
+            board.history = board_history
+            if batch is None:
+                for fields in zip(*[chunk[field].tolist() for field in DELTA_FIELDS]):
+                    yield Delta(*fields)
+            else:
+                yield chunk
+            board_history, board.history = board.history, history
+
+            step += num_batch_steps
+            num_steps -= num_batch_steps
+
+            # Fewer steps are taken only if the simulation halted or hit a breakpoint
+            if num_batch_steps < batch_size:
+                break
+    finally:
+        board.history = board_history
@@ -0,0 +1,405 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pygame
+from constants import COLORS, COLOR_MAP, FLEA_COLOR, HEATMAP_COLORS, MARGIN_TOP, MARGIN_SIDE, get_width, get_height
+from helpers import row_column_to_pixels
+
+# Directory of the flea images, so that they load from any working directory
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+
+# Ways of drawing the fleas (auto chooses based on the size of the squares and the number of fleas)
+FLEA_MODES = ['auto', 'image', 'glyph', 'pixel']
+
+# Maximum number of fleas drawn as images in auto mode (more are drawn as glyphs)
+MAX_IMAGE_FLEAS = 1000
+
+# Minimum width and height of squares in pixels for fleas to be drawn
+# as images or glyphs in auto mode (fleas fill smaller squares)
+MIN_GLYPH_SIZE = 6
+
+# Approximate width and height in pixels of the tiles the squares are drawn in
+TILE_PIXELS = 256
+
+# Number of threads which draw tiles in parallel
+RENDER_THREADS = os.cpu_count() or 1
+
+class Display:
+    """A Display draws a Board, including its Squares and Fleas, on the screen."""
+
+    def __init__(self,
+                 screen,
+                 board,
+                 image='flea.png',
+                 visited=False,
+                 coordinates=False,
+                 hide_grid=False,
+                 flea_mode='auto'):
+        """Initializes the Display.
+
+        Arguments:
+            screen(Surface): A pygame Surface representing the screen display.
+            board(Board): The Board containing the squares and fleas.
+            image(str): Name of image file in images directory to use as the flea image.
+            visited(bool): True to start with the heatmap of the number
+                of visits to each square shown (see toggle_heatmap).
+            coordinates(bool): True to add coordinates to squares.
+            hide_grid(bool): True to hide the grid lines.
+            flea_mode(str): How to draw the fleas (see FLEA_MODES and draw_fleas).
+        """
+
+        if flea_mode not in FLEA_MODES:
+            raise Exception('Flea mode "{}" is not one of {}'.format(flea_mode, ', '.join(FLEA_MODES)))
+
+        self.screen = screen
+        self.board = board
+        self.image = image
+        self.heatmap = False
+        self.coordinates = coordinates
+        self.hide_grid = hide_grid
+
+        self.palette = np.array(COLORS[:self.board.num_colors], dtype=np.uint8)
+        self.screen_palette = self.map_pixels(self.palette)
+        self.heatmap_palette = self.initialize_heatmap_palette()
+        self.flea_mode = self.choose_flea_mode() if flea_mode == 'auto' else flea_mode
+        self.flea_images = self.initialize_flea_images() if self.flea_mode == 'image' else None
+        self.flea_glyphs = self.initialize_flea_glyphs() if self.flea_mode != 'image' else None
+        self.coordinate_texts = self.initialize_coordinate_texts() if self.coordinates else None
+
+        # Squares are drawn in tiles of squares, and tiles are only redrawn when they change
+        self.tile_rows = max(1, TILE_PIXELS // get_height())
+        self.tile_cols = max(1, TILE_PIXELS // get_width())
+        self.dirty_tiles = np.ones((-(-self.board.num_rows // self.tile_rows),
+                                    -(-self.board.num_cols // self.tile_cols)), dtype=bool)
+        self.tiles = list(np.ndindex(*self.dirty_tiles.shape))
+        self.tile_colors = None
+        self.tile_counts = None
+        self.max_count = None
+        self.executor = ThreadPoolExecutor(RENDER_THREADS) if len(self.tiles) > 1 and RENDER_THREADS > 1 else None
+
+        if visited:
+            self.toggle_heatmap()
+
+    def initialize_flea_images(self):
+        """Loads the flea image and rotates it to face each direction.
+
+        Returns:
+            A list with the flea image facing each direction,
+            indexed by direction index (up, right, down, left).
+        """
+
+        image = pygame.image.load(os.path.join(IMAGES_DIR, self.image))
+        image = pygame.transform.scale(image, (get_width(), get_height()))
+
+        return [
+            image,
+            pygame.transform.rotate(image, 270),
+            pygame.transform.rotate(image, 180),
+            pygame.transform.rotate(image, 90)
+        ]
+
+    def choose_flea_mode(self):
+        """Chooses how to draw the fleas from the size of the squares and the number of fleas.
+
+        Returns:
+            "pixel" if the squares are too small for glyphs, "image" if there
+            are few enough fleas to draw each image, and "glyph" otherwise.
+        """
+
+        if min(get_width(), get_height()) < MIN_GLYPH_SIZE:
+            return 'pixel'
+
+        if len(self.board.flea_store) <= MAX_IMAGE_FLEAS:
+            return 'image'
+
+        return 'glyph'
+
+    def initialize_flea_glyphs(self):
+        """Computes the pixels covered by a flea in a square facing each direction.
+
+        Glyphs are triangles pointing in the direction the flea is facing.
+        In pixel mode, fleas fill their squares whichever way they face.
+
+        Returns:
+            A list with a tuple of the x and y offsets from the corner of the
+            square of the pixels of the glyph facing each direction,
+            indexed by direction index (up, right, down, left).
+        """
+
+        width, height = get_width(), get_height()
+
+        if self.flea_mode == 'pixel':
+            x, y = np.meshgrid(np.arange(width), np.arange(height), indexing='ij')
+            return [(x.reshape(-1), y.reshape(-1))] * 4
+
+        # Positions of the pixel centers across the square from 0 to 1
+        u, v = np.meshgrid((np.arange(width) + 0.5) / width, (np.arange(height) + 0.5) / height, indexing='ij')
+
+        glyphs = []
+        for along, across in [(v, u), (1 - u, v), (1 - v, u), (u, v)]:
+            # Distance from the tip of the triangle, which is 0.15 from the edge
+            tip = along - 0.15
+            mask = (tip >= 0) & (along <= 0.85) & (np.abs(across - 0.5) <= tip * 0.55 + 0.5 / min(width, height))
+            glyphs.append(np.nonzero(mask))
+
+        return glyphs
+
+    def map_pixels(self, pixels):
+        """Converts RGB pixels to the pixel format of the screen.
+
+        Arguments:
+            pixels(ndarray): An array of RGB pixels with the channels in the last axis.
+
+        Returns:
+            A uint32 array of the mapped pixels, as in surfarray.pixels2d.
+        """
+
+        shifts, losses = self.screen.get_shifts(), self.screen.get_losses()
+        mapped = np.full(pixels.shape[:-1], self.screen.get_masks()[3], dtype=np.uint32)
+
+        for channel in range(3):
+            mapped |= (pixels[..., channel].astype(np.uint32) >> losses[channel]) << shifts[channel]
+
+        return mapped
+
+    def initialize_heatmap_palette(self):
+        """Interpolates the heatmap colors into a palette of 256 levels.
+
+        Returns:
+            A 256 x 3 array with the color of each level of the heatmap.
+        """
+
+        anchors = np.linspace(0, 255, len(HEATMAP_COLORS))
+        levels = np.arange(256)
+        channels = np.array(HEATMAP_COLORS, dtype=np.float64).T
+
+        return np.stack([np.interp(levels, anchors, channel) for channel in channels], axis=1).astype(np.uint16)
+
+    def initialize_coordinate_texts(self):
+        """Renders the coordinates of every square.
+
+        Coordinates are relative to the first flea's initial location.
+
+        Returns:
+            A list of lists containing a rendered text Surface for each square.
+        """
+
+        origin = (self.board.flea_rows[0], self.board.flea_cols[0])
+        font = pygame.font.Font(None, min(get_width(), get_height()) // 3)
+        coordinate_texts = []
+
+        for row in range(self.board.num_rows):
+            row_texts = []
+
+            for col in range(self.board.num_cols):
+                if self.board.num_rows == 1:
+                    message = '{}'.format(col - origin[1])
+                elif self.board.num_cols == 1:
+                    message = '{}'.format(row - origin[0])
+                else:
+                    message = '({},{})'.format(row - origin[0], col - origin[1])
+
+                row_texts.append(font.render(message, True, COLOR_MAP['black'], COLOR_MAP['white']))
+
+            coordinate_texts.append(row_texts)
+
+        return coordinate_texts
+
+    def toggle_heatmap(self):
+        """Shows or hides the heatmap of the number of visits to each square.
+
+        Visits are counted by the Board's statistics from the first
+        time the heatmap is shown.
+        """
+
+        self.heatmap = not self.heatmap
+        self.dirty_tiles[:] = True
+
+        if self.heatmap:
+            self.board.stats.enable_visit_counts()
+
+    def get_heatmap_pixels(self, pixels, counts, max_count):
+        """Blends the heatmap of visit counts over the pixels of the squares.
+
+        Counts are mapped to heatmap levels on a log scale relative to
+        the most visited square, in one pass over the array of counts.
+        Squares which have not been visited keep their colors.
+
+        Arguments:
+            pixels(ndarray): The (rows, cols, 3) RGB pixels of the squares.
+            counts(ndarray): The (rows, cols) visit counts of the squares.
+            max_count(int): The visit count of the most visited square on the Board.
+
+        Returns:
+            The (rows, cols, 3) RGB pixels with the heatmap blended over them.
+        """
+
+        if max_count == 0:
+            return pixels
+
+        levels = (np.log1p(counts) * (255 / np.log1p(max_count))).astype(np.uint8)
+        heat = (self.heatmap_palette[levels] * 3 + pixels) // 4
+
+        return np.where((counts > 0)[:, :, None], heat, pixels).astype(np.uint8)
+
+    def draw_tile(self, pixels, colors, counts, tile_row, tile_col):
+        """Draws the squares of a tile if they changed since the tile was last drawn.
+
+        Called from the render threads. The work is done by NumPy
+        operations which release the GIL, so tiles are drawn in parallel.
+
+        Arguments:
+            pixels(ndarray): The (x, y) mapped pixels of the screen.
+            colors(ndarray): The colors of all squares of the Board.
+            counts(ndarray): The visit counts of all squares of the Board
+                (None if the heatmap is hidden).
+            tile_row(int): The row of the tile.
+            tile_col(int): The column of the tile.
+        """
+
+        width, height = get_width(), get_height()
+        rows = slice(tile_row * self.tile_rows, (tile_row + 1) * self.tile_rows)
+        cols = slice(tile_col * self.tile_cols, (tile_col + 1) * self.tile_cols)
+
+        tile_colors = colors[rows, cols]
+        tile_counts = counts[rows, cols] if counts is not None else None
+
+        if (not self.dirty_tiles[tile_row, tile_col]
+                and np.array_equal(tile_colors, self.tile_colors[rows, cols])
+                and (tile_counts is None or np.array_equal(tile_counts, self.tile_counts[rows, cols]))):
+            return
+
+        self.tile_colors[rows, cols] = tile_colors
+        self.dirty_tiles[tile_row, tile_col] = False
+
+        if tile_counts is None:
+            tile_pixels = self.screen_palette[tile_colors]
+        else:
+            self.tile_counts[rows, cols] = tile_counts
+            tile_pixels = self.map_pixels(self.get_heatmap_pixels(self.palette[tile_colors], tile_counts, self.max_count))
+
+        # Scale up by repeating each pixel across its square's columns, and then viewing the
+        # tile on the screen as (row, height, x) so that each row of pixels is copied down its square
+        num_rows, num_cols = tile_colors.shape
+        if width > 1:
+            tile_pixels = np.repeat(tile_pixels, width, axis=1)
+
+        # surfarray is indexed (x, y) so transpose to (y, x)
+        x, y = MARGIN_SIDE // 2 + cols.start * width, MARGIN_TOP + rows.start * height
+        screen_pixels = pixels[x:x + num_cols * width, y:y + num_rows * height].T
+        y_stride, x_stride = screen_pixels.strides
+        squares = np.lib.stride_tricks.as_strided(screen_pixels,
+                                                  shape=(num_rows, height, num_cols * width),
+                                                  strides=(y_stride * height, y_stride, x_stride))
+        squares[...] = tile_pixels[:, None, :]
+
+    def draw_squares(self):
+        """Draws the Squares, including the heatmap and coordinates.
+
+        The Board is split into tiles of about TILE_PIXELS pixels,
+        which are converted to pixels and scaled up to the size of the
+        squares in parallel by a pool of threads. Tiles whose colors
+        (and visit counts, with the heatmap) are the same as when they
+        were last drawn, and which no flea was drawn over, are kept on
+        the screen as they are.
+        """
+
+        colors = self.board.get_colors()
+        counts = self.board.stats.visit_counts if self.heatmap else None
+
+        if self.tile_colors is None:
+            self.tile_colors = np.empty_like(colors)
+
+        # Heatmap levels are relative to the most visited square, so all tiles change with it
+        if counts is not None:
+            if self.tile_counts is None:
+                self.tile_counts = np.empty_like(counts)
+
+            max_count = int(counts.max())
+            if max_count != self.max_count:
+                self.max_count = max_count
+                self.dirty_tiles[:] = True
+
+        # A view of the screen's pixels, which locks the screen until it is deleted
+        pixels = pygame.surfarray.pixels2d(self.screen)
+
+        if self.executor is not None:
+            futures = [self.executor.submit(self.draw_tile, pixels, colors, counts, *tile) for tile in self.tiles]
+            for future in futures:
+                future.result()
+        else:
+            for tile in self.tiles:
+                self.draw_tile(pixels, colors, counts, *tile)
+
+        del pixels
+
+        if self.coordinates:
+            for row in range(self.board.num_rows):
+                for col in range(self.board.num_cols):
+                    rect = pygame.Rect(*row_column_to_pixels(row, col), width, height)
+                    text = self.coordinate_texts[row][col]
+                    self.screen.blit(text, text.get_rect(center=rect.center))
+
+    def draw_grid(self):
+        """Draws a grid of lines to visualize separate the Squares."""
+
+        # Draw horizontal lines
+        for row in range(self.board.num_rows + 1):
+            left = row_column_to_pixels(row, 0)
+            right = row_column_to_pixels(row, self.board.num_cols)
+            pygame.draw.line(self.screen, COLOR_MAP['gray'], left, right)
+
+        # Draw vertical lines
+        for col in range(self.board.num_cols + 1):
+            top = row_column_to_pixels(0, col)
+            bottom = row_column_to_pixels(self.board.num_rows, col)
+            pygame.draw.line(self.screen, COLOR_MAP['gray'], top, bottom)
+
+    def draw_fleas(self):
+        """Draws the Fleas facing the direction they are pointing.
+
+        In image mode each flea's image is drawn separately. Otherwise
+        the pixels of the glyphs of all fleas facing each direction are
+        set in one pass over the arrays of flea positions, which stays
+        cheap with very many fleas.
+        """
+
+        store = self.board.flea_store
+        facings = store.get_facings()
+
+        # Tiles under fleas must be redrawn to erase the fleas once they move
+        self.dirty_tiles[store.rows // self.tile_rows, store.cols // self.tile_cols] = True
+
+        if self.flea_mode == 'image':
+            for row, col, facing in zip(store.rows.tolist(), store.cols.tolist(), facings.tolist()):
+                self.screen.blit(self.flea_images[facing], row_column_to_pixels(row, col))
+
+            return
+
+        xs = store.cols.astype(np.int64) * get_width() + MARGIN_SIDE // 2
+        ys = store.rows.astype(np.int64) * get_height() + MARGIN_TOP
+        color = self.screen.map_rgb(FLEA_COLOR)
+
+        # A view of the screen's pixels, indexed (x, y), which locks the screen until it is deleted
+        pixels = pygame.surfarray.pixels2d(self.screen)
+
+        # Fleas fill their squares the same way whichever way they face in pixel mode
+        if self.flea_mode == 'pixel':
+            selections = [slice(None)]
+        else:
+            selections = [facings == facing for facing in range(len(self.flea_glyphs))]
+
+        for selected, (glyph_xs, glyph_ys) in zip(selections, self.flea_glyphs):
+            pixels[xs[selected, None] + glyph_xs, ys[selected, None] + glyph_ys] = color
+
+        del pixels
+
+    def draw(self):
+        """Draws the Board including the Squares, grid, and Fleas."""
+
+        self.draw_squares()
+        if not self.hide_grid:
+            self.draw_grid()
+        self.draw_fleas()
+        pygame.display.flip()
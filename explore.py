@@ -0,0 +1,334 @@
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+
+import numpy as np
+
+from constants import STOP
+
+# Codes swapped by mirroring a rule (left and right turns)
+MIRROR = str.maketrans('LR', 'RL')
+
+# Columns of the results table
+FIELDS = ['rule', 'classification', 'steps', 'visited', 'height', 'width', 'period', 'row_shift', 'col_shift']
+
+# Fraction of squares in the bounding box which must match a
+# reflection or rotation of it for growth to count as symmetric
+SYMMETRY_THRESHOLD = 0.99
+
+# Number of times symmetry is checked over the final window, since the
+# pattern of a symmetric grower is only symmetric between bursts of growth
+SYMMETRY_SAMPLES = 64
+
+def is_canonical(rule):
+    """Determines whether a rule is the representative of its equivalence class.
+
+    A rule is skipped when it is trivial (every color takes the same
+    turn), when it repeats a shorter rule (ex. "RLRL" moves the same
+    way as "RL"), or when its mirror image (left and right swapped)
+    comes first alphabetically, since it draws the mirror image
+    of the same pattern.
+
+    Arguments:
+        rule(str): The rule string.
+
+    Returns:
+        True if the rule should be explored.
+    """
+
+    if len(set(rule)) == 1:
+        return False
+
+    for length in range(1, len(rule)):
+        if len(rule) % length == 0 and rule[:length] * (len(rule) // length) == rule:
+            return False
+
+    return rule <= rule.translate(MIRROR)
+
+def enumerate_rules(max_length, codes='LR', min_length=2):
+    """Enumerates the canonical rule strings up to a given length.
+
+    Arguments:
+        max_length(int): The maximum length of the rules.
+        codes(str): The codes which may appear in the rules.
+        min_length(int): The minimum length of the rules.
+
+    Returns:
+        A list of canonical rule strings (see is_canonical).
+    """
+
+    rules = []
+
+    for length in range(min_length, max_length + 1):
+        for codes_tuple in itertools.product(codes, repeat=length):
+            rule = ''.join(codes_tuple)
+
+            if is_canonical(rule):
+                rules.append(rule)
+
+    return rules
+
+def find_period(directions, max_period):
+    """Finds the smallest period of a sequence of directions.
+
+    Arguments:
+        directions(ndarray): The directions of a flea at consecutive steps.
+        max_period(int): The largest period to look for.
+
+    Returns:
+        The smallest period of the sequence (None if it is not periodic).
+    """
+
+    for period in range(1, max_period + 1):
+        if np.array_equal(directions[period:], directions[:-period]):
+            return period
+
+    return None
+
+def is_symmetric(colors):
+    """Determines whether a pattern matches one of its reflections or rotations.
+
+    Arguments:
+        colors(ndarray): The colors of the squares in the pattern's bounding box.
+
+    Returns:
+        True if the pattern nearly matches a reflection or a half turn of itself.
+    """
+
+    images = [colors[::-1], colors[:, ::-1], colors[::-1, ::-1]]
+    if colors.shape[0] == colors.shape[1]:
+        images += [colors.T, colors[::-1, ::-1].T]
+
+    return any(np.mean(image == colors) >= SYMMETRY_THRESHOLD for image in images)
+
+def is_near_edge(board, size, margin):
+    """Determines whether the pattern of a Board has come close to the edge of the Board.
+
+    Arguments:
+        board(Board): The Board.
+        size(int): The number of rows and columns of the board.
+        margin(int): The distance from the edge which counts as close.
+
+    Returns:
+        True if the bounding box of the visited squares is within margin of the edge
+        (False if no squares have been visited).
+    """
+
+    if board.stats.bounding_box is None:
+        return False
+
+    min_row, min_col, max_row, max_col = board.stats.bounding_box
+
+    return min(min_row, min_col) < margin or max(max_row, max_col) >= size - margin
+
+def is_stopped(board):
+    """Determines whether the Flea of a Board has stopped for good.
+
+    A stopped Flea may still change the color of its square (as with
+    the rule LRX), so the Board need not have halted (see Board.is_halted).
+
+    Arguments:
+        board(Board): The Board.
+
+    Returns:
+        True if the Flea has stopped.
+    """
+
+    return bool((board.flea_store.directions == STOP).all())
+
+def check_board(size, window):
+    """Checks that the size of the board and the window leave room to classify rules.
+
+    Arguments:
+        size(int): The number of rows and columns of the board.
+        window(int): The number of final steps used to look for periodic behavior.
+    """
+
+    if size < 4:
+        raise Exception('Board size must be at least 4, not {}'.format(size))
+
+    if window < 4:
+        raise Exception('Window must be at least 4 steps, not {}'.format(window))
+
+def explore_rule(rule, steps, size, window):
+    """Simulates a rule headless and classifies its behavior.
+
+    The flea starts in the center of an empty board facing up and
+    takes the given number of steps, stopping early once the flea stops
+    or the pattern comes within a quarter of the board of its edge so
+    that the board does not wrap around onto the pattern. (Since steps
+    are run in batches of a quarter of the board before the window, the
+    steps of a halted rule may include up to a batch after it stopped.)
+    Its directions over the last window steps (fewer if the flea stops
+    or reaches the edge of the board first) are then used to classify
+    it: a flea which has stopped has halted, directions which repeat with a nonzero shift per period form a
+    highway, and directions which repeat without moving are periodic.
+    Otherwise the growth is symmetric if the pattern matches one of its
+    reflections or rotations at any of SYMMETRY_SAMPLES points across
+    the window, and chaotic if not.
+
+    Arguments:
+        rule(str): The rule string.
+        steps(int): The maximum number of steps to simulate.
+        size(int): The number of rows and columns of the board.
+        window(int): The number of final steps used to look for periodic behavior.
+
+    Returns:
+        A dictionary with the rule, its classification, and statistics of the run.
+    """
+
+    from board import Board
+    from flea import make_rule_flea
+
+    check_board(size, window)
+
+    board = Board(size, size, make_rule_flea(rule), 1, [None], [None], ['up'], None)
+    margin = size // 4
+
+    # Batches are no longer than the margin so the pattern cannot cross it and wrap around
+    step = 0
+    while step < steps - window:
+        batch = min(margin, steps - window - step)
+        num_steps = board.run(batch)
+        step += num_steps
+
+        # Fewer steps are taken only if the simulation halted
+        if num_steps < batch or is_stopped(board) or is_near_edge(board, size, margin):
+            break
+
+    # Fewer steps than the window may have been asked for
+    window = min(window, steps - step)
+    directions = np.zeros(window, dtype=np.int8)
+    num_directions = 0
+    symmetric = False
+    sample_interval = max(1, window // SYMMETRY_SAMPLES)
+    while num_directions < window:
+        # Stop before the flea steps off the edge and wraps around onto the pattern
+        if is_stopped(board) or is_near_edge(board, size, 1):
+            break
+
+        board.step()
+        directions[num_directions] = board.flea_store.directions[0]
+        num_directions += 1
+
+        if not symmetric and num_directions % sample_interval == 0:
+            min_row, min_col, max_row, max_col = board.stats.bounding_box
+            symmetric = is_symmetric(board.get_colors()[min_row:max_row + 1, min_col:max_col + 1])
+
+    directions = directions[:num_directions]
+    steps = step + num_directions
+
+    period = None
+    row_shift = col_shift = 0
+
+    if is_stopped(board):
+        classification = 'halted'
+    else:
+        period = find_period(directions, num_directions // 2)
+
+        if period is not None:
+            row_shift = int(board.row_deltas[directions[-period:]].sum())
+            col_shift = int(board.col_deltas[directions[-period:]].sum())
+            classification = 'highway' if row_shift != 0 or col_shift != 0 else 'periodic'
+        else:
+            classification = 'symmetric' if symmetric else 'chaotic'
+
+    min_row, min_col, max_row, max_col = board.stats.bounding_box or (0, 0, -1, -1)
+
+    return {
+        'rule': rule,
+        'classification': classification,
+        'steps': steps,
+        'visited': board.stats.num_visited,
+        'height': max_row - min_row + 1,
+        'width': max_col - min_col + 1,
+        'period': period,
+        'row_shift': row_shift,
+        'col_shift': col_shift
+    }
+
+def explore_rule_star(args):
+    """Calls explore_rule with a tuple of arguments (for Pool.imap_unordered)."""
+
+    return explore_rule(*args)
+
+def read_results(path):
+    """Reads a results table.
+
+    Arguments:
+        path(str): The path to the CSV file.
+
+    Returns:
+        A dictionary mapping each rule to its row of results
+        (empty if the file does not exist).
+    """
+
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r', newline='') as results_file:
+        return {row['rule']: row for row in csv.DictReader(results_file)}
+
+def explore(rules, steps, size, window, output, processes=None):
+    """Explores rules in a pool of processes and appends the results to a table.
+
+    Rules which already have results in the table are skipped,
+    so an interrupted exploration can be resumed.
+
+    Arguments:
+        rules(list): The rule strings to explore.
+        steps(int): The number of steps to simulate each rule.
+        size(int): The number of rows and columns of the board.
+        window(int): The number of final steps used to look for periodic behavior.
+        output(str): The path to the CSV file where results are written.
+        processes(int): The number of processes (None for the number of CPUs).
+
+    Returns:
+        A list of dictionaries with the results of the newly explored rules.
+    """
+
+    check_board(size, window)
+
+    done = read_results(output)
+    rules = [rule for rule in rules if rule not in done]
+    results = []
+
+    print('Exploring {} rules ({} already explored)'.format(len(rules), len(done)))
+
+    with open(output, 'a', newline='') as output_file:
+        writer = csv.DictWriter(output_file, fieldnames=FIELDS)
+        if not done:
+            writer.writeheader()
+
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(processes) as pool:
+            tasks = [(rule, steps, size, window) for rule in rules]
+
+            for result in pool.imap_unordered(explore_rule_star, tasks):
+                writer.writerow(result)
+                output_file.flush()
+                results.append(result)
+                print('{:<16} {}'.format(result['rule'], result['classification']))
+
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--max_length', type=int, default=8, help='Maximum length of the rule strings')
+    parser.add_argument('--min_length', type=int, default=2, help='Minimum length of the rule strings')
+    parser.add_argument('--codes', type=str, default='LR', help='Codes which may appear in the rule strings (N, R, U, L, and X)')
+    parser.add_argument('--steps', type=str, default='1e6', help='Number of steps to simulate each rule (may be in scientific notation)')
+    parser.add_argument('--size', type=int, default=2048, help='Number of rows and columns of the board')
+    parser.add_argument('--window', type=int, default=4096, help='Number of final steps used to look for highways and periodic behavior (at least 4; fewer are used if the flea reaches the edge of the board)')
+    parser.add_argument('--processes', type=int, default=None, help='Number of processes (default is the number of CPUs)')
+    parser.add_argument('--output', type=str, default='rules.csv', help='Path to CSV file where results will be saved (existing results are kept and skipped)')
+    args = parser.parse_args()
+
+    # Convert to float then int to allow for scientific notation
+    args.steps = int(float(args.steps))
+
+    rules = enumerate_rules(args.max_length, args.codes.upper(), args.min_length)
+
+    explore(rules, args.steps, args.size, args.window, args.output, args.processes)
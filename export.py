@@ -0,0 +1,165 @@
+import argparse
+import struct
+import zlib
+
+import numpy as np
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# zlib compression level of exported images (fast rather than small)
+PNG_COMPRESSION = 1
+
+# Number of output pixels converted and compressed at a time, which bounds memory
+PNG_BAND_PIXELS = 2**22
+
+def get_palette(num_colors):
+    """Gets the RGB color of each square color as an array.
+
+    Arguments:
+        num_colors(int): The number of colors.
+
+    Returns:
+        A num_colors x 3 uint8 array of RGB colors from constants.COLORS.
+    """
+
+    # Only build the color tables when an image is exported
+    from constants import COLORS
+
+    if num_colors > len(COLORS):
+        raise Exception('Cannot export {} colors, only {} are defined'.format(num_colors, len(COLORS)))
+
+    return np.array(COLORS[:num_colors], dtype=np.uint8)
+
+def write_chunk(png_file, chunk_type, data):
+    """Writes a PNG chunk with its length and CRC.
+
+    Arguments:
+        png_file(file): The file being written.
+        chunk_type(bytes): The four-letter type of the chunk.
+        data(bytes): The data of the chunk.
+    """
+
+    png_file.write(struct.pack('>I', len(data)))
+    png_file.write(chunk_type)
+    png_file.write(data)
+    png_file.write(struct.pack('>I', zlib.crc32(chunk_type + data)))
+
+def get_bit_depth(num_colors):
+    """Gets the smallest PNG bit depth which fits a number of palette indices.
+
+    Arguments:
+        num_colors(int): The number of colors (at most 256).
+
+    Returns:
+        The number of bits per pixel (1, 2, 4, or 8).
+    """
+
+    for bit_depth in [1, 2, 4]:
+        if num_colors <= 1 << bit_depth:
+            return bit_depth
+
+    return 8
+
+def pack_pixels(band, bit_depth):
+    """Packs palette indices into bytes, with the leftmost pixel in the most significant bits.
+
+    Arguments:
+        band(ndarray): A 2D array of palette indices.
+        bit_depth(int): The number of bits per pixel (1, 2, 4, or 8).
+
+    Returns:
+        A 2D uint8 array with the packed bytes of each row.
+    """
+
+    if bit_depth == 8:
+        return band.astype(np.uint8, copy=False)
+
+    if bit_depth == 1:
+        return np.packbits(band.astype(np.uint8, copy=False), axis=1)
+
+    pixels_per_byte = 8 // bit_depth
+    num_bytes = -(-band.shape[1] // pixels_per_byte)
+
+    padded = np.zeros((len(band), num_bytes * pixels_per_byte), dtype=np.uint8)
+    padded[:, :band.shape[1]] = band
+    padded = padded.reshape(len(band), num_bytes, pixels_per_byte)
+
+    packed = np.zeros((len(band), num_bytes), dtype=np.uint8)
+    for index in range(pixels_per_byte):
+        packed |= padded[:, :, index] << (8 - bit_depth * (index + 1))
+
+    return packed
+
+def write_png(path, colors, palette, scale=1):
+    """Writes an array of colors to a PNG image with one square of pixels per color.
+
+    Images with at most 256 colors are palette-indexed, so each color is
+    written directly as a palette index with as few bits as fit the
+    palette (and the image can be loaded back as a board file). Otherwise
+    the colors are mapped to RGB through the palette. Rows are converted
+    and compressed in bands, so memory stays bounded for large boards.
+
+    Arguments:
+        path(str): The path to the PNG image.
+        colors(ndarray): A 2D array of colors.
+        palette(ndarray): The RGB color of each color.
+        scale(int): The number of pixels per square along each side.
+    """
+
+    num_rows, num_cols = colors.shape
+    indexed = len(palette) <= 256
+    bit_depth = get_bit_depth(len(palette)) if indexed else 8
+    band_rows = max(1, PNG_BAND_PIXELS // (num_cols * scale * scale))
+
+    with open(path, 'wb') as png_file:
+        png_file.write(PNG_SIGNATURE)
+        write_chunk(png_file, b'IHDR', struct.pack('>IIBBBBB', num_cols * scale, num_rows * scale,
+                                                   bit_depth, 3 if indexed else 2, 0, 0, 0))
+        if indexed:
+            write_chunk(png_file, b'PLTE', np.ascontiguousarray(palette, dtype=np.uint8).tobytes())
+
+        compressor = zlib.compressobj(PNG_COMPRESSION)
+
+        for start in range(0, num_rows, band_rows):
+            band = np.asarray(colors[start:start + band_rows])
+
+            if scale > 1:
+                band = np.repeat(np.repeat(band, scale, axis=0), scale, axis=1)
+
+            # Each row of the image starts with its filter type (0 for none)
+            pixels = pack_pixels(band, bit_depth) if indexed else palette[band].reshape(len(band), -1)
+            lines = np.zeros((len(band), 1 + pixels.shape[1]), dtype=np.uint8)
+            lines[:, 1:] = pixels
+
+            data = compressor.compress(lines)
+            if data:
+                write_chunk(png_file, b'IDAT', data)
+
+        write_chunk(png_file, b'IDAT', compressor.flush())
+        write_chunk(png_file, b'IEND', b'')
+
+def export_png(board, path, scale=1):
+    """Writes the colors of all Squares of a Board to a PNG image.
+
+    Arguments:
+        board(Board): The Board.
+        path(str): The path to the PNG image.
+        scale(int): The number of pixels per square along each side.
+    """
+
+    write_png(path, board.get_colors(), get_palette(board.num_colors), scale)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('board', type=str, help='Path to a .npy, .png, or .rle board file')
+    parser.add_argument('output', type=str, help='Path to the PNG image to write')
+    parser.add_argument('--scale', type=int, default=1, help='Number of pixels per square along each side')
+    parser.add_argument('--num_colors', type=int, default=None, help='Number of colors in the palette (default is the largest color in the board plus one)')
+    args = parser.parse_args()
+
+    from config import load_square_colors
+
+    colors = load_square_colors(args.board)
+    num_colors = args.num_colors if args.num_colors is not None else int(colors.max()) + 1
+
+    write_png(args.output, colors, get_palette(num_colors), args.scale)
@@ -1,6 +1,6 @@
-import pygame
-from abc import ABCMeta, abstractmethod
-from constants import DIRECTIONS, get_width, get_height
+import numpy as np
+from constants import DIRECTION_NAMES, DIRECTION_INDICES, STOP, ROW_DELTAS, COL_DELTAS, LEFT_TURNS, RIGHT_TURNS, \
+    NEXT_DIRECTIONS, STRAIGHT, RIGHT, U_TURN, LEFT, HALT
 
 FLEA_CLASSES = {}
 
@@ -30,86 +30,214 @@ def get_flea(flea_name):
 
     return flea_class
 
+# The turn taken on a color for each code in a rule string
+RULE_CODES = {
+    'N': STRAIGHT,
+    'R': RIGHT,
+    'U': U_TURN,
+    'L': LEFT,
+    'X': HALT
+}
 
-class Flea(pygame.sprite.Sprite):
-    """A Flea represents a flea which can move on the Board and change the color of Squares.
+def make_rule_flea(rule, color_map=None):
+    """Makes a table-driven Flea class from a rule string.
 
-    Flea is an abstract class. Subclasses must define the
-    num_colors property and must implement the rotate method,
-    which decides how the Flea will rotate based on which color
-    Square it is currently on. Fleas may optionally define the
-    cycle_size and color_map properties.
+    Each character of the rule is the turn taken on the
+    corresponding color: "N" (no turn, straight), "R" (right),
+    "U" (U-turn), "L" (left), or "X" (stop). For example,
+    "RL" is Langton's ant and "RRLLLRLLLRRR" is the triangle flea.
+
+    Arguments:
+        rule(str): The rule string (case insensitive).
+        color_map(dict or list): The next color of each color, as a dictionary
+            mapping each color to the next color or as a list indexed by color.
+            (None to cycle through the colors in order.)
+
+    Returns:
+        A Flea class with one color per character of the rule.
     """
 
-    __metaclass__ = ABCMeta
+    rule = rule.upper()
+
+    if len(rule) == 0 or any(code not in RULE_CODES for code in rule):
+        raise Exception(
+            'Rule "{}" is not a valid rule string. '.format(rule) +
+            'Rules are made of the codes {}'.format(list(RULE_CODES.keys())))
+
+    num_colors = len(rule)
+
+    if color_map is not None:
+        if isinstance(color_map, dict):
+            # JSON configs have string keys
+            color_map = {int(color): int(next_color) for color, next_color in color_map.items()}
+        else:
+            color_map = {color: int(next_color) for color, next_color in enumerate(color_map)}
+
+        if sorted(color_map.keys()) != list(range(num_colors)) or \
+                any(not 0 <= next_color < num_colors for next_color in color_map.values()):
+            raise Exception('Color map {} must map each of the {} colors of rule "{}" to a color'.format(
+                color_map, num_colors, rule))
+
+    attributes = {
+        '__doc__': '{} flea.'.format(rule),
+        'rule': rule,
+        'num_colors': num_colors,
+        'color_map': color_map,
+        'turns': [RULE_CODES[code] for code in rule]
+    }
+
+    return type('RuleFlea{}'.format(rule), (Flea,), attributes)
+
+
+class FleaStore:
+    """A FleaStore holds the state of all Fleas on a Board as parallel arrays.
+
+    Directions are stored as indices into DIRECTION_NAMES
+    (up, right, down, left, stop) so that stepping code can
+    use precomputed tables instead of comparing strings. Each
+    Flea object is a view onto one index of the store.
+    """
+
+    def __init__(self, rows, cols, directions):
+        """Initializes the FleaStore.
+
+        Arguments:
+            rows(list): The initial rows of the fleas.
+            cols(list): The initial columns of the fleas.
+            directions(list): The initial directions of the fleas (names or indices).
+        """
+
+        self.rows = np.array(rows, dtype=np.int32)
+        self.cols = np.array(cols, dtype=np.int32)
+        self.directions = np.array([DIRECTION_INDICES.get(direction, direction) for direction in directions],
+                                   dtype=np.int8)
+
+        # The direction each flea faced before it stopped, used for drawing
+        self.facings = self.directions.copy()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get_facings(self):
+        """Gets the direction each flea is facing.
+
+        Returns:
+            An array with the direction index of each flea, or the
+            direction it was facing when it stopped if it is stopped.
+        """
 
-    @abstractmethod
-    def num_colors(self):
-        pass
+        return np.where(self.directions == STOP, self.facings, self.directions)
 
+
+class Flea:
+    """A Flea represents a flea which can move on the Board and change the color of Squares.
+
+    Flea is an abstract class. Subclasses must define the
+    num_colors property and must decide how the Flea will rotate
+    based on which color Square it is currently on, either by
+    defining the turns property (a list with the turn to take on
+    each color: STRAIGHT, RIGHT, U_TURN, LEFT, or HALT) or by
+    implementing the rotate method. Fleas which define turns and
+    do not override rotate are table-driven, which lets the Board
+    step them without calling rotate. Fleas may optionally define
+    the cycle_size and color_map properties. Subclasses which are
+    missing num_colors or a way to rotate fail when they are defined.
+
+    The state of a Flea lives in its Board's FleaStore and the
+    Flea is a view onto it. Fleas do not depend on pygame.
+    They are drawn by the Display.
+    """
+
+    num_colors = None
     cycle_size = None
     color_map = None
+    turns = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Checks that a subclass defines num_colors and how to rotate."""
+
+        super().__init_subclass__(**kwargs)
+
+        if cls.num_colors is None:
+            raise Exception('{} must define num_colors'.format(cls.__name__))
+
+        if cls.turns is None and cls.rotate is Flea.rotate:
+            raise Exception('{} must define turns or implement rotate'.format(cls.__name__))
 
-    @abstractmethod
     def rotate(self):
-        pass
+        """Rotates the Flea by the turn in self.turns for the color of its Square.
+
+        Fleas which do not define turns override this method.
+        """
+
+        self.turn(self.turns[self.square.color])
+
+    @classmethod
+    def is_table_driven(cls):
+        """Determines whether the Flea rotates purely according to its turns.
+
+        Returns:
+            True if the Flea defines turns and does not override rotate.
+        """
+
+        return cls.turns is not None and cls.rotate is Flea.rotate
 
-    def __init__(self, board, row, col, init_direction='up', image='flea.png'):
+    def __init__(self, board, index):
         """Initializes the Flea.
 
         Arguments:
-            board(Board): The Board the Flea will be on.
-            row(int): The row number where the Flea will start.
-            col(int): The column number where the Flea will start.
-            init_direction(str): The initial direction of the Flea.
-            image(str): Name of image file in images directory to use as the flea image.
+            board(Board): The Board the Flea is on.
+            index(int): The index of the Flea in the Board's FleaStore,
+                which holds its initial row, column, and direction.
         """
 
-        super(Flea, self).__init__()
+        self.board = board
+        self.store = board.flea_store
+        self.index = index
+
+    @property
+    def row(self):
+        return int(self.store.rows[self.index])
 
-        self.initialize_directions()
+    @row.setter
+    def row(self, row):
+        self.store.rows[self.index] = row
 
-        self.board = board
-        self.row = row
-        self.col = col
-        self.direction = init_direction
-        self.image_name = image
-
-        self.square = self.board.get_square(self.row, self.col)
-        self.rect = self.square.rect
-        self.set_image()
-
-    def initialize_directions(self):
-        """Initializes the directions the Flea can point.
-
-        Also initializes two maps:
-        - self.left_direction maps each direction to the direction
-        to the left (90 degrees counterclockwise).
-        - self.right_direction maps each direction to the direction
-        to the right (90 degrees clockwise).
-        """
+    @property
+    def col(self):
+        return int(self.store.cols[self.index])
 
-        self.directions = ['up', 'right', 'down', 'left']
-        self.left_direction = {
-            self.directions[i]: self.directions[(i-1) % len(self.directions)]
-            for i in range(len(self.directions))
-        }
-        self.right_direction = {
-            self.directions[i]: self.directions[(i+1) % len(self.directions)]
-            for i in range(len(self.directions))
-        }
+    @col.setter
+    def col(self, col):
+        self.store.cols[self.index] = col
+
+    @property
+    def direction_index(self):
+        return int(self.store.directions[self.index])
+
+    @property
+    def direction(self):
+        return DIRECTION_NAMES[self.store.directions[self.index]]
+
+    @direction.setter
+    def direction(self, direction):
+        self.store.directions[self.index] = DIRECTION_INDICES[direction]
+
+    @property
+    def square(self):
+        return self.board.get_square(self.store.rows[self.index], self.store.cols[self.index])
 
     def rotate_left(self):
         """Rotates the Flea to the left (90 degrees counterclockwise)."""
 
-        self.image = pygame.transform.rotate(self.image, 90)
-        self.direction = self.left_direction[self.direction]
+        directions = self.store.directions
+        directions[self.index] = LEFT_TURNS[directions[self.index]]
 
     def rotate_right(self):
         """Rotates the Flea to the right (90 degrees clockwise)."""
 
-        self.image = pygame.transform.rotate(self.image, -90)
-        self.direction = self.right_direction[self.direction]
+        directions = self.store.directions
+        directions[self.index] = RIGHT_TURNS[directions[self.index]]
 
     def rotate_180(self):
         """Rotates the Flea 180 degrees."""
@@ -117,32 +245,53 @@ class Flea(pygame.sprite.Sprite):
         self.rotate_right()
         self.rotate_right()
 
+    def turn(self, turn):
+        """Turns the Flea.
+
+        Arguments:
+            turn(int): The turn to take (STRAIGHT, RIGHT, U_TURN, LEFT, or HALT).
+        """
+
+        next_direction = NEXT_DIRECTIONS[self.store.directions[self.index]][turn]
+
+        if next_direction == STOP:
+            self.stop()
+        else:
+            self.store.directions[self.index] = next_direction
+
     def stop(self):
-        """Stops the Flea."""
+        """Stops the Flea.
+
+        The direction the Flea was facing is kept in the
+        FleaStore so that it is drawn facing that way.
+        """
+
+        directions = self.store.directions
 
-        self.direction = 'stop'
+        if directions[self.index] != STOP:
+            self.store.facings[self.index] = directions[self.index]
+
+        directions[self.index] = STOP
 
     def move(self):
         """Moves the Flea."""
 
-        self.row = (self.row + DIRECTIONS[self.direction][0]) % self.board.num_rows
-        self.col = (self.col + DIRECTIONS[self.direction][1]) % self.board.num_cols
-        self.square = self.board.get_square(self.row, self.col)
-        self.rect = self.square.rect
+        direction = self.store.directions[self.index]
+        self.store.rows[self.index] = (self.store.rows[self.index] + ROW_DELTAS[direction]) % self.board.num_rows
+        self.store.cols[self.index] = (self.store.cols[self.index] + COL_DELTAS[direction]) % self.board.num_cols
+
+    def get_facing(self):
+        """Gets the direction the Flea is facing.
 
-    def set_image(self):
-        """Sets the image of the Flea and orients it correctly."""
+        Returns:
+            The direction of the Flea, or the direction it was
+            facing when it stopped if it is stopped.
+        """
 
-        self.image = pygame.image.load('images/{}'.format(self.image_name))
-        self.image = pygame.transform.scale(self.image, (get_width(), get_height()))
+        if self.store.directions[self.index] != STOP:
+            return self.direction
 
-        # Rotate if necessary
-        if self.direction == 'right':
-            self.image = pygame.transform.rotate(self.image, 270)
-        elif self.direction == 'down':
-            self.image = pygame.transform.rotate(self.image, 180)
-        elif self.direction == 'left':
-            self.image = pygame.transform.rotate(self.image, 90)
+        return DIRECTION_NAMES[self.store.facings[self.index]]
 
 
 @RegisterFlea('langtons')
@@ -154,26 +303,16 @@ class LangtonsFlea(Flea):
     """
 
     num_colors = 2
+    turns = [RIGHT, LEFT]
 
-    def rotate(self):
-        if self.square.color == 0:
-            self.rotate_right()
-        else:
-            self.rotate_left()
 
 @RegisterFlea('triangle')
 class TriangleFlea(Flea):
     """RRLLLRLLLRRR flea."""
 
     num_colors = 12
+    turns = [RIGHT, RIGHT, LEFT, LEFT, LEFT, RIGHT, LEFT, LEFT, LEFT, RIGHT, RIGHT, RIGHT]
 
-    right_turn_colors = [0, 1, 5, 9, 10, 11]
-
-    def rotate(self):
-        if self.square.color in self.right_turn_colors:
-            self.rotate_right()
-        else:
-            self.rotate_left()
 
 @RegisterFlea('1d_visit')
 class OneDimensionalVisitorFlea(Flea):
@@ -185,6 +324,7 @@ class OneDimensionalVisitorFlea(Flea):
 
     num_colors = 2
     cycle_size = 1
+    turns = [U_TURN, STRAIGHT]
 
     def __init__(self, *args, **kwargs):
         super(OneDimensionalVisitorFlea, self).__init__(*args, **kwargs)
@@ -192,10 +332,6 @@ class OneDimensionalVisitorFlea(Flea):
         # Start facing right
         self.rotate_right()
 
-    def rotate(self):
-        if self.square.color == 0:
-            self.rotate_right()
-            self.rotate_right()
 
 @RegisterFlea('2d_visit')
 class TwoDimensionalVisitorFlea(Flea):
@@ -208,12 +344,8 @@ class TwoDimensionalVisitorFlea(Flea):
 
     num_colors = 3
     cycle_size = 1
+    turns = [RIGHT, LEFT, STRAIGHT]
 
-    def rotate(self):
-        if self.square.color == 0:
-            self.rotate_right()
-        elif self.square.color == 1:
-            self.rotate_left()
 
 @RegisterFlea('bit_flipper')
 class BitFlipperFlea(Flea):
@@ -250,14 +382,8 @@ class BitFlipperFlea(Flea):
         3: 4,
         4: 4,
     }
+    turns = [STRAIGHT, STRAIGHT, RIGHT, LEFT, HALT]
 
-    def rotate(self):
-        if self.square.color == 2:
-            self.rotate_right()
-        elif self.square.color == 3:
-            self.rotate_left()
-        elif self.square.color == 4:
-            self.stop()
 
 @RegisterFlea('add_one')
 class AddOneFlea(Flea):
@@ -307,16 +433,8 @@ class AddOneFlea(Flea):
         3: 4,
         4: 4,
     }
+    turns = [U_TURN, STRAIGHT, RIGHT, LEFT, HALT]
 
-    def rotate(self):
-        if self.square.color == 0:
-            self.rotate_180()
-        elif self.square.color == 2:
-            self.rotate_right()
-        elif self.square.color == 3:
-            self.rotate_left()
-        elif self.square.color == 4:
-            self.stop()
 
 @RegisterFlea('twos_complement')
 class TwosComplementFlea(Flea):
@@ -387,16 +505,8 @@ class TwosComplementFlea(Flea):
         7: 7,
         8: 8
     }
+    turns = [STRAIGHT, STRAIGHT, U_TURN, RIGHT, LEFT, RIGHT, LEFT, STRAIGHT, HALT]
 
-    def rotate(self):
-        if self.square.color == 2:
-            self.rotate_180()
-        elif self.square.color in [3, 5]:
-            self.rotate_right()
-        elif self.square.color in [4, 6]:
-            self.rotate_left()
-        elif self.square.color == 8:
-            self.stop()
 
 @RegisterFlea('adder')
 class AdderFlea(Flea):
@@ -434,18 +544,8 @@ class AdderFlea(Flea):
         7: 7,
         8: 8
     }
+    turns = [STRAIGHT, U_TURN, U_TURN, RIGHT, LEFT, RIGHT, RIGHT, STRAIGHT, HALT]
 
-    def rotate(self):
-        color = self.square.color
-
-        if color in [1, 2]:
-            self.rotate_180()
-        elif color in [3, 5, 6]:
-            self.rotate_right()
-        elif color == 4:
-            self.rotate_left()
-        elif color == 8:
-            self.stop()
 
 @RegisterFlea('adder_fast')
 class AdderFastFlea(Flea):
@@ -467,15 +567,4 @@ class AdderFastFlea(Flea):
         7: 7,
         8: 8
     }
-
-    def rotate(self):
-        color = self.square.color
-
-        if color in [1, 2]:
-            self.rotate_180()
-        elif color in [3, 5]:
-            self.rotate_right()
-        elif color in [4, 6]:
-            self.rotate_left()
-        elif color == 8:
-            self.stop()
+    turns = [STRAIGHT, U_TURN, U_TURN, RIGHT, LEFT, RIGHT, LEFT, STRAIGHT, HALT]
@@ -37,6 +37,20 @@ def row_column_to_pixels(row_num, col_num):
 
     return (column_to_pixel(col_num), row_to_pixel(row_num))
 
+def pixels_to_row_column(x, y):
+    """Converts a pair of pixel numbers to the row and column containing them.
+
+    Arguments:
+        x(int): The horizontal pixel number.
+        y(int): The vertical pixel number.
+
+    Returns:
+        A tuple with the row and column containing the pixel
+        (which may lie outside the board).
+    """
+
+    return ((y - MARGIN_TOP) // get_height(), (x - MARGIN_SIDE // 2) // get_width())
+
 def format_message(step, pause, threshold=10000):
     """Format message to display on top of screen.
 
@@ -0,0 +1,136 @@
+import numpy as np
+
+# Maximum memory used by a History, which limits its capacity for many fleas
+MAX_HISTORY_BYTES = 64 * 2**20
+
+class History:
+    """A History records the changes made by recent steps so that they can be undone.
+
+    Each step changes only the colors of the squares under the fleas
+    and the positions and directions of the fleas, so the History
+    records, for each step, every flea's row, column, direction, and
+    facing before the step and the color of its square before the step.
+    Steps are recorded in a ring buffer of fixed capacity, so recording
+    costs a constant amount per step and the oldest steps are forgotten.
+
+    Undoing a step restores the colors, fleas, color counts, and visit
+    counts. Squares stay marked as visited.
+    """
+
+    def __init__(self, board, capacity):
+        """Initializes the History.
+
+        Arguments:
+            board(Board): The Board whose steps are recorded.
+            capacity(int): The maximum number of steps to remember
+                (reduced if needed to fit in MAX_HISTORY_BYTES).
+        """
+
+        self.board = board
+
+        store = board.flea_store
+        step_bytes = len(store) * (store.rows.itemsize + store.cols.itemsize + 2 * store.directions.itemsize +
+                                   np.dtype(board.storage.dtype).itemsize)
+        self.capacity = max(1, min(capacity, MAX_HISTORY_BYTES // step_bytes))
+
+        shape = (self.capacity, len(store))
+        self.rows = np.zeros(shape, dtype=store.rows.dtype)
+        self.cols = np.zeros(shape, dtype=store.cols.dtype)
+        self.directions = np.zeros(shape, dtype=store.directions.dtype)
+        self.facings = np.zeros(shape, dtype=store.facings.dtype)
+        self.colors = np.zeros(shape, dtype=board.storage.dtype)
+
+        # The slot where the next step is recorded and the number of steps recorded
+        self.state = np.zeros(2, dtype=np.int64)
+
+    def __len__(self):
+        return int(self.state[1])
+
+    def record(self):
+        """Records the state which the next step will change. Called before each step."""
+
+        store = self.board.flea_store
+        slot = self.state[0]
+
+        self.rows[slot] = store.rows
+        self.cols[slot] = store.cols
+        self.directions[slot] = store.directions
+        self.facings[slot] = store.facings
+        self.colors[slot] = self.board.storage.get_many(store.rows, store.cols)
+
+        self.state[0] = (slot + 1) % self.capacity
+        self.state[1] = min(self.state[1] + 1, self.capacity)
+
+    def extend(self, history, num_steps):
+        """Records steps which were recorded by another History from its first slot (see iter_deltas).
+
+        Arguments:
+            history(History): The other History.
+            num_steps(int): The number of steps it recorded.
+        """
+
+        start = max(0, num_steps - self.capacity)
+        slots = (self.state[0] + np.arange(num_steps - start)) % self.capacity
+
+        self.rows[slots] = history.rows[start:num_steps]
+        self.cols[slots] = history.cols[start:num_steps]
+        self.directions[slots] = history.directions[start:num_steps]
+        self.facings[slots] = history.facings[start:num_steps]
+        self.colors[slots] = history.colors[start:num_steps]
+
+        self.state[0] = (self.state[0] + num_steps - start) % self.capacity
+        self.state[1] = min(self.state[1] + num_steps - start, self.capacity)
+
+    def get_last_squares(self):
+        """Gets the squares which the most recently recorded step changed.
+
+        Returns:
+            A tuple of the rows and columns of the fleas before the step.
+        """
+
+        slot = (self.state[0] - 1) % self.capacity
+
+        return self.rows[slot], self.cols[slot]
+
+    def undo(self):
+        """Undoes the most recently recorded step.
+
+        Returns:
+            True if a step was undone, False if there are no recorded steps.
+        """
+
+        if self.state[1] == 0:
+            return False
+
+        board, store = self.board, self.board.flea_store
+        slot = (self.state[0] - 1) % self.capacity
+        rows, cols, old_colors = self.rows[slot], self.cols[slot], self.colors[slot]
+
+        # Squares under several fleas are restored once
+        locations, indices, num_fleas = np.unique(rows.astype(np.int64) * board.num_cols + cols,
+                                                  return_index=True, return_counts=True)
+        rows, cols, old_colors = rows[indices], cols[indices], old_colors[indices]
+
+        # Each flea visited its square once. Steps taken before visits were counted
+        # find their squares at 0, since every later step was undone first.
+        if board.stats.visit_counts is not None:
+            visit_counts = board.stats.visit_counts.reshape(-1)
+            visit_counts[locations] -= np.minimum(visit_counts[locations], num_fleas).astype(visit_counts.dtype)
+
+        board.stats.change_colors(board.storage.get_many(rows, cols), old_colors)
+        board.storage.set_many(rows, cols, old_colors)
+
+        store.rows[:] = self.rows[slot]
+        store.cols[:] = self.cols[slot]
+        store.directions[:] = self.directions[slot]
+        store.facings[:] = self.facings[slot]
+
+        self.state[0] = slot
+        self.state[1] -= 1
+
+        return True
+
+    def clear(self):
+        """Forgets all recorded steps (ex. after the Board is edited by hand)."""
+
+        self.state[:] = 0
@@ -0,0 +1,279 @@
+from breakpoints import NO_HIT, SQUARE_HIT, CELL_HIT, COLOR_HIT
+from constants import STOP
+from storage import ARRAY_LAYOUT, BITS_LAYOUT, TILE_SHIFT, TILE_MASK
+
+# numba is an optional dependency. Without it, run_steps runs as plain
+# Python, which is correct but much slower than Board.step.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def get_index(layout, stride, row, col):
+    """Gets the index in a flat color array of the color of a square.
+
+    Arguments:
+        layout(int): The layout of the array (ARRAY_LAYOUT, BITS_LAYOUT, or TILES_LAYOUT).
+        stride(int): The number of entries per row (or tiles per row of tiles).
+        row(int): The row of the square.
+        col(int): The column of the square.
+
+    Returns:
+        The index of the entry (or byte) holding the color of the square.
+    """
+
+    if layout == ARRAY_LAYOUT:
+        return row * stride + col
+
+    if layout == BITS_LAYOUT:
+        return row * stride + (col >> 3)
+
+    tile = (row >> TILE_SHIFT) * stride + (col >> TILE_SHIFT)
+
+    return (((tile << TILE_SHIFT) + (row & TILE_MASK)) << TILE_SHIFT) + (col & TILE_MASK)
+
+def get_color(layout, colors, stride, row, col):
+    """Gets the color of a square from a flat color array.
+
+    Arguments:
+        layout(int): The layout of the array (ARRAY_LAYOUT, BITS_LAYOUT, or TILES_LAYOUT).
+        colors(ndarray): The flat array of colors.
+        stride(int): The number of entries per row (or tiles per row of tiles).
+        row(int): The row of the square.
+        col(int): The column of the square.
+
+    Returns:
+        The color of the square.
+    """
+
+    index = get_index(layout, stride, row, col)
+
+    if layout == BITS_LAYOUT:
+        return (colors[index] >> (7 - (col & 7))) & 1
+
+    return colors[index]
+
+def run_steps(num_steps,
+              num_rows,
+              num_cols,
+              layout,
+              colors,
+              stride,
+              transitions,
+              turns,
+              next_directions,
+              row_deltas,
+              col_deltas,
+              rows,
+              cols,
+              directions,
+              facings,
+              color_counts,
+              visited,
+              visited_stride,
+              visited_state,
+              visit_counts,
+              cell_locations,
+              square_rows,
+              square_cols,
+              square_colors,
+              color_mask,
+              hit_state,
+              history_rows,
+              history_cols,
+              history_directions,
+              history_facings,
+              history_colors,
+              history_state):
+    """Runs steps of a simulation of table-driven Fleas in place.
+
+    Each step matches Board.rotate_fleas, Board.change_square_colors,
+    and Board.move_fleas: every flea turns according to the color of
+    its square, then every flea recolors its square in order, then
+    every flea moves. The statistics of the Board are updated as well.
+    Stepping ends early if the simulation halts (see Board.is_halted)
+    or after a step which hits a breakpoint (see Breakpoints). Each
+    step is recorded in the ring buffer of a History if one is given.
+
+    Arguments:
+        num_steps(int): The number of steps to run.
+        num_rows(int): The number of rows in the Board.
+        num_cols(int): The number of columns in the Board.
+        layout(int): The layout of the colors (ARRAY_LAYOUT, BITS_LAYOUT, or TILES_LAYOUT).
+        colors(ndarray): The flat array of colors of the squares.
+        stride(int): The number of entries per row of colors (or tiles per row of tiles).
+        transitions(ndarray): The next color of each color.
+        turns(ndarray): The turn a flea takes on each color.
+        next_directions(ndarray): The direction after each turn from each direction.
+        row_deltas(ndarray): The row delta of each direction.
+        col_deltas(ndarray): The column delta of each direction.
+        rows(ndarray): The rows of the fleas.
+        cols(ndarray): The columns of the fleas.
+        directions(ndarray): The directions of the fleas.
+        facings(ndarray): The directions the fleas faced before they stopped.
+        color_counts(ndarray): The number of squares of each color.
+        visited(ndarray): The flat array of visited bits, one bit per square.
+        visited_stride(int): The number of bytes per row of visited bits.
+        visited_state(ndarray): The number of visited squares followed by
+            their bounding box (min row, min column, max row, max column).
+        visit_counts(ndarray): The flat array of the number of visits to
+            each square (empty to not count visits).
+        cell_locations(ndarray): The locations (row * num_cols + col) of the
+            cells watched for fleas entering them.
+        square_rows(ndarray): The rows of the squares watched for color changes.
+        square_cols(ndarray): The columns of the squares watched for color changes.
+        square_colors(ndarray): The last colors of the watched squares.
+        color_mask(ndarray): Whether each color is watched for fleas reaching it.
+        hit_state(ndarray): Where the kind and details of a hit are recorded.
+        history_rows(ndarray): The rows of the fleas before each recorded step.
+        history_cols(ndarray): The columns of the fleas before each recorded step.
+        history_directions(ndarray): The directions of the fleas before each recorded step.
+        history_facings(ndarray): The facings of the fleas before each recorded step.
+        history_colors(ndarray): The colors under the fleas before each recorded step.
+            (Empty to not record steps.)
+        history_state(ndarray): The slot where the next step is recorded
+            and the number of steps recorded.
+
+    Returns:
+        The number of steps taken.
+    """
+
+    num_fleas = len(rows)
+    watching = len(cell_locations) > 0 or len(square_rows) > 0 or color_mask.any()
+    capacity = len(history_colors)
+    counting = len(visit_counts) > 0
+
+    for step in range(num_steps):
+        # Check whether every flea is stopped on a color which does not change
+        halted = True
+        for i in range(num_fleas):
+            if directions[i] != STOP:
+                halted = False
+                break
+
+            color = get_color(layout, colors, stride, int(rows[i]), int(cols[i]))
+
+            if transitions[color] != color:
+                halted = False
+                break
+
+        if halted:
+            return step
+
+        # Record the state which the step will change (see History.record)
+        if capacity > 0:
+            slot = history_state[0]
+            for i in range(num_fleas):
+                history_rows[slot, i] = rows[i]
+                history_cols[slot, i] = cols[i]
+                history_directions[slot, i] = directions[i]
+                history_facings[slot, i] = facings[i]
+                history_colors[slot, i] = get_color(layout, colors, stride, int(rows[i]), int(cols[i]))
+            history_state[0] = (slot + 1) % capacity
+            history_state[1] = min(history_state[1] + 1, capacity)
+
+        # Rotate fleas
+        for i in range(num_fleas):
+            color = get_color(layout, colors, stride, int(rows[i]), int(cols[i]))
+
+            direction = directions[i]
+            next_direction = next_directions[direction, turns[color]]
+
+            if next_direction == STOP and direction != STOP:
+                facings[i] = direction
+            directions[i] = next_direction
+
+        # Change square colors
+        for i in range(num_fleas):
+            # Python ints so that indices into large boards do not overflow
+            row = int(rows[i])
+            col = int(cols[i])
+            index = get_index(layout, stride, row, col)
+
+            if layout == BITS_LAYOUT:
+                bit = 7 - (col & 7)
+                old_color = (colors[index] >> bit) & 1
+                new_color = transitions[old_color]
+                if new_color != old_color:
+                    colors[index] ^= 1 << bit
+            else:
+                old_color = colors[index]
+                new_color = transitions[old_color]
+                colors[index] = new_color
+
+            color_counts[old_color] -= 1
+            color_counts[new_color] += 1
+
+            if counting:
+                visit_counts[row * num_cols + col] += 1
+
+            visited_index = row * visited_stride + (col >> 3)
+            visited_bit = 1 << (7 - (col & 7))
+
+            if not visited[visited_index] & visited_bit:
+                visited[visited_index] |= visited_bit
+
+                if visited_state[0] == 0:
+                    visited_state[1] = visited_state[3] = row
+                    visited_state[2] = visited_state[4] = col
+                else:
+                    visited_state[1] = min(visited_state[1], row)
+                    visited_state[2] = min(visited_state[2], col)
+                    visited_state[3] = max(visited_state[3], row)
+                    visited_state[4] = max(visited_state[4], col)
+                visited_state[0] += 1
+
+        # Move fleas
+        for i in range(num_fleas):
+            rows[i] = (rows[i] + row_deltas[directions[i]]) % num_rows
+            cols[i] = (cols[i] + col_deltas[directions[i]]) % num_cols
+
+        if not watching:
+            continue
+
+        # Check breakpoints in the same order as Breakpoints.check
+        for j in range(len(square_rows)):
+            color = get_color(layout, colors, stride, square_rows[j], square_cols[j])
+
+            if color != square_colors[j]:
+                if hit_state[0] == NO_HIT:
+                    hit_state[0] = SQUARE_HIT
+                    hit_state[1] = j
+                    hit_state[2] = square_colors[j]
+                    hit_state[3] = color
+                square_colors[j] = color
+
+        for i in range(num_fleas):
+            if hit_state[0] != NO_HIT:
+                break
+
+            location = int(rows[i]) * num_cols + int(cols[i])
+            for j in range(len(cell_locations)):
+                if location == cell_locations[j]:
+                    hit_state[0] = CELL_HIT
+                    hit_state[1] = i
+                    hit_state[2] = rows[i]
+                    hit_state[3] = cols[i]
+                    break
+
+        for i in range(num_fleas):
+            if hit_state[0] != NO_HIT:
+                break
+
+            color = get_color(layout, colors, stride, int(rows[i]), int(cols[i]))
+            if color_mask[color]:
+                hit_state[0] = COLOR_HIT
+                hit_state[1] = i
+                hit_state[2] = color
+
+        if hit_state[0] != NO_HIT:
+            return step + 1
+
+    return num_steps
+
+if njit is not None:
+    get_index = njit(cache=True, inline='always')(get_index)
+    get_color = njit(cache=True, inline='always')(get_color)
+    run_steps = njit(cache=True)(run_steps)
+
+COMPILED = njit is not None
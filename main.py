@@ -1,11 +1,25 @@
 import argparse
+import time
 import pygame
-from constants import COLORS, MARGIN_TOP, MARGIN_SIDE, set_width, set_height, get_width, get_height
+from constants import MARGIN_TOP, MARGIN_SIDE, set_width, set_height, get_width, get_height
 from board import Board
+from breakpoints import Breakpoints
 from config import process_config
-from flea import get_flea, FLEA_CLASSES
-from helpers import format_message
+from control import ControlServer, get_status
+from display import Display, FLEA_MODES, MAX_IMAGE_FLEAS, MIN_GLYPH_SIZE
+from export import export_png
+from flea import get_flea, make_rule_flea, FLEA_CLASSES
+from helpers import format_message, pixels_to_row_column
+from recording import Recorder, Replay
 from text import Text
+from timeline import Timeline, get_keyframe_problem
+from timer import PhaseTimer, NullPhaseTimer
+
+# Maximum number of steps taken between checks for key and mouse hits
+MAX_BATCH_STEPS = 10000
+
+# Number of milliseconds to wait between checks for key and mouse hits while paused
+PAUSE_WAIT = 10
 
 def run_simulation(num_rows,
                    num_cols,
@@ -22,7 +36,20 @@ def run_simulation(num_rows,
                    display_frequency=1,
                    print_frequency=1e5,
                    delay=0,
-                   pause=False):
+                   pause=False,
+                   profile=False,
+                   profile_path=None,
+                   max_steps=None,
+                   max_time=None,
+                   exit_on_halt=False,
+                   breakpoints=None,
+                   history_size=1000,
+                   keyframe_interval=100000,
+                   record_path=None,
+                   control_address=None,
+                   flea_mode='auto',
+                   storage='auto',
+                   storage_path=None):
     """Runs a graphing fleas simulation.
 
     Arguments:
@@ -39,10 +66,11 @@ def run_simulation(num_rows,
         init_directions(list): The initial directions of the fleas.
             (Uspecified fleas will start facing up.)
         square_colors(list): Initial configuration of the colors of the squares.
-            (list of list of ints representing square colors.)
+            (list of list of ints or 2D array representing square colors.)
             If None, all squares are initialized to color 0.
         image(str): Name of image file in images directory to use as the flea image.
-        visited(bool): True to add an X to indicate which squares have been visited.
+        visited(bool): True to start with the heatmap of the number of visits
+            to each square shown (toggled with the "h" key).
         coordinates(bool): True to add coordinates to squares.
         hide_grid(bool): True to hide the grid lines.
         display_frequency(int): How many steps between each update of the display.
@@ -50,6 +78,37 @@ def run_simulation(num_rows,
         print_frequency(int): How often to print the step to the terminal.
         delay(int): The number of milliseconds of delay between each step.
         pause(bool): True to start the game in a paused state.
+        profile(bool): True to time each phase of the main loop and print
+            a summary at each print and at exit.
+        profile_path(str): Path to a JSON file where the phase timings
+            will be saved at exit (None to not save them).
+        max_steps(int): The number of steps after which the simulation
+            ends (None for no limit).
+        max_time(float): The number of seconds after which the simulation
+            ends (None for no limit).
+        exit_on_halt(bool): True to exit when the simulation halts (every
+            flea stopped on a square whose color does not change) or reaches
+            max_steps or max_time, rather than pausing.
+        breakpoints(Breakpoints): Breakpoints which pause the simulation
+            (None for no breakpoints).
+        history_size(int): The number of recent steps which can be undone
+            with the left arrow key (0 to not record steps).
+        keyframe_interval(int): The number of steps between keyframes which
+            let the simulation seek to any step with the "[", "]", and "g" keys
+            (0 to not take keyframes; ignored when recording).
+        record_path(str): Path to a file where every change to the board
+            is recorded so that it can be replayed with run_replay
+            (None to not record).
+        control_address(str): A port number, "host:port", or UNIX socket
+            path on which to accept commands which control the simulation
+            (None to not accept commands; see ControlServer).
+        flea_mode(str): How to draw the fleas ("image", "glyph", "pixel",
+            or "auto" to choose from the square size and number of fleas).
+        storage(str): How to store the colors of the squares
+            ("auto", "array", "bits", or "memmap").
+        storage_path(str): Path to the file backing memmap storage,
+            which must not already exist.
+            (None to use a temporary file.)
     """
 
     pygame.init()
@@ -59,8 +118,7 @@ def run_simulation(num_rows,
     screen = pygame.display.set_mode(window_size)
     pygame.display.set_caption('Graphing Fleas')
 
-    board = Board(screen,
-                  num_rows,
+    board = Board(num_rows,
                   num_cols,
                   flea_class,
                   num_fleas,
@@ -68,22 +126,58 @@ def run_simulation(num_rows,
                   flea_cols,
                   init_directions,
                   square_colors,
-                  image,
-                  visited,
-                  coordinates,
-                  hide_grid)
-    board.draw()
+                  storage,
+                  storage_path)
+
+    if breakpoints is not None:
+        breakpoints.attach(board)
+
+    if history_size > 0:
+        board.enable_history(history_size)
+
+    # Seeking would jump over changes which the recording needs
+    if record_path is not None:
+        board.recorder = Recorder(board, record_path)
+        keyframe_interval = 0
+
+    # Large boards run without seeking rather than failing to start
+    keyframe_problem = get_keyframe_problem(board) if keyframe_interval > 0 else None
+    if keyframe_problem is not None:
+        print('Warning: keyframes are disabled since {}'.format(keyframe_problem))
+        keyframe_interval = 0
+
+    timeline = Timeline(board, keyframe_interval) if keyframe_interval > 0 else None
+
+    display = Display(screen,
+                      board,
+                      image,
+                      visited,
+                      coordinates,
+                      hide_grid,
+                      flea_mode)
+    display.draw()
 
     text = Text(screen, board)
     text.update(format_message(0, pause))
 
     pygame.time.wait(500)
 
+    timer = PhaseTimer() if profile else NullPhaseTimer()
+
+    if control_address is not None:
+        control = ControlServer(control_address)
+        print('Accepting commands on {}'.format(control_address))
+    else:
+        control = None
+
     # Main loop
     quit = False
     step = 0
+    goto_text = None
+    start_time = time.perf_counter()
     while True:
         advance = False
+        target = None
 
         # Check for key and mouse hits
         for event in pygame.event.get():
@@ -91,6 +185,23 @@ def run_simulation(num_rows,
             if event.type == pygame.QUIT:
                 quit = True
 
+            # Type the step to go to
+            elif event.type == pygame.KEYDOWN and goto_text is not None:
+                if event.key == pygame.K_RETURN:
+                    try:
+                        target = int(float(goto_text))
+                    except ValueError:
+                        pass
+                    goto_text = None
+                elif event.key == pygame.K_ESCAPE:
+                    goto_text = None
+                elif event.key == pygame.K_BACKSPACE:
+                    goto_text = goto_text[:-1]
+                elif event.unicode and event.unicode in '0123456789.e':
+                    goto_text += event.unicode
+
+                text.update('Go to step: {}'.format(goto_text) if goto_text is not None else format_message(step, pause))
+
             elif event.type == pygame.KEYDOWN:
                 # Check for pause
                 if event.key == pygame.K_SPACE:
@@ -100,59 +211,372 @@ def run_simulation(num_rows,
                 # Check for display
                 elif event.key == pygame.K_d:
                     text.update(format_message(step, pause))
-                    board.draw()
+                    display.draw()
+
+                # Check for heatmap
+                elif event.key == pygame.K_h:
+                    display.toggle_heatmap()
+                    display.draw()
+
+                # Check for exporting the board as an image
+                elif event.key == pygame.K_p:
+                    path = 'board_{}.png'.format(step)
+                    export_png(board, path)
+                    print('Saved board to {}'.format(path))
 
                 # Check for advance
                 elif event.key == pygame.K_RIGHT:
                     advance = True
 
+                # Check for undo
+                elif event.key == pygame.K_LEFT and pause and board.undo():
+                    step -= 1
+                    if breakpoints is not None:
+                        breakpoints.reset()
+                    text.update(format_message(step, pause))
+                    display.draw()
+
+                # Check for seeking back or forward by one keyframe interval
+                elif event.key == pygame.K_LEFTBRACKET and timeline is not None:
+                    target = max(0, step - timeline.interval)
+                elif event.key == pygame.K_RIGHTBRACKET and timeline is not None:
+                    target = step + timeline.interval
+
+                # Check for go to step
+                elif event.key == pygame.K_g and timeline is not None:
+                    goto_text = ''
+                    pause = True
+                    text.update('Go to step: ')
+
             # Check for mouse click to set initial squares
             elif pause and event.type == pygame.MOUSEBUTTONUP:
                 click_type = 'right' if event.button == 3 else 'left'
-                mouse_pos = pygame.mouse.get_pos()
-                clicked_squares = [square for square in board.squares if square.rect.collidepoint(mouse_pos)]
-                
-                for square in clicked_squares:
+                row, col = pixels_to_row_column(*pygame.mouse.get_pos())
+
+                if 0 <= row < board.num_rows and 0 <= col < board.num_cols:
+                    square = board.get_square(row, col)
+
                     if click_type == 'left':
                         square.next_color()
                     elif click_type == 'right':
                         square.previous_color()
 
-                board.draw()
+                    # Edits do not count as watched squares changing color
+                    if breakpoints is not None:
+                        breakpoints.reset()
+
+                    # Edits cannot be undone, so forget the steps before them
+                    if board.history is not None:
+                        board.history.clear()
+
+                    # Keyframes after the edit no longer match the Board
+                    if timeline is not None:
+                        timeline.truncate(step)
+
+                display.draw()
+
+        timer.lap('events')
+
+        # Handle commands from the control socket (cheap when there are none)
+        for command in control.poll() if control is not None else []:
+            try:
+                if command.name == 'pause':
+                    pause = True
+                elif command.name == 'resume':
+                    pause = False
+                elif command.name == 'step':
+                    num_steps = command.get_int(0, 1)
+                    if max_steps is not None:
+                        num_steps = min(num_steps, max_steps - step)
+
+                    while num_steps > 0:
+                        batch = num_steps if timeline is None else min(num_steps, timeline.next_step(step) - step)
+                        num_batch_steps = board.run(batch, breakpoints)
+                        step += num_batch_steps
+                        num_steps -= num_batch_steps
+
+                        if timeline is not None:
+                            timeline.record(step)
+
+                        # Fewer steps are taken if the simulation halts or hits a breakpoint
+                        if num_batch_steps < batch:
+                            break
+
+                    if display_frequency != -1:
+                        display.draw()
+                elif command.name == 'snapshot':
+                    board.snapshot(command.get_str(0))
+                elif command.name == 'png':
+                    export_png(board, command.get_str(0), command.get_int(1, 1))
+                elif command.name == 'display_frequency':
+                    frequency = command.get_int(0)
+                    if frequency == 0 or frequency < -1:
+                        raise Exception('Display frequency must be positive or -1, not {}'.format(frequency))
+                    display_frequency = frequency
+                elif command.name == 'quit':
+                    quit = True
+                elif command.name not in ('status', 'stats'):
+                    raise Exception('Unknown command "{}"'.format(command.name))
+            except Exception as error:
+                command.fail(str(error))
+            else:
+                command.reply(**get_status(board, step, pause))
+
+            text.update(format_message(step, pause))
+
+        if control is not None:
+            timer.lap('control')
 
         # Break loop if quit
         if quit:
             break
 
+        # Seek to the requested step
+        if target is not None:
+            step = timeline.seek(step, target)
+            timer.lap('seek')
+
+            if breakpoints is not None:
+                breakpoints.reset()
+
+            text.update(format_message(step, pause))
+            display.draw()
+
+        # Wait instead of spinning while paused
+        if pause and not advance:
+            pygame.time.wait(PAUSE_WAIT)
+            timer.lap('wait')
+            continue
+
+        # End the simulation if it halted or reached a limit
+        if board.is_halted():
+            end = 'Halted'
+        elif max_steps is not None and step >= max_steps:
+            end = 'Reached max_steps'
+        elif max_time is not None and time.perf_counter() - start_time >= max_time:
+            end = 'Reached max_time'
+        else:
+            end = None
+
+        if end is not None:
+            print('{} at step {}'.format(end, step))
+            print(board.stats.summary())
+
+            if exit_on_halt:
+                break
+
+            pause = True
+            text.update(format_message(step, pause))
+            display.draw()
+            continue
+
+        # Take steps which are neither printed nor displayed in one batch
+        if not pause and not advance and step % print_frequency != 0 and \
+                (display_frequency == -1 or step % display_frequency != 0):
+            batch = min(MAX_BATCH_STEPS, print_frequency - step % print_frequency)
+            if display_frequency != -1:
+                batch = min(batch, display_frequency - step % display_frequency)
+            if max_steps is not None:
+                batch = min(batch, max_steps - step)
+            if breakpoints and breakpoints.next_step(step) is not None:
+                batch = min(batch, breakpoints.next_step(step) - step)
+            if timeline is not None:
+                batch = min(batch, timeline.next_step(step) - step)
+
+            # Fewer steps are taken if the simulation halts or hits a breakpoint
+            step += board.run(batch, breakpoints)
+            timer.lap('run')
+
         # Take step
-        if not pause or advance:
+        else:
             # Print step to terminal
             if step % print_frequency == 0:
                 print(format_message(step, pause))
+                print(board.stats.summary())
+                if profile:
+                    print(timer.summary())
 
             # Update text displaying step number
             if display_frequency != -1 and step % display_frequency == 0:
                 text.update(format_message(step, pause))
+                timer.lap('text')
+
+            # Record the step so that it can be undone
+            if board.history is not None:
+                board.history.record()
+
+            # Remember the squares the step changes so that it can be replayed
+            if board.recorder is not None:
+                board.recorder.begin(board.flea_store.rows, board.flea_store.cols)
 
             # Rotate fleas
             board.rotate_fleas()
+            timer.lap('rotate_fleas')
 
             if display_frequency != -1 and step % display_frequency == 0:
-                board.draw()
+                display.draw()
+                timer.lap('draw')
                 pygame.time.wait(delay)
+                timer.lap('wait')
 
             # Change square colors
             board.change_square_colors()
+            timer.lap('change_square_colors')
 
             # Move fleas
             board.move_fleas()
-            
+            timer.lap('move_fleas')
+
+            if board.recorder is not None:
+                board.recorder.end(1)
+
             if display_frequency != -1 and step % display_frequency == 0:
-                board.draw()
+                display.draw()
+                timer.lap('draw')
                 pygame.time.wait(delay)
+                timer.lap('wait')
 
             step += 1
 
+            if breakpoints is not None:
+                breakpoints.check()
+
+        # Take a keyframe every keyframe_interval steps
+        if timeline is not None:
+            timeline.record(step)
+
+        # Pause on breakpoints
+        if breakpoints and (breakpoints.hit is not None or breakpoints.check_step(step) is not None):
+            print('Breakpoint at step {}: {}'.format(step, breakpoints.hit))
+            pause = True
+            text.update(format_message(step, pause))
+            display.draw()
+
+    pygame.quit()
+
+    if board.recorder is not None:
+        board.recorder.close()
+
+    if control is not None:
+        control.close()
+
+    if profile:
+        print(format_message(step, pause))
+        print(timer.summary())
+
+        if profile_path is not None:
+            timer.save(profile_path)
+
+def run_replay(replay_path,
+               image='flea.png',
+               visited=False,
+               coordinates=False,
+               hide_grid=False,
+               display_frequency=1,
+               delay=0,
+               pause=False,
+               flea_mode='auto'):
+    """Plays back a recording made by run_simulation without simulating it.
+
+    Arguments:
+        replay_path(str): Path to the recording.
+        image(str): Name of image file in images directory to use as the flea image.
+        visited(bool): True to start with the heatmap of the number of visits
+            to each square shown (toggled with the "h" key).
+        coordinates(bool): True to add coordinates to squares.
+        hide_grid(bool): True to hide the grid lines.
+        display_frequency(int): How many recorded frames to advance between
+            each update of the display (changed with the up and down arrow keys).
+        delay(int): The number of milliseconds of delay between each update.
+        pause(bool): True to start the replay in a paused state.
+        flea_mode(str): How to draw the fleas ("image", "glyph", "pixel",
+            or "auto" to choose from the square size and number of fleas).
+    """
+
+    replay = Replay(replay_path)
+    board = replay.board
+
+    pygame.init()
+
+    window_size = (board.num_cols * get_width() + MARGIN_SIDE,
+                   board.num_rows * get_height() + MARGIN_TOP + MARGIN_SIDE)
+    screen = pygame.display.set_mode(window_size)
+    pygame.display.set_caption('Graphing Fleas (replay)')
+
+    display = Display(screen,
+                      board,
+                      image,
+                      visited,
+                      coordinates,
+                      hide_grid,
+                      flea_mode)
+    display.draw()
+
+    text = Text(screen, board)
+    text.update(format_message(replay.step, pause))
+
+    print('Replaying {} frames from step {} to step {}'.format(len(replay), replay.steps[0], replay.steps[-1]))
+
+    # Main loop
+    quit = False
+    speed = max(display_frequency, 1)
+    backward = False
+    while not quit:
+        target = None
+
+        # Check for key hits
+        for event in pygame.event.get():
+            # Check for quit
+            if event.type == pygame.QUIT:
+                quit = True
+
+            elif event.type == pygame.KEYDOWN:
+                # Check for pause
+                if event.key == pygame.K_SPACE:
+                    pause = not pause
+
+                # Check for single frames
+                elif event.key == pygame.K_RIGHT and pause:
+                    target = replay.frame + 1
+                elif event.key == pygame.K_LEFT and pause:
+                    target = replay.frame - 1
+
+                # Check for speed and direction
+                elif event.key == pygame.K_UP:
+                    speed *= 2
+                    print('Speed {} frames per update'.format(speed))
+                elif event.key == pygame.K_DOWN:
+                    speed = max(speed // 2, 1)
+                    print('Speed {} frames per update'.format(speed))
+                elif event.key == pygame.K_r:
+                    backward = not backward
+                    print('Playing {}'.format('backward' if backward else 'forward'))
+
+                # Check for heatmap
+                elif event.key == pygame.K_h:
+                    display.toggle_heatmap()
+                    display.draw()
+
+                text.update(format_message(replay.step, pause))
+
+        # Wait instead of spinning while paused
+        if target is None:
+            if pause:
+                pygame.time.wait(PAUSE_WAIT)
+                continue
+
+            target = replay.frame - speed if backward else replay.frame + speed
+
+        replay.seek(target)
+
+        # Pause at either end of the recording
+        if not pause and replay.frame in (0, len(replay)):
+            pause = True
+
+        text.update(format_message(replay.step, pause))
+        display.draw()
+        pygame.time.wait(delay)
+
     pygame.quit()
 
 if __name__ == '__main__':
@@ -163,18 +587,37 @@ if __name__ == '__main__':
     parser.add_argument('--width', type=int, default=75, help='Width of each square (in pixels)')
     parser.add_argument('--height', type=int, default=75, help='Height of each square (in pixels)')
     parser.add_argument('--flea_name', type=str, default='langtons', help='The name of the class of Flea to create. Options: {}'.format(', '.join(FLEA_CLASSES.keys())))
+    parser.add_argument('--rule', type=str, default=None, help='Rule string defining the flea instead of --flea_name, with one code per color: N (straight), R (right), U (U-turn), L (left), or X (stop). Ex. RRLLLRLLLRRR')
+    parser.add_argument('--color_map', type=int, nargs='+', default=None, help='The next color of each color for a --rule flea (default cycles through the colors in order)')
     parser.add_argument('--num_fleas', type=int, default=1, help='Number of Fleas')
     parser.add_argument('--flea_rows', type=int, nargs='+', default=[None], help='Initial row of fleas (None for center of board vertically; unspecified fleas will be placed randomly)')
     parser.add_argument('--flea_cols', type=int, nargs='+', default=[None], help='Initial column of fleas (None for center of board horizontally; unspecified fleas will be placed randomly)')
     parser.add_argument('--init_directions', type=str, nargs='+', default=['up'], help='Initial directions of the fleas (unspecified fleas will start facing up)')
+    parser.add_argument('--storage', type=str, default='auto', choices=['auto', 'array', 'bits', 'memmap'], help='How to store the colors of the squares (auto uses bits for two-color fleas and arrays otherwise; memmap uses a memory-mapped file for boards larger than memory)')
+    parser.add_argument('--storage_path', type=str, default=None, help='Path to the file backing memmap storage, which must not already exist (default is a temporary file)')
     parser.add_argument('--image', type=str, default='flea.png', help='Name of image file in images directory to use as the flea image. Current options: "flea.png", "arrow.png"')
-    parser.add_argument('--visited', action='store_true', default=False, help='Add an X to indicate which squares have been visited')
+    parser.add_argument('--flea_mode', type=str, default='auto', choices=FLEA_MODES, help='How to draw the fleas: image draws the flea image for each flea, glyph draws a triangle pointing the way each flea faces, and pixel fills the squares of the fleas (auto uses pixel for squares smaller than {} pixels, image for at most {} fleas, and glyph otherwise)'.format(MIN_GLYPH_SIZE, MAX_IMAGE_FLEAS))
+    parser.add_argument('--visited', action='store_true', default=False, help='Start with the heatmap of the number of visits to each square shown (toggled with the "h" key)')
     parser.add_argument('--coordinates', action='store_true', default=False, help='Display coordinates in squares')
     parser.add_argument('--hide_grid', action='store_true', default=False, help='Hide the grid lines')
     parser.add_argument('--display_frequency', type=str, default='1', help='How often to update the display (-1 to update only on pressing "d" key; may be in scientific notation)')
     parser.add_argument('--print_frequency', type=str, default='1e5', help='How often to print the step to the terminal (may be in scientific notation)')
     parser.add_argument('--delay', type=int, default=0, help='Number of milliseconds between steps')
     parser.add_argument('--pause', action='store_true', default=False, help='Start the game in a paused state')
+    parser.add_argument('--profile', action='store_true', default=False, help='Time each phase of the main loop and print a summary with each print and at exit')
+    parser.add_argument('--max_steps', type=str, default=None, help='Number of steps after which the simulation ends (may be in scientific notation)')
+    parser.add_argument('--max_time', type=float, default=None, help='Number of seconds after which the simulation ends')
+    parser.add_argument('--exit_on_halt', action='store_true', default=False, help='Exit when the simulation halts (all fleas stopped on squares whose colors do not change) or reaches max_steps or max_time, instead of pausing')
+    parser.add_argument('--history_size', type=int, default=1000, help='Number of recent steps which can be undone with the left arrow key while paused (0 to not record steps)')
+    parser.add_argument('--keyframe_interval', type=str, default='1e5', help='Number of steps between keyframes for seeking to a step with the "[", "]", and "g" keys (0 to not take keyframes; may be in scientific notation)')
+    parser.add_argument('--break_cells', type=int, nargs='+', default=[], help='Rows and columns (row1 col1 row2 col2 ...) of cells where the simulation pauses when a flea enters them')
+    parser.add_argument('--break_squares', type=int, nargs='+', default=[], help='Rows and columns (row1 col1 row2 col2 ...) of squares where the simulation pauses when they change color')
+    parser.add_argument('--break_colors', type=int, nargs='+', default=[], help='Colors where the simulation pauses when a flea reaches a square of that color')
+    parser.add_argument('--break_steps', type=str, nargs='+', default=[], help='Steps where the simulation pauses (may be in scientific notation)')
+    parser.add_argument('--record', type=str, default=None, help='Path to a file where every change to the board is recorded so that it can be replayed with --replay (disables keyframes)')
+    parser.add_argument('--replay', type=str, default=None, help='Path to a recording made with --record to play back instead of simulating (uses --width, --height, --image, --flea_mode, --visited, --coordinates, --hide_grid, --display_frequency, --delay, and --pause)')
+    parser.add_argument('--control', type=str, default=None, help='Port number, "host:port", or UNIX socket path on which to accept commands from scripts (pause, resume, step N, status, snapshot PATH, png PATH [SCALE], display_frequency N, quit), one per line with a JSON reply per line')
+    parser.add_argument('--profile_path', type=str, default=None, help='Path to JSON file where the phase timings will be saved at exit (implies --profile)')
     args = parser.parse_args()
 
     # Process config (if there is one) and update args
@@ -185,25 +628,65 @@ if __name__ == '__main__':
     set_height(args.height)
 
     # Get flea class
-    args.flea_class = get_flea(args.flea_name)
+    if args.rule is not None:
+        args.flea_class = make_rule_flea(args.rule, args.color_map)
+    else:
+        args.flea_class = get_flea(args.flea_name)
 
     # Convert to float then int to allow for scientific notation
     args.display_frequency = int(float(args.display_frequency))
     args.print_frequency = int(float(args.print_frequency))
+    args.keyframe_interval = int(float(args.keyframe_interval))
+    if args.max_steps is not None:
+        args.max_steps = int(float(args.max_steps))
+
+    # Pair up rows and columns of breakpoints
+    breakpoints = Breakpoints(list(zip(args.break_cells[::2], args.break_cells[1::2])),
+                              list(zip(args.break_squares[::2], args.break_squares[1::2])),
+                              args.break_colors,
+                              [int(float(step)) for step in args.break_steps])
+
+    # Saving the phase timings requires collecting them
+    args.profile = args.profile or args.profile_path is not None
 
-    run_simulation(args.num_rows,
-                   args.num_cols,
-                   args.flea_class,
-                   args.num_fleas,
-                   args.flea_rows,
-                   args.flea_cols,
-                   args.init_directions,
-                   args.square_colors,
+    # Play back a recording instead of simulating
+    if args.replay is not None:
+        run_replay(args.replay,
                    args.image,
                    args.visited,
                    args.coordinates,
                    args.hide_grid,
                    args.display_frequency,
-                   args.print_frequency,
                    args.delay,
-                   args.pause)
+                   args.pause,
+                   args.flea_mode)
+    else:
+        run_simulation(args.num_rows,
+                       args.num_cols,
+                       args.flea_class,
+                       args.num_fleas,
+                       args.flea_rows,
+                       args.flea_cols,
+                       args.init_directions,
+                       args.square_colors,
+                       args.image,
+                       args.visited,
+                       args.coordinates,
+                       args.hide_grid,
+                       args.display_frequency,
+                       args.print_frequency,
+                       args.delay,
+                       args.pause,
+                       args.profile,
+                       args.profile_path,
+                       args.max_steps,
+                       args.max_time,
+                       args.exit_on_halt,
+                       breakpoints if breakpoints else None,
+                       args.history_size,
+                       args.keyframe_interval,
+                       args.record,
+                       args.control,
+                       args.flea_mode,
+                       args.storage,
+                       args.storage_path)
@@ -0,0 +1,305 @@
+import json
+import os
+
+import numpy as np
+
+from board import Board
+from cache import describe_flea_class
+from constants import STRAIGHT
+from deltas import iter_deltas
+from flea import Flea
+
+# Increment when the format of recordings changes
+RECORDING_VERSION = 1
+
+# Number of frames buffered in memory before they are written as a chunk
+RECORDING_CHUNK_FRAMES = 1000
+
+class Recorder:
+    """A Recorder writes every change made to a Board to a file so that it can be replayed.
+
+    Each change is recorded as a frame: the step the simulation is at
+    afterwards, the squares which changed with their old and new colors,
+    and the rows, columns, directions, and facings of all the fleas.
+    Frames are recorded for steps, for undoing steps, and for squares
+    edited by hand. They are buffered and written in chunks. Steps
+    taken by Board.run are recorded in bulk from the change records of
+    iter_deltas, so they run in the compiled kernel when it is available.
+
+    The file is a sequence of .npy arrays: a JSON header, the initial
+    colors of the squares and state of the fleas, and then for each chunk
+    the steps, the number of changed squares, the changed squares' rows,
+    columns, old colors, and new colors, and the fleas of each frame.
+    """
+
+    def __init__(self, board, path, step=0):
+        """Initializes the Recorder and writes the current state of the Board.
+
+        Arguments:
+            board(Board): The Board whose changes are recorded.
+            path(str): The path to the file where the recording is written.
+            step(int): The step the Board is at.
+        """
+
+        self.board = board
+        self.path = path
+        self.step = step
+        self.file = open(path, 'wb')
+
+        store = board.flea_store
+        header = {
+            'version': RECORDING_VERSION,
+            'num_rows': board.num_rows,
+            'num_cols': board.num_cols,
+            'num_colors': board.num_colors,
+            'num_fleas': len(store),
+            'step': step,
+            'flea_class': describe_flea_class(board.flea_class)
+        }
+
+        np.save(self.file, np.frombuffer(json.dumps(header).encode(), dtype=np.uint8))
+        np.save(self.file, board.get_colors())
+        for array in [store.rows, store.cols, store.directions, store.facings]:
+            np.save(self.file, array)
+
+        # Buffered frames as tuples of arrays with one entry per frame (see flush)
+        self.chunks = []
+        self.num_frames = 0
+        self.rows = self.cols = self.old_colors = None
+
+    def begin(self, rows, cols):
+        """Remembers the colors of the squares which are about to change.
+
+        Arguments:
+            rows(ndarray): The rows of the squares.
+            cols(ndarray): The columns of the squares.
+        """
+
+        # Squares under several fleas are recorded once
+        _, indices = np.unique(np.asarray(rows, dtype=np.int64) * self.board.num_cols + cols, return_index=True)
+        self.rows = np.asarray(rows, dtype=np.int32)[indices]
+        self.cols = np.asarray(cols, dtype=np.int32)[indices]
+        self.old_colors = self.board.storage.get_many(self.rows, self.cols)
+
+    def end(self, num_steps):
+        """Records a frame with the new colors of the squares passed to begin.
+
+        Arguments:
+            num_steps(int): The number of steps the change took
+                (1 for a step, -1 for an undo, 0 for an edit).
+        """
+
+        store = self.board.flea_store
+        self.step += num_steps
+
+        self.add_frames(np.array([self.step], dtype=np.int64),
+                        np.array([len(self.rows)], dtype=np.int64),
+                        self.rows,
+                        self.cols,
+                        self.old_colors,
+                        self.board.storage.get_many(self.rows, self.cols),
+                        store.rows.copy()[None],
+                        store.cols.copy()[None],
+                        store.directions.copy()[None],
+                        store.facings.copy()[None])
+
+    def record_chunk(self, chunk):
+        """Records a frame for each step in a chunk of change records.
+
+        Arguments:
+            chunk(dict): A dictionary of arrays of change records for
+                consecutive steps (see iter_deltas).
+        """
+
+        num_fleas = len(self.board.flea_store)
+        num_steps = len(chunk['step']) // num_fleas
+
+        # Squares under several fleas are recorded once per step
+        step_indices = chunk['step'] - chunk['step'][0]
+        keys = (step_indices * self.board.num_rows + chunk['row']) * self.board.num_cols + chunk['col']
+        _, first = np.unique(keys, return_index=True)
+
+        self.step = int(chunk['step'][-1])
+
+        self.add_frames(chunk['step'][::num_fleas],
+                        np.bincount(step_indices[first], minlength=num_steps),
+                        chunk['row'][first],
+                        chunk['col'][first],
+                        chunk['old_color'][first],
+                        chunk['color'][first],
+                        *[chunk[field].reshape(num_steps, num_fleas)
+                          for field in ['flea_row', 'flea_col', 'direction', 'facing']])
+
+    def add_frames(self, *arrays):
+        """Buffers frames and writes them once enough are buffered.
+
+        Arguments:
+            arrays(tuple): The steps, the number of changed squares, the rows,
+                columns, old colors, and new colors of the changed squares, and
+                the rows, columns, directions, and facings of the fleas of the frames.
+        """
+
+        self.chunks.append(arrays)
+        self.num_frames += len(arrays[0])
+
+        if self.num_frames >= RECORDING_CHUNK_FRAMES:
+            self.flush()
+
+    def run(self, num_steps, breakpoints=None):
+        """Takes and records several steps (called by Board.run while recording).
+
+        Arguments:
+            num_steps(int): The maximum number of steps to take.
+            breakpoints(Breakpoints): Breakpoints checked after each step (see Board.run).
+
+        Returns:
+            The number of steps taken.
+        """
+
+        board = self.board
+        num_fleas = len(board.flea_store)
+        step = 0
+
+        # Detach so that the steps run by iter_deltas are not recorded twice
+        board.recorder = None
+        try:
+            for chunk in iter_deltas(board, num_steps, RECORDING_CHUNK_FRAMES, breakpoints, self.step):
+                self.record_chunk(chunk)
+                step += len(chunk['step']) // num_fleas
+        finally:
+            board.recorder = self
+
+        return step
+
+    def flush(self):
+        """Writes the buffered frames as a chunk."""
+
+        if not self.chunks:
+            return
+
+        for arrays in zip(*self.chunks):
+            np.save(self.file, np.concatenate(arrays))
+
+        self.file.flush()
+        self.chunks = []
+        self.num_frames = 0
+
+    def close(self):
+        """Writes the remaining frames and closes the file."""
+
+        self.flush()
+        self.file.close()
+
+
+class Replay:
+    """A Replay plays back a recording by applying its recorded changes to a Board.
+
+    The Board has the recorded size and colors, but its Fleas are
+    never rotated: moving to a frame only sets the colors of the
+    changed squares and the recorded state of the fleas. Frames are
+    applied in bulk, so moving many frames at once costs one
+    vectorized pass over their changes, forward or backward.
+    """
+
+    def __init__(self, path):
+        """Loads a recording.
+
+        Arguments:
+            path(str): The path to the file written by a Recorder.
+        """
+
+        with open(path, 'rb') as recording_file:
+            header = json.loads(np.load(recording_file).tobytes().decode())
+
+            if header['version'] != RECORDING_VERSION:
+                raise Exception('Recording "{}" has version {}, not {}'.format(path, header['version'], RECORDING_VERSION))
+
+            colors = np.load(recording_file)
+            initial_fleas = [np.load(recording_file) for _ in range(4)]
+
+            size = os.fstat(recording_file.fileno()).st_size
+            chunks = []
+            while recording_file.tell() < size:
+                chunks.append([np.load(recording_file) for _ in range(10)])
+
+        self.header = header
+
+        # Frame 0 is the initial state and frame i is the state after the ith change
+        self.steps = np.concatenate([[header['step']]] + [chunk[0] for chunk in chunks]).astype(np.int64)
+        self.offsets = np.cumsum(np.concatenate([[0]] + [chunk[1] for chunk in chunks])).astype(np.int64)
+        self.rows, self.cols, self.old_colors, self.new_colors = [
+            np.concatenate([np.zeros(0, dtype=dtype)] + [chunk[index] for chunk in chunks])
+            for index, dtype in zip(range(2, 6), [np.int32, np.int32, colors.dtype, colors.dtype])]
+        self.flea_rows, self.flea_cols, self.directions, self.facings = [
+            np.concatenate([initial[None]] + [chunk[index] for chunk in chunks])
+            for index, initial in zip(range(6, 10), initial_fleas)]
+
+        # Stands in for the recorded Flea class, which is not needed to replay (it never rotates)
+        flea_class = type('ReplayFlea', (Flea,), {'num_colors': header['num_colors'],
+                                                  'turns': [STRAIGHT] * header['num_colors']})
+
+        self.board = Board(header['num_rows'],
+                           header['num_cols'],
+                           flea_class,
+                           header['num_fleas'],
+                           initial_fleas[0].tolist(),
+                           initial_fleas[1].tolist(),
+                           initial_fleas[2].tolist(),
+                           colors)
+        self.board.flea_store.facings[:] = initial_fleas[3]
+
+        self.frame = 0
+
+    def __len__(self):
+        """The number of frames after the initial state."""
+
+        return len(self.steps) - 1
+
+    @property
+    def step(self):
+        return int(self.steps[self.frame])
+
+    def seek(self, frame):
+        """Moves the Board to a frame by applying the changes in between.
+
+        Arguments:
+            frame(int): The frame to move to (clamped to the recording).
+
+        Returns:
+            The frame the Board is at afterwards.
+        """
+
+        frame = min(max(frame, 0), len(self))
+
+        if frame == self.frame:
+            return frame
+
+        start, end = sorted([self.frame, frame])
+        changes = slice(self.offsets[start], self.offsets[end])
+        locations = self.rows[changes].astype(np.int64) * self.board.num_cols + self.cols[changes]
+
+        # Going forward each square takes its last new color, and going backward its first old color
+        if frame > self.frame:
+            _, indices = np.unique(locations[::-1], return_index=True)
+            indices = len(locations) - 1 - indices
+            colors = self.new_colors[changes][indices]
+        else:
+            _, indices = np.unique(locations, return_index=True)
+            colors = self.old_colors[changes][indices]
+
+        rows, cols = self.rows[changes][indices], self.cols[changes][indices]
+        board, store = self.board, self.board.flea_store
+
+        board.stats.change_colors(board.storage.get_many(rows, cols), colors)
+        board.storage.set_many(rows, cols, colors)
+        if frame > self.frame:
+            board.stats.visit_all(rows, cols)
+
+        store.rows[:] = self.flea_rows[frame]
+        store.cols[:] = self.flea_cols[frame]
+        store.directions[:] = self.directions[frame]
+        store.facings[:] = self.facings[frame]
+
+        self.frame = frame
+
+        return frame
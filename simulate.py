@@ -0,0 +1,212 @@
+import time
+
+import numpy as np
+from board import Board
+from cache import hash_board
+from control import get_status
+from export import export_png
+from storage import unpack_layout
+
+# Maximum number of steps taken between checks for commands
+CONTROL_BATCH_STEPS = 100000
+
+# Number of seconds to wait between checks for commands while paused
+CONTROL_PAUSE_WAIT = 0.01
+
+def get_result(board, num_steps, step):
+    """Collects the final state and statistics of a Board.
+
+    Arguments:
+        board(Board): The Board.
+        num_steps(int): The number of steps which were requested.
+        step(int): The number of steps which were taken.
+
+    Returns:
+        A dictionary of arrays with the number of steps requested and
+        taken, whether the simulation halted, the colors of the squares
+        in the layout of the storage (see get_result_colors), the rows,
+        columns, directions, and facings of the fleas, and the
+        statistics (number of squares of each color, number of visited
+        squares, and their bounding box).
+    """
+
+    store, stats = board.flea_store, board.stats
+
+    # Keep the live colors packed or tiled, since copying or unpacking a large board can take far more memory
+    layout, colors, stride = board.storage.get_layout()
+
+    return {
+        'num_steps': np.array(num_steps),
+        'step': np.array(step),
+        'halted': np.array(board.is_halted()),
+        'num_rows': np.array(board.num_rows),
+        'num_cols': np.array(board.num_cols),
+        'layout': np.array(layout),
+        'layout_colors': colors,
+        'layout_stride': np.array(stride),
+        'flea_rows': store.rows.copy(),
+        'flea_cols': store.cols.copy(),
+        'directions': store.directions.copy(),
+        'facings': store.facings.copy(),
+        'color_counts': np.array(stats.color_counts, dtype=np.int64),
+        'num_visited': np.array(stats.num_visited),
+        'bounding_box': np.array(stats.bounding_box or (-1, -1, -1, -1))
+    }
+
+def get_result_colors(result):
+    """Unpacks the colors of the squares of a result.
+
+    Arguments:
+        result(dict): A result (see get_result).
+
+    Returns:
+        A 2D array of colors with one color per square.
+    """
+
+    return unpack_layout(int(result['layout']), result['layout_colors'], int(result['layout_stride']),
+                         int(result['num_rows']), int(result['num_cols']))
+
+def run_controlled(board, num_steps, control):
+    """Takes steps of a simulation headless while handling commands from a ControlServer.
+
+    Steps are taken in batches of CONTROL_BATCH_STEPS, and commands
+    are polled between batches. The commands are pause, resume,
+    step N (while paused), status (or stats), snapshot PATH,
+    png PATH [SCALE], and quit, each of which is replied to with the
+    status of the simulation.
+
+    Arguments:
+        board(Board): The Board.
+        num_steps(int): The maximum number of steps to take.
+        control(ControlServer): The server receiving the commands.
+
+    Returns:
+        The number of steps taken, which is less than num_steps if
+        the simulation halted or was quit.
+    """
+
+    step = 0
+    pause = quit = halted = False
+
+    while step < num_steps and not quit and not halted:
+        for command in control.poll():
+            try:
+                if command.name == 'pause':
+                    pause = True
+                elif command.name == 'resume':
+                    pause = False
+                elif command.name == 'step':
+                    batch = min(command.get_int(0, 1), num_steps - step)
+                    num_batch_steps = board.run(batch)
+                    step += num_batch_steps
+                    halted = num_batch_steps < batch
+                elif command.name == 'snapshot':
+                    board.snapshot(command.get_str(0))
+                elif command.name == 'png':
+                    export_png(board, command.get_str(0), command.get_int(1, 1))
+                elif command.name == 'quit':
+                    quit = True
+                elif command.name not in ('status', 'stats'):
+                    raise Exception('Unknown command "{}"'.format(command.name))
+            except Exception as error:
+                command.fail(str(error))
+            else:
+                command.reply(**get_status(board, step, pause))
+
+        if quit or halted:
+            break
+
+        if pause:
+            time.sleep(CONTROL_PAUSE_WAIT)
+            continue
+
+        batch = min(CONTROL_BATCH_STEPS, num_steps - step)
+        num_batch_steps = board.run(batch)
+        step += num_batch_steps
+
+        # Fewer steps are taken only if the simulation halted
+        halted = num_batch_steps < batch
+
+    return step
+
+def simulate(num_rows,
+             num_cols,
+             flea_class,
+             num_fleas,
+             flea_rows,
+             flea_cols,
+             init_directions,
+             square_colors,
+             num_steps,
+             storage='auto',
+             storage_path=None,
+             cache=None,
+             control=None):
+    """Runs a simulation headless for a number of steps.
+
+    The simulation returns as soon as it halts (see Board.is_halted).
+    If a cache is provided, it is consulted before simulating and
+    the result is added to it afterwards, so repeating a simulation
+    with the same initial configuration returns immediately. If a
+    ControlServer is provided, the simulation can be inspected and
+    controlled while it runs (see run_controlled).
+
+    Arguments:
+        num_rows(int): Number of rows in the board.
+        num_cols(int): Number of columns in the board.
+        flea_class(class): The class of the Fleas to create.
+        num_fleas(int): The number of Fleas to create.
+        flea_rows(list): The initial rows of the fleas.
+            (None to start in the center vertically.
+             Unspecified fleas will be placed randomly.)
+        flea_cols(list): The initial columns of the fleas.
+            (None to start in the center horizontally.
+             Unspecified fleas will be placed randomly.)
+        init_directions(list): The initial directions of the fleas.
+            (Uspecified fleas will start facing up.)
+        square_colors(list): Initial configuration of the colors of the squares.
+            (list of list of ints or 2D array representing square colors.)
+            If None, all squares are initialized to color 0.
+        num_steps(int): The maximum number of steps to simulate.
+        storage(str): How to store the colors of the squares
+            ("auto", "array", "bits", or "memmap").
+        storage_path(str): Path to the file backing memmap storage,
+            which must not already exist.
+            (None to use a temporary file.)
+        cache(ResultCache): The cache of results (None to not use a cache).
+        control(ControlServer): The server receiving commands (None to not accept commands).
+
+    Returns:
+        A dictionary of arrays with the final state and statistics (see get_result).
+    """
+
+    board = Board(num_rows,
+                  num_cols,
+                  flea_class,
+                  num_fleas,
+                  flea_rows,
+                  flea_cols,
+                  init_directions,
+                  square_colors,
+                  storage,
+                  storage_path)
+
+    if cache is not None:
+        key = hash_board(board, num_steps)
+        result = cache.get(key)
+
+        if result is not None:
+            return result
+
+    if control is not None:
+        step = run_controlled(board, num_steps, control)
+    else:
+        step = board.run(num_steps)
+
+    result = get_result(board, num_steps, step)
+
+    # Simulations which were quit early are not cached
+    if cache is not None and (step == num_steps or board.is_halted()):
+        cache.put(key, result)
+
+    return result
@@ -0,0 +1,164 @@
+import numpy as np
+from storage import BitStorage
+
+class BoardStats:
+    """BoardStats maintains statistics about a Board incrementally as Squares change color.
+
+    Tracks a histogram of the number of Squares of each color,
+    the number of Squares which have been visited by a Flea, and
+    the bounding box of the visited Squares. Each update costs O(1),
+    so the statistics can be sampled at any step without scanning
+    the Board. The number of visits to each Square can also be
+    counted (see enable_visit_counts).
+    """
+
+    def __init__(self, num_rows, num_cols, num_colors, color_counts):
+        """Initializes the BoardStats.
+
+        Arguments:
+            num_rows(int): The number of rows in the Board.
+            num_cols(int): The number of columns in the Board.
+            num_colors(int): The number of colors a Square can take on.
+            color_counts(ndarray): The initial number of squares of each color.
+        """
+
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.num_colors = num_colors
+
+        self.color_counts = [int(count) for count in color_counts]
+
+        # One bit per square so that tracking visits does
+        # not take more memory than the colors themselves
+        self.visited = BitStorage(num_rows, num_cols)
+        self.num_visited = 0
+        self.min_row = self.min_col = None
+        self.max_row = self.max_col = None
+
+        # Number of visits to each square (only allocated when needed)
+        self.visit_counts = None
+
+    def enable_visit_counts(self):
+        """Starts counting the visits to each Square.
+
+        Returns:
+            A 2D uint32 array with the number of visits to each Square
+            since counting started.
+        """
+
+        if self.visit_counts is None:
+            self.visit_counts = np.zeros((self.num_rows, self.num_cols), dtype=np.uint32)
+
+        return self.visit_counts
+
+    def change_color(self, old_color, new_color):
+        """Records a Square changing color.
+
+        Arguments:
+            old_color(int): The color of the Square before the change.
+            new_color(int): The color of the Square after the change.
+        """
+
+        self.color_counts[old_color] -= 1
+        self.color_counts[new_color] += 1
+
+    def change_colors(self, old_colors, new_colors):
+        """Records several Squares changing color at once.
+
+        Arguments:
+            old_colors(ndarray): The colors of the Squares before the change.
+            new_colors(ndarray): The colors of the Squares after the change.
+        """
+
+        difference = np.bincount(new_colors, minlength=self.num_colors) - \
+                     np.bincount(old_colors, minlength=self.num_colors)
+
+        for color in np.flatnonzero(difference).tolist():
+            self.color_counts[color] += int(difference[color])
+
+    def visit(self, row, col):
+        """Records a Flea visiting a Square.
+
+        Arguments:
+            row(int): The row of the Square.
+            col(int): The column of the Square.
+        """
+
+        if self.visit_counts is not None:
+            self.visit_counts[row, col] += 1
+
+        if self.visited.get(row, col):
+            return
+
+        self.visited.flip(row, col)
+        self.num_visited += 1
+
+        if self.num_visited == 1:
+            self.min_row = self.max_row = row
+            self.min_col = self.max_col = col
+        else:
+            self.min_row = min(self.min_row, row)
+            self.max_row = max(self.max_row, row)
+            self.min_col = min(self.min_col, col)
+            self.max_col = max(self.max_col, col)
+
+    def visit_all(self, rows, cols):
+        """Records Fleas visiting several Squares at once.
+
+        Arguments:
+            rows(ndarray): The rows of the Squares.
+            cols(ndarray): The columns of the Squares.
+        """
+
+        # Squares under several fleas are counted once per flea
+        if self.visit_counts is not None:
+            np.add.at(self.visit_counts, (rows, cols), 1)
+
+        new = self.visited.get_many(rows, cols) == 0
+
+        if not new.any():
+            return
+
+        # Squares under several fleas are only counted once
+        locations = np.unique(rows[new].astype(np.int64) * self.num_cols + cols[new])
+        rows, cols = np.divmod(locations, self.num_cols)
+        self.visited.set_many(rows, cols, np.ones(len(locations), dtype=np.uint8))
+        self.num_visited += len(locations)
+
+        bounds = [rows.min(), cols.min(), rows.max(), cols.max()]
+        if self.min_row is not None:
+            bounds = [min(self.min_row, bounds[0]), min(self.min_col, bounds[1]),
+                      max(self.max_row, bounds[2]), max(self.max_col, bounds[3])]
+
+        self.min_row, self.min_col, self.max_row, self.max_col = [int(bound) for bound in bounds]
+
+    @property
+    def bounding_box(self):
+        """The bounding box of the visited Squares.
+
+        Returns:
+            A tuple (min_row, min_col, max_row, max_col) of the
+            visited Squares (None if no Square has been visited).
+        """
+
+        if self.num_visited == 0:
+            return None
+
+        return (self.min_row, self.min_col, self.max_row, self.max_col)
+
+    def summary(self):
+        """Formats the statistics as a single line of text.
+
+        Returns:
+            A string with the number of visited Squares, their
+            bounding box, and the number of Squares of each color.
+        """
+
+        if self.num_visited == 0:
+            box = 'none'
+        else:
+            box = '({},{})-({},{})'.format(*self.bounding_box)
+
+        counts = ' '.join('{}:{}'.format(color, count) for color, count in enumerate(self.color_counts))
+
+        return 'visited {}, bounding box {}, colors {}'.format(self.num_visited, box, counts)
@@ -0,0 +1,434 @@
+import numpy as np
+import os
+import tempfile
+
+# Number of set bits in each byte value
+POPCOUNTS = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.int64)
+
+# Memory-mapped boards are stored in square tiles of TILE_SIZE x TILE_SIZE squares
+TILE_SHIFT = 6
+TILE_SIZE = 1 << TILE_SHIFT
+TILE_MASK = TILE_SIZE - 1
+
+# How each storage lays out the colors in its flat array (see get_layout)
+ARRAY_LAYOUT = 0  # One color per square, row by row
+BITS_LAYOUT = 1   # One bit per square, row by row, most significant bit first
+TILES_LAYOUT = 2  # One color per square, in square tiles of TILE_SIZE x TILE_SIZE
+
+# Number of packed bytes of a BitStorage counted at a time, which bounds memory
+COUNT_BAND_BYTES = 2**22
+
+class ArrayStorage:
+    """An ArrayStorage stores the colors of a Board as one small integer per Square."""
+
+    def __init__(self, num_rows, num_cols, num_colors, colors=None):
+        """Initializes the ArrayStorage.
+
+        Arguments:
+            num_rows(int): The number of rows in the Board.
+            num_cols(int): The number of columns in the Board.
+            num_colors(int): The number of colors a Square can take on.
+            colors(ndarray): The initial colors of the squares.
+                (None to initialize all squares to color 0.)
+        """
+
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.dtype = np.uint8 if num_colors <= 2**8 else np.uint16
+
+        if colors is None:
+            self.colors = np.zeros((num_rows, num_cols), dtype=self.dtype)
+        else:
+            self.colors = np.array(colors, dtype=self.dtype, order='C')
+
+    def get(self, row, col):
+        return int(self.colors[row, col])
+
+    def set(self, row, col, color):
+        self.colors[row, col] = color
+
+    def get_many(self, rows, cols):
+        return self.colors[rows, cols]
+
+    def set_many(self, rows, cols, colors):
+        """Sets the colors of several distinct squares at once."""
+
+        self.colors[rows, cols] = colors
+
+    def count_colors(self, num_colors):
+        """Counts the number of squares of each color.
+
+        Arguments:
+            num_colors(int): The number of colors.
+
+        Returns:
+            An array with the number of squares of each color.
+        """
+
+        return np.bincount(self.colors.reshape(-1), minlength=num_colors)
+
+    def to_array(self):
+        """Gets the colors of all squares.
+
+        Returns:
+            The (live) 2D array of colors.
+        """
+
+        return self.colors
+
+    def get_layout(self):
+        """Gets the layout of the colors for code which indexes them directly.
+
+        Returns:
+            A tuple of the layout (ARRAY_LAYOUT), the live flat
+            array of colors, and the number of colors per row.
+        """
+
+        return ARRAY_LAYOUT, self.colors.reshape(-1), self.num_cols
+
+    def snapshot(self, path):
+        """Saves the colors of all squares to a .npy file.
+
+        Arguments:
+            path(str): The path to the .npy file.
+        """
+
+        np.save(path, self.colors)
+
+    @property
+    def nbytes(self):
+        return self.colors.nbytes
+
+
+class BitStorage:
+    """A BitStorage stores the colors of a two-color Board as one bit per Square.
+
+    Each row is packed into bytes with the most significant bit first,
+    as with np.packbits, which is 8 times smaller than one byte per Square.
+    """
+
+    dtype = np.uint8
+
+    def __init__(self, num_rows, num_cols, num_colors=2, colors=None):
+        """Initializes the BitStorage.
+
+        Arguments:
+            num_rows(int): The number of rows in the Board.
+            num_cols(int): The number of columns in the Board.
+            num_colors(int): The number of colors a Square can take on (at most 2).
+            colors(ndarray): The initial colors of the squares.
+                (None to initialize all squares to color 0.)
+        """
+
+        if num_colors > 2:
+            raise Exception('BitStorage can only store 2 colors, not {}'.format(num_colors))
+
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+
+        if colors is None:
+            self.packed = np.zeros((num_rows, (num_cols + 7) // 8), dtype=np.uint8)
+        else:
+            self.packed = np.packbits(np.asarray(colors), axis=1)
+
+    def get(self, row, col):
+        return (int(self.packed[row, col >> 3]) >> (7 - (col & 7))) & 1
+
+    def flip(self, row, col):
+        self.packed[row, col >> 3] ^= 1 << (7 - (col & 7))
+
+    def set(self, row, col, color):
+        if self.get(row, col) != color:
+            self.flip(row, col)
+
+    def get_many(self, rows, cols):
+        return ((self.packed[rows, cols >> 3] >> (7 - (cols & 7))) & 1).astype(np.uint8)
+
+    def set_many(self, rows, cols, colors):
+        """Sets the colors of several distinct squares at once.
+
+        Several of the squares may share a byte, so the bits are
+        cleared and set with unbuffered ufuncs.
+        """
+
+        flat_packed = self.packed.reshape(-1)
+        byte_indices = rows.astype(np.int64) * self.packed.shape[1] + (cols >> 3)
+        masks = (1 << (7 - (cols & 7))).astype(np.uint8)
+
+        np.bitwise_and.at(flat_packed, byte_indices, ~masks)
+        np.bitwise_or.at(flat_packed, byte_indices, masks * np.asarray(colors, dtype=np.uint8))
+
+    def count_colors(self, num_colors):
+        """Counts the number of squares of each color without unpacking.
+
+        The bytes are counted one band of rows at a time, and the set
+        bits are the sum of the popcounts of each byte value weighted
+        by its count, so memory stays bounded for large boards.
+
+        Arguments:
+            num_colors(int): The number of colors.
+
+        Returns:
+            An array with the number of squares of each color.
+        """
+
+        band_rows = max(1, COUNT_BAND_BYTES // max(1, self.packed.shape[1]))
+        byte_counts = np.zeros(256, dtype=np.int64)
+        for start in range(0, self.num_rows, band_rows):
+            byte_counts += np.bincount(self.packed[start:start + band_rows].reshape(-1), minlength=256)
+
+        # Padding bits at the end of each row are always 0
+        num_ones = int(byte_counts @ POPCOUNTS)
+
+        return np.array([self.num_rows * self.num_cols - num_ones, num_ones])
+
+    def to_array(self):
+        """Unpacks the colors of all squares.
+
+        Returns:
+            A new 2D array of colors with one byte per square.
+        """
+
+        return np.unpackbits(self.packed, axis=1, count=self.num_cols)
+
+    def get_layout(self):
+        """Gets the layout of the colors for code which indexes them directly.
+
+        Returns:
+            A tuple of the layout (BITS_LAYOUT), the live flat
+            array of packed bytes, and the number of bytes per row.
+        """
+
+        return BITS_LAYOUT, self.packed.reshape(-1), self.packed.shape[1]
+
+    def snapshot(self, path):
+        """Saves the colors of all squares to a .npy file.
+
+        Arguments:
+            path(str): The path to the .npy file.
+        """
+
+        np.save(path, self.to_array())
+
+    @property
+    def nbytes(self):
+        return self.packed.nbytes
+
+
+class MemmapStorage:
+    """A MemmapStorage stores the colors of a Board in a memory-mapped file.
+
+    The operating system only pages in the parts of the file which
+    Fleas actually touch, so the Board can be larger than memory.
+    The file is laid out in square tiles of TILE_SIZE x TILE_SIZE
+    squares (one 4 KiB page for one byte per square), so the
+    neighborhood of a Flea usually lies on a single page.
+
+    After a flush, the file is always an up-to-date copy of the
+    colors, as a .npy file of shape (tile rows, tile columns,
+    TILE_SIZE, TILE_SIZE).
+    """
+
+    def __init__(self, num_rows, num_cols, num_colors, colors=None, path=None):
+        """Initializes the MemmapStorage.
+
+        Arguments:
+            num_rows(int): The number of rows in the Board.
+            num_cols(int): The number of columns in the Board.
+            num_colors(int): The number of colors a Square can take on.
+            colors(ndarray): The initial colors of the squares.
+                (None to initialize all squares to color 0.)
+            path(str): The path to the .npy file backing the storage, which
+                must not exist yet so that no file (such as the file the
+                initial colors were loaded from) is overwritten.
+                (None to use a temporary file which is deleted
+                 when the storage is garbage collected.)
+        """
+
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.dtype = np.uint8 if num_colors <= 2**8 else np.uint16
+
+        if path is None:
+            self.temporary_file = tempfile.NamedTemporaryFile(suffix='.npy')
+            path = self.temporary_file.name
+        elif os.path.exists(path):
+            raise Exception('Storage path "{}" already exists, so it would be overwritten'.format(path))
+        self.path = path
+
+        # New files are sparse, so untouched tiles take no disk space or memory
+        shape = ((num_rows + TILE_SIZE - 1) // TILE_SIZE,
+                 (num_cols + TILE_SIZE - 1) // TILE_SIZE,
+                 TILE_SIZE,
+                 TILE_SIZE)
+        self.memmap = np.lib.format.open_memmap(self.path, mode='w+', dtype=self.dtype, shape=shape)
+        self.tiles = self.memmap.view(np.ndarray)
+
+        if colors is not None:
+            self.write_colors(colors)
+
+    def write_colors(self, colors):
+        """Writes initial colors into the tiles one band of tile rows at a time.
+
+        Arguments:
+            colors(ndarray): The colors of the squares.
+        """
+
+        num_tile_cols = self.tiles.shape[1]
+        band = np.zeros((TILE_SIZE, num_tile_cols * TILE_SIZE), dtype=self.dtype)
+
+        for tile_row in range(self.tiles.shape[0]):
+            start = tile_row * TILE_SIZE
+            band_colors = np.asarray(colors[start:start + TILE_SIZE])
+
+            band[:] = 0
+            band[:len(band_colors), :self.num_cols] = band_colors
+            self.tiles[tile_row] = band.reshape(TILE_SIZE, num_tile_cols, TILE_SIZE).transpose(1, 0, 2)
+
+    def get(self, row, col):
+        return int(self.tiles[row >> TILE_SHIFT, col >> TILE_SHIFT, row & TILE_MASK, col & TILE_MASK])
+
+    def set(self, row, col, color):
+        self.tiles[row >> TILE_SHIFT, col >> TILE_SHIFT, row & TILE_MASK, col & TILE_MASK] = color
+
+    def get_many(self, rows, cols):
+        return self.tiles[rows >> TILE_SHIFT, cols >> TILE_SHIFT, rows & TILE_MASK, cols & TILE_MASK]
+
+    def set_many(self, rows, cols, colors):
+        """Sets the colors of several distinct squares at once."""
+
+        self.tiles[rows >> TILE_SHIFT, cols >> TILE_SHIFT, rows & TILE_MASK, cols & TILE_MASK] = colors
+
+    def count_colors(self, num_colors):
+        """Counts the number of squares of each color one band of tile rows at a time.
+
+        Arguments:
+            num_colors(int): The number of colors.
+
+        Returns:
+            An array with the number of squares of each color.
+        """
+
+        counts = np.zeros(num_colors, dtype=np.int64)
+        for band in self.tiles:
+            counts += np.bincount(band.reshape(-1), minlength=num_colors)[:num_colors]
+
+        # Padding squares outside the Board are always color 0
+        counts[0] -= self.tiles.size - self.num_rows * self.num_cols
+
+        return counts
+
+    def to_array(self):
+        """Untiles the colors of all squares.
+
+        Returns:
+            A new 2D array of colors.
+        """
+
+        num_tile_rows, num_tile_cols = self.tiles.shape[:2]
+        colors = self.tiles.transpose(0, 2, 1, 3).reshape(num_tile_rows * TILE_SIZE,
+                                                            num_tile_cols * TILE_SIZE)
+
+        return colors[:self.num_rows, :self.num_cols]
+
+    def get_layout(self):
+        """Gets the layout of the colors for code which indexes them directly.
+
+        Returns:
+            A tuple of the layout (TILES_LAYOUT), the live flat
+            array of tiles, and the number of tiles per row of tiles.
+        """
+
+        return TILES_LAYOUT, self.tiles.reshape(-1), self.tiles.shape[1]
+
+    def flush(self):
+        """Writes any changes in memory to the backing file."""
+
+        self.memmap.flush()
+
+    def snapshot(self, path):
+        """Saves the colors of all squares to a .npy file.
+
+        The colors are untiled one band of tile rows at a time into
+        a memory-mapped destination, so memory stays bounded.
+
+        Arguments:
+            path(str): The path to the .npy file.
+        """
+
+        snapshot = np.lib.format.open_memmap(path, mode='w+', dtype=self.dtype, shape=(self.num_rows, self.num_cols))
+
+        for tile_row, band in enumerate(self.tiles):
+            start = tile_row * TILE_SIZE
+            band = band.transpose(1, 0, 2).reshape(TILE_SIZE, -1)
+            snapshot[start:start + TILE_SIZE] = band[:self.num_rows - start, :self.num_cols]
+
+        snapshot.flush()
+
+    @property
+    def nbytes(self):
+        return self.tiles.nbytes
+
+
+STORAGE_CLASSES = {
+    'array': ArrayStorage,
+    'bits': BitStorage,
+    'memmap': MemmapStorage
+}
+
+def unpack_layout(layout, flat, stride, num_rows, num_cols):
+    """Unpacks colors laid out as by get_layout into one color per square.
+
+    Arguments:
+        layout(int): The layout of the array (ARRAY_LAYOUT, BITS_LAYOUT, or TILES_LAYOUT).
+        flat(ndarray): The flat array of colors.
+        stride(int): The number of elements per row (bytes per row for
+            BITS_LAYOUT and tiles per row of tiles for TILES_LAYOUT).
+        num_rows(int): The number of rows in the Board.
+        num_cols(int): The number of columns in the Board.
+
+    Returns:
+        A 2D array of colors (a view of flat for ARRAY_LAYOUT).
+    """
+
+    if layout == ARRAY_LAYOUT:
+        return flat.reshape(num_rows, num_cols)
+
+    if layout == BITS_LAYOUT:
+        return np.unpackbits(flat.reshape(num_rows, stride), axis=1, count=num_cols)
+
+    tiles = flat.reshape(-1, stride, TILE_SIZE, TILE_SIZE)
+    colors = tiles.transpose(0, 2, 1, 3).reshape(tiles.shape[0] * TILE_SIZE, stride * TILE_SIZE)
+
+    return colors[:num_rows, :num_cols]
+
+def make_storage(storage_name, num_rows, num_cols, num_colors, colors=None, path=None):
+    """Makes the storage for the colors of a Board.
+
+    Arguments:
+        storage_name(str): The name of the storage ("array", "bits", or "memmap"),
+            or "auto" to use bits for two-color Boards and arrays otherwise.
+        num_rows(int): The number of rows in the Board.
+        num_cols(int): The number of columns in the Board.
+        num_colors(int): The number of colors a Square can take on.
+        colors(ndarray): The initial colors of the squares.
+            (None to initialize all squares to color 0.)
+        path(str): The path to the file backing a memmap storage.
+            (None to use a temporary file.)
+
+    Returns:
+        The storage.
+    """
+
+    if storage_name == 'auto':
+        storage_name = 'bits' if num_colors <= 2 else 'array'
+
+    if storage_name not in STORAGE_CLASSES:
+        raise Exception(
+            'Storage "{}" not in STORAGE_CLASSES. '.format(storage_name) +
+            'Available storages are {}'.format(list(STORAGE_CLASSES.keys()) + ['auto']))
+
+    if storage_name == 'memmap':
+        return MemmapStorage(num_rows, num_cols, num_colors, colors, path)
+
+    return STORAGE_CLASSES[storage_name](num_rows, num_cols, num_colors, colors)
@@ -0,0 +1,32 @@
+from board import Board
+from breakpoints import Breakpoints
+from flea import make_rule_flea
+
+def make_board():
+    return Board(40, 40, make_rule_flea('RL'), 1, [None], [None], ['up'], None)
+
+def test_cell_hit():
+    board = make_board()
+    breakpoints = Breakpoints(cells=[(19, 21)])
+    breakpoints.attach(board)
+
+    num_steps = board.run(1000, breakpoints)
+
+    assert num_steps < 1000
+    assert breakpoints.hit == 'Flea 0 entered cell (19,21)'
+    assert (board.flea_store.rows[0], board.flea_store.cols[0]) == (19, 21)
+
+    # The next run continues past the hit
+    assert board.run(1, breakpoints) == 1
+
+def test_step_hit_reset():
+    board = make_board()
+    breakpoints = Breakpoints(steps=[10])
+    breakpoints.attach(board)
+
+    board.run(10, breakpoints)
+    assert breakpoints.check_step(10) is not None
+
+    # A break step only holds until the next run
+    assert board.run(10, breakpoints) == 10
+    assert breakpoints.hit is None
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+
+from board import Board
+from cache import ResultCache, hash_board
+from flea import make_rule_flea
+from simulate import get_result_colors, simulate
+
+def test_put_get(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    result = {'colors': np.arange(12).reshape(3, 4), 'step': np.array(5)}
+
+    assert cache.get('missing') is None
+
+    cache.put('key', result)
+    cached = cache.get('key')
+
+    assert cached.keys() == result.keys()
+    assert all(np.array_equal(cached[name], result[name]) for name in result)
+
+def test_evict(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    result = {'colors': np.random.default_rng(0).integers(0, 256, 10000, dtype=np.uint8)}
+
+    cache.put('old', result)
+    cache.put('new', result)
+    os.utime(cache.get_path('old'), (0, 0))
+
+    # Only one result fits, so the least recently used one is deleted
+    cache.max_size = os.path.getsize(cache.get_path('new')) + 100
+    cache.evict()
+
+    assert cache.get('old') is None
+    assert cache.get('new') is not None
+
+def test_hash_board():
+    def make_board(storage):
+        return Board(30, 40, make_rule_flea('RL'), 1, [None], [None], ['up'], None, storage)
+
+    assert hash_board(make_board('bits'), 100) == hash_board(make_board('bits'), 100)
+    assert hash_board(make_board('bits'), 100) != hash_board(make_board('bits'), 101)
+
+    board = make_board('array')
+    key = hash_board(board, 100)
+    board.step()
+    assert hash_board(board, 100) != key
+
+def test_simulate(tmp_path):
+    cache = ResultCache(str(tmp_path))
+
+    for storage in ['array', 'bits', 'memmap']:
+        board = Board(30, 40, make_rule_flea('RL'), 1, [None], [None], ['up'], None, storage)
+        board.run(500)
+
+        for _ in range(2):
+            result = simulate(30, 40, make_rule_flea('RL'), 1, [None], [None], ['up'], None, 500, storage, cache=cache)
+
+            assert int(result['step']) == 500
+            assert np.array_equal(get_result_colors(result), board.get_colors())
+
+    assert len(os.listdir(str(tmp_path))) == 3
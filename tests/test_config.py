@@ -0,0 +1,21 @@
+import pytest
+
+from config import load_rle, load_square_colors, rle_state
+
+def write_rle(tmp_path, body):
+    path = tmp_path / 'board.rle'
+    path.write_text('#C A test pattern\nx = 4, y = 3\n' + body + '\n')
+    return str(path)
+
+def test_load_rle(tmp_path):
+    colors = load_square_colors(write_rle(tmp_path, 'bo2A$3.pA$yO!'))
+
+    assert colors.tolist() == [[0, 1, 1, 1], [0, 0, 0, 25], [255, 0, 0, 0]]
+
+def test_rle_state():
+    assert [rle_state(tag) for tag in ['b', '.', 'o', 'A', 'X', 'pA', 'yO']] == [0, 0, 1, 1, 24, 25, 255]
+
+def test_rle_state_too_large(tmp_path):
+    # States which do not fit in a byte must not wrap around
+    with pytest.raises(Exception, match='yP'):
+        load_rle(write_rle(tmp_path, '2yP!'))
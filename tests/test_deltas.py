@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from board import Board
+from deltas import DELTA_FIELDS, iter_deltas
+from flea import make_rule_flea
+
+def make_board():
+    random.seed(0)
+    return Board(30, 30, make_rule_flea('RLR'), 4, [None], [None], ['up'], None)
+
+def get_reference_deltas(num_steps):
+    board = make_board()
+    store = board.flea_store
+    deltas = []
+
+    for step in range(1, num_steps + 1):
+        rows, cols = store.rows.copy(), store.cols.copy()
+        old_colors = board.storage.get_many(rows, cols).copy()
+        board.step()
+        colors = board.storage.get_many(rows, cols)
+
+        for flea in range(len(store)):
+            deltas.append((step, flea, int(rows[flea]), int(cols[flea]), int(old_colors[flea]), int(colors[flea]),
+                           int(store.rows[flea]), int(store.cols[flea]), int(store.directions[flea]),
+                           int(store.facings[flea])))
+
+    return deltas, board.get_colors()
+
+@pytest.mark.parametrize('batch', [None, 1, 7, 64])
+def test_iter_deltas(batch):
+    expected, colors = get_reference_deltas(200)
+
+    board = make_board()
+    deltas = []
+    for delta in iter_deltas(board, 200, batch):
+        if batch is None:
+            deltas.append(tuple(delta))
+        else:
+            deltas.extend(zip(*[delta[field].tolist() for field in DELTA_FIELDS]))
+
+    assert deltas == expected
+    assert (board.get_colors() == colors).all()
+
+def test_iter_deltas_keeps_history():
+    board = make_board()
+    board.enable_history(10)
+
+    for _ in iter_deltas(board, 20, 8):
+        pass
+
+    assert len(board.history) == 10
+    assert board.undo()
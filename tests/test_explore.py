@@ -0,0 +1,37 @@
+import pytest
+
+from explore import check_board, explore_rule
+
+@pytest.mark.parametrize('rule, steps, size, classification', [
+    ('RL', 10**6, 256, 'highway'),
+    ('LLRR', 10**5, 2048, 'symmetric'),
+    ('RLLR', 10**5, 2048, 'symmetric'),
+    ('RLR', 10**5, 2048, 'chaotic'),
+    ('LRX', 10**4, 64, 'halted')
+])
+def test_classification(rule, steps, size, classification):
+    assert explore_rule(rule, steps, size, 4096)['classification'] == classification
+
+def test_highway():
+    result = explore_rule('RL', 10**6, 256, 4096)
+
+    assert result['period'] == 104
+    assert abs(result['row_shift']) == abs(result['col_shift']) == 2
+
+def test_no_wrapping():
+    # The highway reaches the edge, where it would wrap around onto the pattern
+    result = explore_rule('RRL', 10**6, 512, 4096)
+
+    assert result['classification'] == 'highway'
+    assert result['height'] < 512 and result['width'] < 512
+
+def test_short_run():
+    result = explore_rule('LR', 100, 64, 4096)
+
+    assert result['steps'] == 100
+
+def test_check_board():
+    with pytest.raises(Exception):
+        check_board(3, 4096)
+    with pytest.raises(Exception):
+        check_board(256, 3)
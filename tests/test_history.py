@@ -0,0 +1,55 @@
+import random
+
+from board import Board
+from flea import make_rule_flea
+
+def make_board(num_fleas):
+    random.seed(0)
+    return Board(30, 30, make_rule_flea('RLR'), num_fleas, [None], [None], ['up'], None)
+
+def get_state(board):
+    store, stats = board.flea_store, board.stats
+    return (board.get_colors().tolist(), store.rows.tolist(), store.cols.tolist(), store.directions.tolist(),
+            store.facings.tolist(), list(stats.color_counts), stats.visit_counts.tolist())
+
+def test_undo():
+    for num_fleas in [1, 20]:
+        board = make_board(num_fleas)
+        board.enable_history(100)
+        board.stats.enable_visit_counts()
+        board.run(50)
+
+        states = []
+        for _ in range(10):
+            states.append(get_state(board))
+            board.step()
+
+        # Steps taken by run are recorded too
+        states.append(get_state(board))
+        board.run(10)
+
+        for _ in range(10):
+            assert board.undo()
+        for state in reversed(states):
+            assert get_state(board) == state
+            board.undo()
+
+def test_undo_capacity():
+    board = make_board(1)
+    board.enable_history(5)
+    board.run(20)
+
+    assert sum(board.undo() for _ in range(10)) == 5
+
+def test_undo_visits_counted_later():
+    board = make_board(1)
+    board.enable_history(100)
+    board.run(30)
+
+    board.stats.enable_visit_counts()
+    board.run(30)
+
+    for _ in range(60):
+        board.undo()
+
+    assert board.stats.visit_counts.sum() == 0
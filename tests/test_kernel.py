@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+import pytest
+
+from board import Board
+from flea import get_flea
+
+def make_board(name, num_fleas, storage):
+    random.seed(0)
+    return Board(40, 50, get_flea(name), num_fleas, [None], [None], ['up'], None, storage)
+
+def get_state(board):
+    store, stats = board.flea_store, board.stats
+    return (board.get_colors().tolist(), store.rows.tolist(), store.cols.tolist(), store.directions.tolist(),
+            store.facings.tolist(), list(stats.color_counts), stats.num_visited, stats.bounding_box,
+            stats.visited.to_array().tolist())
+
+@pytest.mark.parametrize('name, num_fleas, storage', [
+    ('langtons', 1, 'bits'),
+    ('langtons', 20, 'array'),
+    ('triangle', 3, 'array'),
+    ('triangle', 1, 'memmap')
+])
+def test_run_matches_step(name, num_fleas, storage):
+    # Board.run uses the compiled kernel when numba is installed, and step is the Python reference
+    stepped = make_board(name, num_fleas, storage)
+    for _ in range(3000):
+        stepped.step()
+
+    run = make_board(name, num_fleas, storage)
+
+    assert run.run(1000) + run.run(2000) == 3000
+    assert get_state(run) == get_state(stepped)
+
+def test_run_counts_visits():
+    stepped = make_board('langtons', 1, 'bits')
+    run = make_board('langtons', 1, 'bits')
+
+    stepped.stats.enable_visit_counts()
+    run.stats.enable_visit_counts()
+
+    for _ in range(1000):
+        stepped.step()
+    run.run(1000)
+
+    assert np.array_equal(run.stats.visit_counts, stepped.stats.visit_counts)
+    assert run.stats.visit_counts.sum() == 1000
@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+
+import recording
+from board import Board
+from flea import make_rule_flea
+from recording import Recorder, Replay
+
+def test_record_replay(tmp_path, monkeypatch):
+    # Write several chunks
+    monkeypatch.setattr(recording, 'RECORDING_CHUNK_FRAMES', 7)
+
+    random.seed(0)
+    board = Board(20, 20, make_rule_flea('RLR'), 5, [None], [None], ['up'], None)
+    board.enable_history(10)
+    board.recorder = Recorder(board, str(tmp_path / 'run.rec'))
+
+    # The colors, fleas, and step after each frame
+    frames = [(board.get_colors().copy(), board.flea_store.rows.copy(), board.flea_store.directions.copy(), 0)]
+    step = 0
+    for index in range(40):
+        if index % 5 == 4:
+            if not board.undo():
+                continue
+            step -= 1
+        elif index % 7 == 6:
+            board.get_square(3, 4).next_color()
+            # Edits cannot be undone
+            board.history.clear()
+        else:
+            board.step()
+            step += 1
+
+        frames.append((board.get_colors().copy(), board.flea_store.rows.copy(), board.flea_store.directions.copy(), step))
+
+    board.recorder.close()
+    replay = Replay(str(tmp_path / 'run.rec'))
+
+    assert len(replay) == len(frames) - 1
+
+    for frame in [len(frames) - 1, 0, 17, 3, 31, 32, 2]:
+        assert replay.seek(frame) == frame
+
+        colors, rows, directions, step = frames[frame]
+        assert np.array_equal(replay.board.get_colors(), colors)
+        assert np.array_equal(replay.board.flea_store.rows, rows)
+        assert np.array_equal(replay.board.flea_store.directions, directions)
+        assert replay.step == step
+        assert replay.board.stats.color_counts == np.bincount(colors.reshape(-1), minlength=3).tolist()
+
+def test_record_run(tmp_path):
+    board = Board(20, 20, make_rule_flea('RL'), 1, [None], [None], ['up'], None)
+    board.recorder = Recorder(board, str(tmp_path / 'run.rec'))
+
+    assert board.run(100) == 100
+
+    board.recorder.close()
+    replay = Replay(str(tmp_path / 'run.rec'))
+    replay.seek(len(replay))
+
+    assert replay.step == 100
+    assert np.array_equal(replay.board.get_colors(), board.get_colors())
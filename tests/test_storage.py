@@ -0,0 +1,28 @@
+import numpy as np
+
+import storage
+from board import Board
+from flea import get_flea
+from storage import BitStorage, MemmapStorage
+
+def test_large_bit_board():
+    board = Board(100000, 100000, get_flea('langtons'), 1, [None], [None], ['up'], None, storage='bits')
+
+    assert isinstance(board.storage, BitStorage)
+    assert board.stats.color_counts == [10**10, 0]
+
+def test_bit_count_colors(monkeypatch):
+    colors = np.random.default_rng(0).integers(0, 2, (37, 53)).astype(np.uint8)
+    expected = np.bincount(colors.reshape(-1), minlength=2)
+
+    # Count in bands of a few rows so that bands are combined
+    monkeypatch.setattr(storage, 'COUNT_BAND_BYTES', 20)
+
+    assert np.array_equal(BitStorage(37, 53, 2, colors).count_colors(2), expected)
+
+def test_count_colors_after_changes():
+    for storage in [BitStorage(10, 20), MemmapStorage(10, 20, 2)]:
+        storage.set(1, 2, 1)
+        storage.set_many(np.array([3, 4]), np.array([5, 6]), np.array([1, 1]))
+
+        assert np.array_equal(storage.count_colors(2), [197, 3])
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+import timeline
+from board import Board
+from flea import make_rule_flea
+from timeline import Timeline, get_keyframe_problem
+
+def make_board(storage='auto'):
+    random.seed(0)
+    return Board(64, 64, make_rule_flea('RRLLLRLLLRRR'), 1, [None], [None], ['up'], None, storage)
+
+def get_state(board):
+    store, stats = board.flea_store, board.stats
+    return (board.get_colors().tolist(), store.rows.tolist(), store.cols.tolist(), store.directions.tolist(),
+            store.facings.tolist(), list(stats.color_counts), stats.num_visited, stats.bounding_box)
+
+def test_seek():
+    board = make_board()
+    board.enable_history(50)
+    keyframes = Timeline(board, 1000)
+
+    step = 0
+    for target in [5500, 2300, 7000, 0, 6999, 3000]:
+        step = keyframes.seek(step, target)
+
+        reference = make_board()
+        reference.run(target)
+
+        assert step == target
+        assert get_state(board) == get_state(reference)
+
+def test_keyframe_problem(monkeypatch):
+    assert get_keyframe_problem(make_board()) is None
+
+    # Keyframes are disabled rather than failing for memory-mapped and large boards
+    assert get_keyframe_problem(make_board('memmap')) is not None
+
+    monkeypatch.setattr(timeline, 'MAX_TIMELINE_BYTES', 1000)
+    assert get_keyframe_problem(make_board()) is not None
+
+    with pytest.raises(Exception):
+        Timeline(make_board(), 1000)
@@ -0,0 +1,235 @@
+import bisect
+
+from storage import MemmapStorage
+
+# Maximum memory used by the keyframes of a Timeline. When it is
+# exceeded, every other keyframe is dropped and the interval doubles.
+MAX_TIMELINE_BYTES = 256 * 2**20
+
+def get_keyframe_problem(board):
+    """Determines whether keyframes of a Board can be kept in memory, without taking one.
+
+    Arguments:
+        board(Board): The Board.
+
+    Returns:
+        A description of why the Board cannot be keyframed (None if it can).
+    """
+
+    if isinstance(board.storage, MemmapStorage):
+        return 'keyframes would copy the memory-mapped colors into memory'
+
+    store, stats = board.flea_store, board.stats
+    arrays = [store.rows, store.cols, store.directions, store.facings, stats.visited.packed]
+    if stats.visit_counts is not None:
+        arrays.append(stats.visit_counts)
+    nbytes = board.storage.nbytes + sum(array.nbytes for array in arrays)
+
+    if nbytes > MAX_TIMELINE_BYTES:
+        return 'keyframes of the {}x{} board take {} bytes each, more than {}'.format(
+            board.num_rows, board.num_cols, nbytes, MAX_TIMELINE_BYTES)
+
+    return None
+
+class Keyframe:
+    """A Keyframe is a copy of the full state of a Board at one step."""
+
+    def __init__(self, board, step):
+        """Copies the state of a Board.
+
+        Arguments:
+            board(Board): The Board.
+            step(int): The step the Board is at.
+        """
+
+        store, stats = board.flea_store, board.stats
+
+        self.step = step
+        self.colors = board.storage.get_layout()[1].copy()
+        self.rows = store.rows.copy()
+        self.cols = store.cols.copy()
+        self.directions = store.directions.copy()
+        self.facings = store.facings.copy()
+        self.color_counts = list(stats.color_counts)
+        self.visited = stats.visited.packed.copy()
+        self.visit_counts = stats.visit_counts.copy() if stats.visit_counts is not None else None
+        self.num_visited = stats.num_visited
+        self.bounding_box = (stats.min_row, stats.min_col, stats.max_row, stats.max_col)
+
+    def restore(self, board):
+        """Copies the state back into a Board.
+
+        Arguments:
+            board(Board): The Board the Keyframe was copied from.
+        """
+
+        store, stats = board.flea_store, board.stats
+
+        board.storage.get_layout()[1][:] = self.colors
+        store.rows[:] = self.rows
+        store.cols[:] = self.cols
+        store.directions[:] = self.directions
+        store.facings[:] = self.facings
+        stats.color_counts = list(self.color_counts)
+        stats.visited.packed[:] = self.visited
+        # Keyframes taken before visits were counted have no counts to restore
+        if stats.visit_counts is not None and self.visit_counts is not None:
+            stats.visit_counts[:] = self.visit_counts
+        stats.num_visited = self.num_visited
+        stats.min_row, stats.min_col, stats.max_row, stats.max_col = self.bounding_box
+
+    @property
+    def nbytes(self):
+        arrays = [self.colors, self.rows, self.cols, self.directions, self.facings, self.visited]
+        if self.visit_counts is not None:
+            arrays.append(self.visit_counts)
+
+        return sum(array.nbytes for array in arrays)
+
+
+class Timeline:
+    """A Timeline lets a simulation seek to any step by replaying from periodic keyframes.
+
+    A Keyframe (a full copy of the Board) is taken every interval
+    steps, and the steps of the keyframes are kept sorted as an index.
+    Seeking to a step restores the nearest keyframe at or before it
+    (or stays put if the Board is already closer) and runs forward
+    with Board.run, so seeking costs at most one interval of steps
+    no matter how long the simulation has run. Steps past the last
+    keyframe are run once and keyframed along the way.
+
+    Simulations are deterministic, so keyframes after the current step
+    stay valid when seeking backward. Editing the Board by hand makes
+    them invalid (see truncate).
+    """
+
+    def __init__(self, board, interval, step=0):
+        """Initializes the Timeline and takes a keyframe of the current state.
+
+        Arguments:
+            board(Board): The Board whose steps are keyframed.
+            interval(int): The number of steps between keyframes (doubled
+                whenever the keyframes exceed MAX_TIMELINE_BYTES).
+            step(int): The step the Board is at.
+        """
+
+        problem = get_keyframe_problem(board)
+        if problem is not None:
+            raise Exception('Cannot keyframe the board: {}'.format(problem))
+
+        self.board = board
+        self.interval = interval
+        self.keyframes = []
+        self.steps = []
+
+        self.capture(step)
+
+    def __len__(self):
+        return len(self.keyframes)
+
+    def next_step(self, step):
+        """Gets the step at which the next keyframe should be taken.
+
+        Arguments:
+            step(int): The current step.
+
+        Returns:
+            The first step after step which is a multiple of the interval.
+        """
+
+        return (step // self.interval + 1) * self.interval
+
+    def capture(self, step):
+        """Takes a keyframe of the current state, replacing any keyframe at the same step.
+
+        Arguments:
+            step(int): The step the Board is at.
+        """
+
+        index = bisect.bisect_left(self.steps, step)
+        keyframe = Keyframe(self.board, step)
+
+        if index < len(self.steps) and self.steps[index] == step:
+            self.keyframes[index] = keyframe
+        else:
+            self.keyframes.insert(index, keyframe)
+            self.steps.insert(index, step)
+
+        if sum(keyframe.nbytes for keyframe in self.keyframes) > MAX_TIMELINE_BYTES:
+            self.thin()
+
+    def record(self, step):
+        """Takes a keyframe if the step is a multiple of the interval past the last keyframe.
+
+        Called after steps are taken.
+
+        Arguments:
+            step(int): The step the Board is at.
+        """
+
+        if step % self.interval == 0 and step > self.steps[-1]:
+            self.capture(step)
+
+    def thin(self):
+        """Doubles the interval and drops the keyframes which are not on it (except the first)."""
+
+        self.interval *= 2
+
+        kept = [index for index, step in enumerate(self.steps) if index == 0 or step % self.interval == 0]
+        self.keyframes = [self.keyframes[index] for index in kept]
+        self.steps = [self.steps[index] for index in kept]
+
+    def truncate(self, step):
+        """Drops the keyframes at and after a step and takes a new keyframe of the current state.
+
+        Called after the Board is edited by hand, which changes the steps after the edit.
+
+        Arguments:
+            step(int): The step the Board is at.
+        """
+
+        index = bisect.bisect_left(self.steps, step)
+        del self.keyframes[index:]
+        del self.steps[index:]
+
+        self.capture(step)
+
+    def seek(self, step, target):
+        """Moves the Board to a target step.
+
+        History is cleared since the steps before the target were not recorded.
+
+        Arguments:
+            step(int): The step the Board is at.
+            target(int): The step to move to (at least the first keyframe's step).
+
+        Returns:
+            The step the Board is at afterwards, which is before the
+            target only if the simulation halted on the way.
+        """
+
+        target = max(target, self.steps[0])
+        index = bisect.bisect_right(self.steps, target) - 1
+
+        if not self.steps[index] <= step <= target:
+            self.keyframes[index].restore(self.board)
+            step = self.steps[index]
+
+        # Run without recording steps or stopping at keyframes in between
+        history, self.board.history = self.board.history, None
+        try:
+            while step < target:
+                batch = min(target, self.next_step(step)) - step
+                num_steps = self.board.run(batch)
+                step += num_steps
+                self.record(step)
+
+                if num_steps < batch:
+                    break
+        finally:
+            self.board.history = history
+
+        if history is not None:
+            history.clear()
+
+        return step
@@ -0,0 +1,87 @@
+import json
+import time
+
+class PhaseTimer:
+    """A PhaseTimer accumulates the wall time and call count of each phase of the main loop.
+
+    Phases are timed as laps: each call to lap attributes the time
+    elapsed since the previous call to the named phase, so timing a
+    phase costs a single clock read.
+    """
+
+    def __init__(self):
+        """Initializes the PhaseTimer."""
+
+        self.times = {}
+        self.counts = {}
+        self.start_time = time.perf_counter()
+        self.last_time = self.start_time
+
+    def lap(self, phase):
+        """Attributes the time since the previous lap to a phase.
+
+        Arguments:
+            phase(str): The name of the phase which just finished.
+        """
+
+        now = time.perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + now - self.last_time
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+        self.last_time = now
+
+    def summary(self):
+        """Formats the accumulated timings as a table.
+
+        Returns:
+            A string with one line per phase containing the total time,
+            the number of calls, the mean time per call, and the
+            percentage of the total time spent in the phase.
+        """
+
+        total = sum(self.times.values()) or 1.0
+        lines = ['{:<22} {:>10} {:>12} {:>12} {:>7}'.format('phase', 'time (s)', 'calls', 'mean (us)', '%')]
+
+        for phase, phase_time in sorted(self.times.items(), key=lambda item: -item[1]):
+            count = self.counts[phase]
+            lines.append('{:<22} {:>10.3f} {:>12} {:>12.2f} {:>6.1f}%'.format(phase,
+                                                                            phase_time,
+                                                                            count,
+                                                                            1e6 * phase_time / count,
+                                                                            100 * phase_time / total))
+
+        return '\n'.join(lines)
+
+    def save(self, path):
+        """Saves the accumulated timings to a JSON file.
+
+        Arguments:
+            path(str): The path to the JSON file.
+        """
+
+        with open(path, 'w') as timing_file:
+            json.dump({
+                'wall_time': time.perf_counter() - self.start_time,
+                'phases': {
+                    phase: {
+                        'time': self.times[phase],
+                        'calls': self.counts[phase]
+                    } for phase in self.times
+                }
+            }, timing_file, indent=4)
+
+
+class NullPhaseTimer:
+    """A NullPhaseTimer has the interface of a PhaseTimer but records nothing.
+
+    Used when timing is disabled so the main loop pays only
+    for an empty method call.
+    """
+
+    def lap(self, phase):
+        pass
+
+    def summary(self):
+        return ''
+
+    def save(self, path):
+        pass